@@ -2,6 +2,7 @@ from .base_filter import (
     BaseFilter,
     AndFilter,
     OrFilter,
+    FieldFilter,
 )
 from .base_model import (
     BaseDataModel,
@@ -29,6 +30,7 @@ __all__ = [
     "BaseFilter",
     "AndFilter",
     "OrFilter",
+    "FieldFilter",
     # abc
     "BaseApi",
     "BaseType",
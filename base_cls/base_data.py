@@ -1,10 +1,28 @@
-from typing import TypeVar
+from dataclasses import fields, is_dataclass
+from functools import cache
+from typing import Any, TypeVar
+
+
+@cache
+def _core_field_names(cls: type) -> tuple[str, ...]:
+    """获取类参与repr/序列化的字段名，按类缓存.
+
+    dataclass 使用字段定义（排除 repr=False 的字段），pydantic 模型使用 model_fields，
+    均不依赖实例的 __dict__，因此支持 slots 数据类。
+    """
+    excludes = set(getattr(cls, "_repr_exclude", ()))
+    if is_dataclass(cls):
+        names = [f.name for f in fields(cls) if f.repr]
+    else:
+        names = list(getattr(cls, "model_fields", ()))
+    return tuple(k for k in names if not k.startswith("_") and k not in excludes)
 
 
 class BaseDataMixin:
     """
     框架内约束的数据类混入类, 用于标记框架内数据
     """
+    __slots__ = ()
     _repr_exclude = {"raw_data"}  # 排除在repr中的属性集合
 
     def __repr__(self):
@@ -15,14 +33,23 @@ class BaseDataMixin:
         return self.__repr__()
 
     def _get_core_properties_str(self) -> str:
-        excludes = set(getattr(self, "_repr_exclude", ()))
-        props = {
-            k: v
-            for k, v in vars(self).items()
-            if not k.startswith("_") and k not in excludes
-        }
-        parts = [f"{k}={repr(v)}" for k, v in props.items()]
+        parts = [f"{k}={repr(getattr(self, k))}" for k in _core_field_names(type(self))]
         return ", ".join(parts)
 
+    def to_dict(self) -> dict[str, Any]:
+        """将核心字段转换为dict，嵌套的数据类递归转换"""
+        return {k: _to_plain(getattr(self, k)) for k in _core_field_names(type(self))}
+
+
+def _to_plain(value: Any) -> Any:
+    """递归转换字段值中的数据类实例"""
+    if isinstance(value, BaseDataMixin):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_plain(v) for k, v in value.items()}
+    return value
+
 
 BaseDataT = TypeVar("BaseDataT", bound=BaseDataMixin)
@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Any, TYPE_CHECKING
-from logging import getLogger
+from typing import Any, Callable, Optional, TYPE_CHECKING
+from logging import getLogger, DEBUG
+import time
 
 if TYPE_CHECKING:
     from event import Event
 
 _log = getLogger(__name__)
 
+# 编译后的过滤谓词
+Predicate = Callable[["Event"], bool]
+
 
 class BaseFilter(ABC):
     """过滤器基类."""
@@ -24,6 +28,20 @@ class BaseFilter(ABC):
         """
         pass
 
+    def compile(self, reorder: bool = False, warmup: int = 1000) -> Predicate:
+        """编译为单个过滤谓词.
+
+        叶子过滤器直接返回 check；组合过滤器见 AndFilter/OrFilter.compile。
+
+        Args:
+            reorder: 是否按实测的开销与通过率重排组合过滤器的子过滤器
+            warmup: 重排前采样的事件数量
+
+        Returns:
+            Predicate: 接收事件、返回是否通过的函数
+        """
+        return self.check
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} filters={self.filters}>"
 
@@ -32,13 +50,128 @@ class BaseFilter(ABC):
 
     def __and__(self, other: "BaseFilter") -> "BaseFilter":
         """使用 & 合并过滤器, 并支持链式调用, 处理顺序为传入顺序."""
+        if type(self) is AndFilter:
+            return AndFilter(*self.filters, other)
         return AndFilter(self, other)
 
     def __or__(self, other: "BaseFilter") -> "BaseFilter":
         """使用 | 合并过滤器, 并支持链式调用, 处理顺序为传入顺序."""
+        if type(self) is OrFilter:
+            return OrFilter(*self.filters, other)
         return OrFilter(self, other)
 
 
+def _flatten(f: BaseFilter, kind: type) -> list[BaseFilter]:
+    """展开同类嵌套的组合过滤器，如 And(And(a, b), c) -> [a, b, c]."""
+    if type(f) is not kind:
+        return [f]
+    result = []
+    for child in f.filters:
+        result.extend(_flatten(child, kind))
+    return result
+
+
+def _chain(predicates: list[Predicate], require_all: bool) -> Predicate:
+    """将子谓词串接为一个短路求值的谓词."""
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        a, b = predicates
+        if require_all:
+            return lambda event: a(event) and b(event)
+        return lambda event: a(event) or b(event)
+    predicates = tuple(predicates)
+    if require_all:
+        def check_all(event: "Event") -> bool:
+            for predicate in predicates:
+                if not predicate(event):
+                    return False
+            return True
+        return check_all
+
+    def check_any(event: "Event") -> bool:
+        for predicate in predicates:
+            if predicate(event):
+                return True
+        return False
+    return check_any
+
+
+class AdaptiveChain:
+    """按实测开销与通过率重排子谓词的组合谓词.
+
+    前 warmup 个事件对每个子谓词都求值，记录平均耗时与通过率，
+    之后按期望开销排序并切换为短路求值：
+    与组合按 耗时 / 拦截率 升序（便宜且拦截多的先执行），
+    或组合按 耗时 / 通过率 升序（便宜且通过多的先执行）。
+    采样期间的返回值与异常与按声明顺序短路求值一致；
+    结果已确定后才采样的子谓词若抛出异常（依赖前面子过滤器的保护），
+    说明顺序不可交换，保持声明顺序不重排。
+    子过滤器应无副作用，否则重排会改变行为。
+    """
+
+    def __init__(self, predicates: list[Predicate], require_all: bool, warmup: int = 1000):
+        self.predicates = list(predicates)
+        self.require_all = require_all
+        self.warmup = warmup
+        self._seen = 0
+        self._cost = [0.0] * len(predicates)
+        self._passed = [0] * len(predicates)
+        self._compiled: Predicate | None = None
+        self._pinned = False  # 采样中出现依赖声明顺序的异常
+
+    def __call__(self, event: "Event") -> bool:
+        if self._compiled is not None:
+            return self._compiled(event)
+        # 按声明顺序短路求值得到的结果，None 表示尚未确定
+        decided = None
+        for i, predicate in enumerate(self.predicates):
+            start = time.perf_counter()
+            try:
+                result = predicate(event)
+            except Exception:
+                if decided is None:
+                    # 按声明顺序求值同样会执行到这里
+                    raise
+                self._pinned = True
+                continue
+            finally:
+                self._cost[i] += time.perf_counter() - start
+            if result:
+                self._passed[i] += 1
+            if decided is None and bool(result) != self.require_all:
+                decided = bool(result)
+        self._seen += 1
+        if self._seen >= self.warmup:
+            self._reorder()
+        return self.require_all if decided is None else decided
+
+    def _reorder(self) -> None:
+        """按期望开销排序并编译为短路谓词."""
+        def rank(i: int) -> float:
+            cost = self._cost[i] / self._seen
+            rate = self._passed[i] / self._seen
+            useful = (1 - rate) if self.require_all else rate
+            return cost / useful if useful > 0 else float("inf")
+
+        if self._pinned:
+            order = list(range(len(self.predicates)))
+        else:
+            order = sorted(range(len(self.predicates)), key=rank)
+        self.predicates = [self.predicates[i] for i in order]
+        self._compiled = _chain(self.predicates, self.require_all)
+        if _log.isEnabledFor(DEBUG):
+            _log.debug(f"过滤器按实测开销与通过率重排为 {order}")
+
+    def get_stats(self) -> list[dict[str, float]]:
+        """获取各子谓词的平均耗时（微秒）与通过率（按当前顺序之前的采样顺序）."""
+        seen = max(self._seen, 1)
+        return [
+            {"cost_us": cost / seen * 1e6, "pass_rate": passed / seen}
+            for cost, passed in zip(self._cost, self._passed)
+        ]
+
+
 class AndFilter(BaseFilter):
     """与过滤器."""
     def __init__(self, *filters: BaseFilter):
@@ -48,11 +181,20 @@ class AndFilter(BaseFilter):
         """检查事件是否通过所有过滤器."""
         for f in self.filters:
             if not f.check(event):
-                _log.debug(f"事件{event.id}被过滤器参数 {f.filters} 拦截, 不再继续检查")
+                if _log.isEnabledFor(DEBUG):
+                    _log.debug(f"事件{event.id}被过滤器参数 {f.filters} 拦截, 不再继续检查")
                 return False
-        _log.debug(f"事件{event.id}通过所有{self}与过滤器")
+        if _log.isEnabledFor(DEBUG):
+            _log.debug(f"事件{event.id}通过所有{self}与过滤器")
         return True
 
+    def compile(self, reorder: bool = False, warmup: int = 1000) -> Predicate:
+        """展开嵌套的与过滤器并编译为单个短路谓词（不输出逐项调试日志）."""
+        predicates = [f.compile(reorder, warmup) for f in _flatten(self, AndFilter)]
+        if reorder and len(predicates) > 1:
+            return AdaptiveChain(predicates, True, warmup)
+        return _chain(predicates, True)
+
 
 class OrFilter(BaseFilter):
     """或过滤器."""
@@ -63,7 +205,76 @@ class OrFilter(BaseFilter):
         """检查事件是否通过任一过滤器."""
         for f in self.filters:
             if f.check(event):
-                _log.debug(f"事件{event.id}通过过滤器参数 {f.filters}, 不再继续检查")
+                if _log.isEnabledFor(DEBUG):
+                    _log.debug(f"事件{event.id}通过过滤器参数 {f.filters}, 不再继续检查")
                 return True
-        _log.debug(f"事件{event.id}未通过{self}或过滤器")
+        if _log.isEnabledFor(DEBUG):
+            _log.debug(f"事件{event.id}未通过{self}或过滤器")
         return False
+
+    def compile(self, reorder: bool = False, warmup: int = 1000) -> Predicate:
+        """展开嵌套的或过滤器并编译为单个短路谓词（不输出逐项调试日志）."""
+        predicates = [f.compile(reorder, warmup) for f in _flatten(self, OrFilter)]
+        if reorder and len(predicates) > 1:
+            return AdaptiveChain(predicates, False, warmup)
+        return _chain(predicates, False)
+
+
+class FieldFilter(BaseFilter):
+    """字段相等过滤器.
+
+    事件数据的字段值属于给定值集合时通过。作为订阅者的 event_filter
+    （或其与组合中的一项）时，事件总线将其登记到 字段 -> 值 -> 订阅者 的倒排索引，
+    发布时只需一次字典查找即可路由，如按 group_id / room_display_id / uid 分发。
+    """
+
+    def __init__(self, field: str, values: Any):
+        """初始化字段过滤器.
+
+        Args:
+            field: 事件数据的字段名
+            values: 期望值或期望值的集合（值须可哈希）
+        """
+        self.field = field
+        if isinstance(values, (list, tuple, set, frozenset)):
+            self.values = frozenset(values)
+        else:
+            self.values = frozenset((values,))
+
+    @property
+    def filters(self) -> dict[str, frozenset]:
+        return {self.field: self.values}
+
+    def check(self, event: "Event") -> bool:
+        """检查事件数据的字段值是否属于期望值集合."""
+        try:
+            return getattr(event.data, self.field, None) in self.values
+        except TypeError:
+            # 字段值不可哈希
+            return False
+
+
+def split_index(f: Optional[BaseFilter]) -> tuple[Optional[FieldFilter], Optional[BaseFilter]]:
+    """拆分出可建立索引的字段过滤器.
+
+    过滤器本身是 FieldFilter，或是包含 FieldFilter 的与过滤器时，
+    取出第一个 FieldFilter 作为索引项，其余部分作为剩余过滤器。
+
+    Args:
+        f: 过滤器
+
+    Returns:
+        (索引字段过滤器, 剩余过滤器)，无可索引项时为 (None, f)
+    """
+    if isinstance(f, FieldFilter):
+        return f, None
+    if type(f) is not AndFilter:
+        return None, f
+    children = _flatten(f, AndFilter)
+    for i, child in enumerate(children):
+        if isinstance(child, FieldFilter):
+            rest = children[:i] + children[i + 1:]
+            if not rest:
+                return child, None
+            return child, rest[0] if len(rest) == 1 else AndFilter(*rest)
+    return None, f
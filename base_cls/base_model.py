@@ -1,4 +1,4 @@
-from typing import ClassVar, Self, Generic, TypeVar, Type
+from typing import Any, Callable, ClassVar, Optional, Self, Generic, TypeVar, Type
 from pydantic import BaseModel, ConfigDict, RootModel, model_validator
 from pydantic._internal._model_construction import ModelMetaclass
 from .base_data import BaseDataMixin
@@ -9,7 +9,11 @@ class MetaDataModel(ModelMetaclass):
     1. 根类定义 discriminator_field，子类定义 discriminator_value，自动注册到 registry
     2. 支持属性嵌套
     3. 完全自动注册和分发
+    4. 分发表在首次分发时编译，注册新的子类后自动失效重建
     """
+    # 注册表版本号，任何子类注册都会使已编译的分发表失效
+    _generation: int = 0
+
     def __new__(mcls, name, bases, namespace, **kwargs):
         cls = super().__new__(mcls, name, bases, namespace, **kwargs)
 
@@ -30,6 +34,7 @@ class MetaDataModel(ModelMetaclass):
                     base_with_registry._registry[value] = cls
             else:
                 base_with_registry._registry[discriminator_value] = cls
+            MetaDataModel._generation += 1
 
         # 如果当前类定义了 discriminator_field，初始化自己的 registry（用于二级分发）
         if discriminator_field is not None:
@@ -57,6 +62,36 @@ class BaseDataModel(BaseModel, BaseDataMixin, metaclass=MetaDataModel):
     # 作为分发依据的"值"，子类可选定义，若定义则认为是可直接构造模型，否则则认为是属性嵌套的分发模型
 
     _registry: ClassVar[dict] = {}
+    # 编译后的分发表：(注册表版本号, {分发值元组: (下一级分发字段, 叶子类校验函数)})
+    _dispatch_cache: ClassVar[Optional[tuple[int, dict]]] = None
+
+    @classmethod
+    def _compile_dispatch(cls) -> dict[tuple, tuple[Optional[str], Optional[Callable[[Any], Any]]]]:
+        """将多层 registry 展开为扁平分发表
+
+        键为自根类起各级 discriminator 值组成的元组；
+        中间层条目给出下一级的 discriminator_field，叶子条目给出叶子类的校验函数。
+
+        Returns:
+            扁平分发表
+        """
+        table: dict[tuple, tuple[Optional[str], Optional[Callable[[Any], Any]]]] = {}
+
+        def walk(owner: type, prefix: tuple) -> None:
+            field = owner.discriminator_field
+            for value, subclass in owner._registry.items():
+                key = prefix + (value,)
+                sub_field = getattr(subclass, 'discriminator_field', None)
+                if sub_field is not None and sub_field != field and subclass._registry:
+                    # 子类有自己的 discriminator_field，继续展开
+                    table[key] = (sub_field, None)
+                    walk(subclass, key)
+                else:
+                    # 叶子类：缓存其 pydantic 校验器
+                    table[key] = (None, subclass.__pydantic_validator__.validate_python)
+
+        walk(cls, ())
+        return table
 
     @classmethod
     def from_raw(cls, raw: dict) -> Self:
@@ -85,22 +120,25 @@ class BaseDataModel(BaseModel, BaseDataMixin, metaclass=MetaDataModel):
             # 没有 discriminator_field，直接构造
             return cls.model_validate(raw)
 
-        value = raw.get(field)
-        if value is None:
-            raise ValueError(f"Missing discriminator field: {field}")
-
-        subclass = cls._registry.get(value)
-        if subclass is None:
-            raise ValueError(f"Unknown type value: {value}")
-
-        # 递归检查子类是否还有自己的 discriminator_field（多层分发）
-        sub_field = getattr(subclass, 'discriminator_field', None)
-        if sub_field is not None and sub_field != field and hasattr(subclass, '_registry') and subclass._registry:
-            # 子类有自己的 discriminator_field，继续递归分发
-            return subclass.from_dict(raw)
-        else:
-            # 子类没有 discriminator_field，直接构造
-            return subclass.model_validate(raw)
+        cache = cls.__dict__.get('_dispatch_cache')
+        if cache is None or cache[0] != MetaDataModel._generation:
+            cache = (MetaDataModel._generation, cls._compile_dispatch())
+            cls._dispatch_cache = cache
+        table = cache[1]
+
+        # 逐级读取 discriminator 值，在扁平分发表中查找
+        key = ()
+        while True:
+            value = raw.get(field)
+            if value is None:
+                raise ValueError(f"Missing discriminator field: {field}")
+            key += (value,)
+            entry = table.get(key)
+            if entry is None:
+                raise ValueError(f"Unknown type value: {value}")
+            field, validate = entry
+            if field is None:
+                return validate(raw)
 
     @classmethod
     def from_type(cls, data: dict, type_value: str, raw: bool = True) -> Self:
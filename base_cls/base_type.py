@@ -1,20 +1,38 @@
 from enum import Enum
+from functools import cached_property
 from typing import TypeVar
 
 
 class BaseType(str, Enum):
     """标签枚举基类，提供通用的匹配方法."""
 
-    @property
+    @cached_property
     def scope(self) -> str:
         """返回标签的作用域."""
         return self.value.split(".", 1)[0]
 
-    @property
+    @cached_property
     def state(self) -> str:
         """返回标签的状态."""
         return self.value.split(".", 1)[1]
 
+    @property
+    def is_wildcard(self) -> bool:
+        """是否为通配符标签."""
+        return self.state == "all"
+
+    @cached_property
+    def mask(self) -> int:
+        """返回标签在作用域内的位掩码.
+
+        按枚举成员的定义顺序为每个状态分配一位，通配符为作用域内全部状态。
+        同一作用域的多个状态可按位或合并，匹配时只需一次按位与。
+        """
+        members = list(type(self))
+        if self.is_wildcard:
+            return (1 << len(members)) - 1
+        return 1 << members.index(self)
+
     def matches(self, rule: "BaseType") -> bool:
         """判断状态是否匹配.
 
@@ -2,6 +2,7 @@ from bilibili_api import Credential
 from bilibili_api.user import User
 from bilibili_api.live import LiveRoom, LiveDanmaku
 from bilibili_api.dynamic import get_dynamic_page_info
+from bilibili_api.utils.network import Api
 
 from bilibili.data import DynamicData, LiveRoomData, get_max_id
 from bilibili.data.dto import DynamicDTO, LiveRoomDTO
@@ -15,6 +16,14 @@ if TYPE_CHECKING:
 
 _log = getLogger("BilibiliApi")
 
+# 批量获取直播间基础信息（含直播状态），room_ids 可重复传入多个
+LIVE_STATUS_API = {
+    "url": "https://api.live.bilibili.com/xlive/web-room/v1/index/getRoomBaseInfo",
+    "method": "GET",
+    "verify": False,
+    "comment": "批量获取直播间基础信息",
+}
+
 
 class BilibiliApi(BaseApi):
 
@@ -111,6 +120,33 @@ class BilibiliApi(BaseApi):
         info = LiveRoomData.from_dto(dto)
         return info
 
+    async def get_live_status(self, room_ids: list[int], batch_size: int = 50) -> dict[int, int]:
+        """
+        批量获取直播间的直播状态
+        Args:
+            room_ids (list[int]): 直播间ID列表（短号或真实房间号均可）
+            batch_size (int): 单次请求包含的房间数量上限
+        Returns:
+            dict[int, int]: 直播间ID -> live_status (0未开播 1直播中 2轮播中)，查询不到的房间不会出现在结果中
+        """
+        wanted = set(room_ids)
+        status: dict[int, int] = {}
+        for i in range(0, len(room_ids), batch_size):
+            batch = room_ids[i:i + batch_size]
+            data = await Api(**LIVE_STATUS_API, credential = self._credential).update_params(
+                req_biz = "web_room_componet",
+                room_ids = batch,
+            ).result
+            for info in (data.get("by_room_ids") or {}).values():
+                live_status = int(info.get("live_status", 0))
+                # 返回结果以真实房间号为键，按请求时使用的房间号回填
+                short_id = info.get("short_id")
+                if short_id in wanted:
+                    status[short_id] = live_status
+                if info.get("room_id") in wanted:
+                    status[info["room_id"]] = live_status
+        return status
+
     def get_live_danmaku(self, room_id: int) -> LiveDanmaku:
         """
         获取直播间弹幕对象
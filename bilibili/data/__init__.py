@@ -27,6 +27,13 @@ from .danmaku_gift_data import (
 from .danmaku_guard_data import (
     DanmakuGuardData,
 )
+from .danmaku_stats_data import (
+    DanmakuStatsData,
+)
+from .danmaku_intern import (
+    DanmakuInterner,
+    InternScope,
+)
 from .video_part import (
     VideoPartData,
 )
@@ -52,4 +59,7 @@ __all__ = [
     "GiftMedalData",
     "BlindGiftData",
     "DanmakuGuardData",
+    "DanmakuStatsData",
+    "DanmakuInterner",
+    "InternScope",
 ]
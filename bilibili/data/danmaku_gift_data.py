@@ -1,11 +1,15 @@
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
 from base_cls import BaseDataMixin
 from .dto import DanmakuGiftDTO, GiftMedalInfoDto, BlindGiftInfoDto
+from .raw_check import all_type
 
+if TYPE_CHECKING:
+    from .danmaku_intern import DanmakuInterner
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GiftMedalData(BaseDataMixin):
     """
     送礼用户粉丝牌数据
@@ -32,7 +36,7 @@ class GiftMedalData(BaseDataMixin):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlindGiftData(BaseDataMixin):
     """
     盲盒礼物数据（从盲盒中开出的礼物信息）
@@ -57,7 +61,7 @@ class BlindGiftData(BaseDataMixin):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DanmakuGiftData(BaseDataMixin):
     """
     礼物消息数据
@@ -87,6 +91,7 @@ class DanmakuGiftData(BaseDataMixin):
     combo_total_coin: int  # 连击总价值
     gift_gif: str  # 礼物动图URL
     gift_img: str  # 礼物图片URL
+    batch_combo_id: str = ""  # 批量/连击ID，同一次连击的消息相同
 
     @classmethod
     def from_dto(cls, dto: DanmakuGiftDTO) -> "DanmakuGiftData":
@@ -126,5 +131,158 @@ class DanmakuGiftData(BaseDataMixin):
             is_first=dto.is_first,
             combo_total_coin=dto.combo_total_coin,
             gift_gif=dto.gift_info.gif,
-            gift_img=dto.gift_info.img_basic
+            gift_img=dto.gift_info.img_basic,
+            batch_combo_id=dto.batch_combo_id
+        )
+
+    @classmethod
+    def from_raw(cls, data: dict, interner: "Optional[DanmakuInterner]" = None) -> Optional["DanmakuGiftData"]:
+        """从原始礼物数据直接构造DanmakuGiftData实例（快速路径）
+
+        一次读取礼物数据并对字段做精确类型检查，不经过 DTO 与 pydantic 校验；
+        数据结构或类型不符合预期时回退到 DanmakuGiftDTO 路径，结果与其一致.
+
+        Args:
+            data: SEND_GIFT 原始数据
+            interner: 驻留器，提供时复用相同的粉丝牌、用户名、头像URL与礼物名等
+
+        Returns:
+            DanmakuGiftData实例，解析失败返回None
+        """
+        try:
+            gift_data = data["data"]["data"]
+            gift_info = gift_data.get("gift_info", {})
+            if not gift_info:
+                return cls._from_raw_dto(data)
+            gift_gif = gift_info.get("gif", "")
+            gift_img = gift_info.get("img_basic", "")
+            gift_webp = gift_info.get("webp", "")
+
+            receiver_uinfo = gift_data.get("receiver_uinfo", {})
+            receiver_base = receiver_uinfo.get("base", {})
+            receiver_uid = receiver_uinfo.get("uid", 0)
+            receiver_uname = receiver_base.get("name", "")
+            receiver_face = receiver_base.get("face", "")
+            receiver_official_title = receiver_base.get("official_info", {}).get("title", "")
+
+            medal = None
+            medal_info = gift_data.get("medal_info", {})
+            if medal_info:
+                medal_ints = (
+                    medal_info.get("medal_level", 0),
+                    medal_info.get("anchor_roomid", 0),
+                    medal_info.get("guard_level", 0),
+                    medal_info.get("is_lighted", 0),
+                    medal_info.get("target_id", 0),
+                )
+                medal_name = medal_info.get("medal_name", "")
+                anchor_uname = medal_info.get("anchor_uname", "")
+                if not (all_type(int, *medal_ints) and all_type(str, medal_name, anchor_uname)):
+                    return cls._from_raw_dto(data)
+                if interner is not None:
+                    medal = interner.gift_medal(
+                        medal_ints[0], medal_name, medal_ints[1], anchor_uname,
+                        medal_ints[2], medal_ints[3], medal_ints[4]
+                    )
+                else:
+                    medal = GiftMedalData(
+                        level=medal_ints[0],
+                        name=medal_name,
+                        anchor_room_id=medal_ints[1],
+                        anchor_uname=anchor_uname,
+                        guard_level=medal_ints[2],
+                        is_lighted=medal_ints[3],
+                        anchor_uid=medal_ints[4]
+                    )
+
+            blind_gift = None
+            blind_gift_data = gift_data.get("blind_gift")
+            if blind_gift_data:
+                blind_ints = (
+                    blind_gift_data.get("blind_gift_config_id", 0),
+                    blind_gift_data.get("original_gift_id", 0),
+                    blind_gift_data.get("original_gift_price", 0),
+                    blind_gift_data.get("gift_tip_price", 0),
+                )
+                original_gift_name = blind_gift_data.get("original_gift_name", "")
+                gift_action = blind_gift_data.get("gift_action", "")
+                if not (all_type(int, *blind_ints) and all_type(str, original_gift_name, gift_action)):
+                    return cls._from_raw_dto(data)
+                blind_gift = BlindGiftData(
+                    blind_gift_config_id=blind_ints[0],
+                    original_gift_id=blind_ints[1],
+                    original_gift_name=original_gift_name,
+                    original_gift_price=blind_ints[2],
+                    gift_action=gift_action,
+                    gift_tip_price=blind_ints[3]
+                )
+
+            room_display_id = data.get("room_display_id", 0)
+            room_real_id = data.get("room_real_id", 0)
+            gift_id = gift_data.get("giftId", 0)
+            gift_name = gift_data.get("giftName", "")
+            gift_num = gift_data.get("num", 1)
+            price = gift_data.get("price", 0)
+            total_coin = gift_data.get("total_coin", 0)
+            coin_type = gift_data.get("coin_type", "gold")
+            action = gift_data.get("action", "")
+            uid = gift_data.get("uid", 0)
+            uname = gift_data.get("uname", "")
+            face = gift_data.get("face", "")
+            guard_level = gift_data.get("guard_level", 0)
+            wealth_level = gift_data.get("wealth_level", 0)
+            timestamp = gift_data.get("timestamp", 0)
+            is_first = gift_data.get("is_first", False)
+            combo_total_coin = gift_data.get("combo_total_coin", 0)
+            batch_combo_id = gift_data.get("batch_combo_id", "")
+        except (KeyError, TypeError, AttributeError):
+            return cls._from_raw_dto(data)
+
+        if not (all_type(int, room_display_id, room_real_id, gift_id, gift_num, price, total_coin,
+                         uid, guard_level, wealth_level, receiver_uid, timestamp, combo_total_coin)
+                and all_type(str, gift_name, coin_type, action, uname, face, receiver_uname,
+                             receiver_face, receiver_official_title, gift_gif, gift_img, gift_webp,
+                             batch_combo_id)
+                and type(is_first) is bool):
+            return cls._from_raw_dto(data)
+
+        if interner is not None:
+            string = interner.string
+            gift_name, uname, face = string(gift_name), string(uname), string(face)
+            receiver_uname, receiver_face = string(receiver_uname), string(receiver_face)
+            gift_gif, gift_img = string(gift_gif), string(gift_img)
+
+        return cls(
+            room_display_id=room_display_id,
+            room_real_id=room_real_id,
+            gift_id=gift_id,
+            gift_name=gift_name,
+            gift_num=gift_num,
+            price=price,
+            total_coin=total_coin,
+            coin_type=coin_type,
+            action=action,
+            uid=uid,
+            uname=uname,
+            face=face,
+            guard_level=guard_level,
+            wealth_level=wealth_level,
+            receiver_uid=receiver_uid,
+            receiver_uname=receiver_uname,
+            receiver_face=receiver_face,
+            receiver_official_title=receiver_official_title,
+            medal=medal,
+            blind_gift=blind_gift,
+            timestamp=timestamp,
+            is_first=is_first,
+            combo_total_coin=combo_total_coin,
+            gift_gif=gift_gif,
+            gift_img=gift_img,
+            batch_combo_id=batch_combo_id
         )
+
+    @classmethod
+    def _from_raw_dto(cls, data: dict) -> Optional["DanmakuGiftData"]:
+        """经由DanmakuGiftDTO解析原始数据（快速路径的回退）"""
+        dto = DanmakuGiftDTO.from_raw(data)
+        return cls.from_dto(dto) if dto is not None else None
@@ -1,7 +1,12 @@
+from typing import Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
 from base_cls import BaseDataMixin
 from .dto import DanmakuGuardDTO
+from .raw_check import all_type
+
+if TYPE_CHECKING:
+    from .danmaku_intern import DanmakuInterner
 
 # 舰长等级名称映射
 GUARD_LEVEL_NAME = {
@@ -11,7 +16,7 @@ GUARD_LEVEL_NAME = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DanmakuGuardData(BaseDataMixin):
     """
     上舰事件数据
@@ -50,3 +55,58 @@ class DanmakuGuardData(BaseDataMixin):
             gift_id=dto.gift_id,
             gift_name=dto.gift_name,
         )
+
+    @classmethod
+    def from_raw(cls, data: dict, interner: "Optional[DanmakuInterner]" = None) -> Optional["DanmakuGuardData"]:
+        """从原始上舰数据直接构造DanmakuGuardData实例（快速路径）
+
+        字段类型完全符合时不经过 DTO 与 pydantic 校验，
+        否则回退到 DanmakuGuardDTO 路径，结果与其一致.
+
+        Args:
+            data: GUARD_BUY 原始数据
+            interner: 驻留器，提供时复用相同的用户名与礼物名
+
+        Returns:
+            DanmakuGuardData实例，解析失败返回None
+        """
+        try:
+            guard_data = data["data"]["data"]
+            room_display_id = data.get("room_display_id", 0)
+            room_real_id = data.get("room_real_id", 0)
+            uid = guard_data.get("uid", 0)
+            username = guard_data.get("username", "")
+            guard_level = guard_data.get("guard_level", 3)
+            num = guard_data.get("num", 1)
+            price = guard_data.get("price", 0)
+            gift_id = guard_data.get("gift_id", 0)
+            gift_name = guard_data.get("gift_name", "")
+        except (KeyError, TypeError, AttributeError):
+            return cls._from_raw_dto(data)
+
+        if not (all_type(int, room_display_id, room_real_id, uid, guard_level, num, price, gift_id)
+                and all_type(str, username, gift_name)):
+            return cls._from_raw_dto(data)
+
+        if interner is not None:
+            username = interner.string(username)
+            gift_name = interner.string(gift_name)
+
+        return cls(
+            room_display_id=room_display_id,
+            room_real_id=room_real_id,
+            uid=uid,
+            username=username,
+            guard_level=guard_level,
+            guard_name=GUARD_LEVEL_NAME.get(guard_level, "未知类型"),
+            num=num,
+            price=price,
+            gift_id=gift_id,
+            gift_name=gift_name,
+        )
+
+    @classmethod
+    def _from_raw_dto(cls, data: dict) -> Optional["DanmakuGuardData"]:
+        """经由DanmakuGuardDTO解析原始数据（快速路径的回退）"""
+        dto = DanmakuGuardDTO.from_raw(data)
+        return cls.from_dto(dto) if dto is not None else None
@@ -0,0 +1,91 @@
+from enum import Enum
+from typing import Any
+
+from utils import InternPool
+from .danmaku_msg_data import MedalData
+from .danmaku_gift_data import GiftMedalData
+
+
+class InternScope(str, Enum):
+    """驻留池作用域."""
+    ROOM = "room"  # 每个房间独立的驻留池
+    SHARED = "shared"  # 所有房间共享一个驻留池
+
+
+class DanmakuInterner:
+    """弹幕数据驻留器.
+
+    热门房间中同一批用户与粉丝牌会反复出现，驻留器以有界 LRU 池
+    复用相同的 MedalData/GiftMedalData 实例以及用户名、头像URL、礼物名等字符串。
+    """
+
+    def __init__(self, maxsize: int = 4096, string_maxsize: int = 16384):
+        """初始化驻留器.
+
+        Args:
+            maxsize: 粉丝牌驻留池的容量
+            string_maxsize: 字符串驻留池的容量
+        """
+        self.medals: InternPool[MedalData] = InternPool(maxsize)
+        self.gift_medals: InternPool[GiftMedalData] = InternPool(maxsize)
+        self.strings: InternPool[str] = InternPool(string_maxsize)
+
+    def string(self, value: str) -> str:
+        """驻留字符串."""
+        return self.strings.intern(value)
+
+    def medal(
+        self,
+        level: int,
+        name: str,
+        anchor_name: str,
+        room_id: int,
+        is_light: int,
+        anchor_uid: int
+    ) -> MedalData:
+        """获取字段相同的已驻留 MedalData，未命中时新建并驻留."""
+        key = (level, name, anchor_name, room_id, is_light, anchor_uid)
+        medal = self.medals.get(key)
+        if medal is None:
+            medal = self.medals.put(key, MedalData(
+                level=level,
+                name=self.string(name),
+                anchor_name=self.string(anchor_name),
+                room_id=room_id,
+                is_light=is_light,
+                anchor_uid=anchor_uid
+            ))
+        return medal
+
+    def gift_medal(
+        self,
+        level: int,
+        name: str,
+        anchor_room_id: int,
+        anchor_uname: str,
+        guard_level: int,
+        is_lighted: int,
+        anchor_uid: int
+    ) -> GiftMedalData:
+        """获取字段相同的已驻留 GiftMedalData，未命中时新建并驻留."""
+        key = (level, name, anchor_room_id, anchor_uname, guard_level, is_lighted, anchor_uid)
+        medal = self.gift_medals.get(key)
+        if medal is None:
+            medal = self.gift_medals.put(key, GiftMedalData(
+                level=level,
+                name=self.string(name),
+                anchor_room_id=anchor_room_id,
+                anchor_uname=self.string(anchor_uname),
+                guard_level=guard_level,
+                is_lighted=is_lighted,
+                anchor_uid=anchor_uid
+            ))
+        return medal
+
+    def get_metrics(self) -> dict[str, Any]:
+        """获取各驻留池的容量与命中率."""
+        return {
+            "medals": self.medals.get_metrics(),
+            "gift_medals": self.gift_medals.get_metrics(),
+            "strings": self.strings.get_metrics(),
+        }
@@ -1,11 +1,15 @@
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
 from base_cls import BaseDataMixin
 from .dto import DanmakuMsgDTO, MedalInfoDto
+from .raw_check import all_type
 
+if TYPE_CHECKING:
+    from .danmaku_intern import DanmakuInterner
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MedalData(BaseDataMixin):
     """
     粉丝牌数据
@@ -30,7 +34,7 @@ class MedalData(BaseDataMixin):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DanmakuMsgData(BaseDataMixin):
     """
     弹幕消息数据
@@ -67,3 +71,89 @@ class DanmakuMsgData(BaseDataMixin):
             medal=medal_data,
             timestamp=dto.timestamp
         )
+
+    @classmethod
+    def from_raw(cls, data: dict, interner: "Optional[DanmakuInterner]" = None) -> Optional["DanmakuMsgData"]:
+        """从原始弹幕数据直接构造DanmakuMsgData实例（快速路径）
+
+        一次读取 info 数组并对字段做精确类型检查，不经过 DTO 与 pydantic 校验；
+        数据结构或类型不符合预期时回退到 DanmakuMsgDTO 路径，结果与其一致.
+
+        Args:
+            data: DANMU_MSG 原始数据
+            interner: 驻留器，提供时复用相同的粉丝牌、用户名与头像URL
+
+        Returns:
+            DanmakuMsgData实例，解析失败返回None
+        """
+        try:
+            info = data["data"]["info"]
+            message = info[1]
+            uid, username = info[2][0], info[2][1]
+            user_level = info[4][0]
+            extra = info[9]
+            timestamp = extra.get("ts", 0) if isinstance(extra, dict) else 0
+
+            face = None
+            info_detail = info[0]
+            if isinstance(info_detail, list) and len(info_detail) > 15:
+                user_detail_obj = info_detail[15]
+                if isinstance(user_detail_obj, dict):
+                    user_detail = user_detail_obj.get("user", {})
+                    if user_detail:
+                        face = user_detail.get("base", {}).get("face")
+
+            medal = None
+            medal_data = info[3]
+            if medal_data:
+                if len(medal_data) <= 12:
+                    return cls._from_raw_dto(data)
+                level, name, anchor_name, room_id = medal_data[0:4]
+                is_light, anchor_uid = medal_data[11], medal_data[12]
+                if not (all_type(int, level, room_id, is_light, anchor_uid)
+                        and all_type(str, name, anchor_name)):
+                    return cls._from_raw_dto(data)
+                if interner is not None:
+                    medal = interner.medal(level, name, anchor_name, room_id, is_light, anchor_uid)
+                else:
+                    medal = MedalData(
+                        level=level,
+                        name=name,
+                        anchor_name=anchor_name,
+                        room_id=room_id,
+                        is_light=is_light,
+                        anchor_uid=anchor_uid
+                    )
+
+            room_display_id = data.get("room_display_id", 0)
+            room_real_id = data.get("room_real_id", 0)
+        except (KeyError, IndexError, TypeError, AttributeError, ValueError):
+            return cls._from_raw_dto(data)
+
+        if not (all_type(int, room_display_id, room_real_id, uid, user_level, timestamp)
+                and all_type(str, message, username)
+                and (face is None or type(face) is str)):
+            return cls._from_raw_dto(data)
+
+        if interner is not None:
+            username = interner.string(username)
+            if face is not None:
+                face = interner.string(face)
+
+        return cls(
+            room_display_id=room_display_id,
+            room_real_id=room_real_id,
+            message=message,
+            uid=uid,
+            username=username,
+            user_level=user_level,
+            face=face,
+            medal=medal,
+            timestamp=timestamp
+        )
+
+    @classmethod
+    def _from_raw_dto(cls, data: dict) -> Optional["DanmakuMsgData"]:
+        """经由DanmakuMsgDTO解析原始数据（快速路径的回退）"""
+        dto = DanmakuMsgDTO.from_raw(data)
+        return cls.from_dto(dto) if dto is not None else None
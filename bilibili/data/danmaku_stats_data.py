@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from base_cls import BaseDataMixin
+
+
+@dataclass(frozen=True, slots=True)
+class DanmakuStatsData(BaseDataMixin):
+    """
+    弹幕窗口统计数据
+    """
+    room_display_id: int  # 房间号
+    window_start: float  # 窗口开始时间戳
+    window_end: float  # 窗口结束时间戳
+    danmaku_count: int  # 弹幕数量
+    danmaku_rate: float  # 弹幕速率（条/秒）
+    gift_count: int  # 礼物消息数量
+    gift_value: int  # 付费礼物总价值（电池）
+    guard_count: int  # 上舰数量
+    guard_value: int  # 上舰总价值（电池）
+    unique_uids: int  # 发言/送礼/上舰的去重用户数（HyperLogLog 估计值）
+    top_words: tuple[tuple[str, int], ...]  # 高频弹幕及其次数（Count-Min Sketch 估计值）
+    shed_count: int = 0  # 过载卸载的弹幕与礼物数量（已计入 danmaku_count/gift_count，未计入去重用户数与高频弹幕）
@@ -83,6 +83,7 @@ class DanmakuGiftDTO(BaseDataModel):
     timestamp: int = 0  # 发送时间戳
     is_first: bool = False  # 是否首次送礼 (单次送礼, 无连击)
     combo_total_coin: int = 0  # 连击总价值
+    batch_combo_id: str = ""  # 批量/连击ID，同一次连击的消息相同
 
     @classmethod
     def from_raw(cls, data: dict) -> "Optional[DanmakuGiftDTO]":
@@ -170,7 +171,8 @@ class DanmakuGiftDTO(BaseDataModel):
                 "blind_gift": blind_gift,
                 "timestamp": gift_data.get("timestamp", 0),
                 "is_first": gift_data.get("is_first", False),
-                "combo_total_coin": gift_data.get("combo_total_coin", 0)
+                "combo_total_coin": gift_data.get("combo_total_coin", 0),
+                "batch_combo_id": gift_data.get("batch_combo_id", "")
             }
 
             return cls.model_validate(normalized_data)
@@ -64,7 +64,7 @@ def get_max_id(date: dict) -> Optional[int]:
     return max_id
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthorData(BaseDataMixin):
     """
     作者信息数据
@@ -88,7 +88,7 @@ class AuthorData(BaseDataMixin):
         return f"https://space.bilibili.com/{self.uid}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatData(BaseDataMixin):
     """
     动态统计信息数据
@@ -107,7 +107,7 @@ class StatData(BaseDataMixin):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoData(BaseDataMixin):
     """
     视频信息数据
@@ -143,7 +143,7 @@ class VideoData(BaseDataMixin):
         return f"https://www.bilibili.com/video/{self.bv_id}/"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MusicData(BaseDataMixin):
     """
     音乐信息数据
@@ -171,7 +171,7 @@ class MusicData(BaseDataMixin):
         return f"https://www.bilibili.com/audio/au{self.music_id}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArticleData(BaseDataMixin):
     """
     专栏信息数据
@@ -197,7 +197,7 @@ class ArticleData(BaseDataMixin):
         return f"https://www.bilibili.com/opus/{self.article_id}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LiveRcmdData(BaseDataMixin):
     """
     直播推荐信息数据
@@ -243,7 +243,7 @@ class LiveRcmdData(BaseDataMixin):
         return f"https://live.bilibili.com/{self.room_id}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DynamicData(BaseDataMixin):
     """
     动态数据
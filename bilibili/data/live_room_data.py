@@ -11,7 +11,7 @@ from .dto import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoomInfoData(BaseDataMixin):
     """直播间信息数据"""
     uid: int  # 用户uid
@@ -57,7 +57,7 @@ class RoomInfoData(BaseDataMixin):
         return f"https://live.bilibili.com/{self.room_id}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnchorInfoData(BaseDataMixin):
     """主播信息数据"""
     name: str  # 主播昵称
@@ -86,7 +86,7 @@ class AnchorInfoData(BaseDataMixin):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WatchedShowData(BaseDataMixin):
     """观看榜信息数据"""
     switch: bool  # 观看榜开关
@@ -105,7 +105,7 @@ class WatchedShowData(BaseDataMixin):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NoticeBoardData(BaseDataMixin):
     """公告栏信息数据"""
     content: str  # 公告内容
@@ -120,7 +120,7 @@ class NoticeBoardData(BaseDataMixin):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LiveRoomData(BaseDataMixin):
     """直播间数据"""
     room_info: RoomInfoData  # 直播间信息
@@ -0,0 +1,13 @@
+from typing import Any
+
+
+def all_type(tp: type, *values: Any) -> bool:
+    """检查所有值的类型是否恰好为 tp（不接受子类，如 bool 之于 int）
+
+    供弹幕快速解析路径使用：只有类型完全符合时才跳过 pydantic 校验，
+    否则回退到 DTO 路径，由 pydantic 负责类型转换与报错.
+    """
+    for value in values:
+        if type(value) is not tp:
+            return False
+    return True
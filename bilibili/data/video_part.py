@@ -6,7 +6,7 @@ from .dto import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoPartData(BaseDataMixin):
     """
     视频字幕数据
@@ -7,9 +7,23 @@ from .bili_dynamic_source import (
 from .bili_danmaku_source import (
     BiliDanmakuSource,
 )
+from .danmaku_aggregator import (
+    DanmakuAggregator,
+)
+from .gift_coalescer import (
+    GiftCoalescer,
+)
+from .load_shedder import (
+    LoadShedder,
+    DanmakuPriority,
+)
 
 __all__ = [
     "BiliLiveSource",
     "BiliDynamicSource",
     "BiliDanmakuSource",
+    "DanmakuAggregator",
+    "GiftCoalescer",
+    "LoadShedder",
+    "DanmakuPriority",
 ]
@@ -1,21 +1,24 @@
 import asyncio
+from collections import deque
 from logging import getLogger, DEBUG, INFO
 import threading
-from typing import TYPE_CHECKING
+import time
+from typing import Any, Optional, TYPE_CHECKING, Union
 
-from base_cls import BaseSource
+from base_cls import BaseSource, BaseType
 from event import Event
+from utils import LoopThread
 from bilibili import BilibiliApi, DanmakuType
 from bilibili.data import (
     DanmakuMsgData,
     DanmakuGiftData,
-    DanmakuGuardData
-)
-from bilibili.data.dto import (
-    DanmakuMsgDTO,
-    DanmakuGiftDTO,
-    DanmakuGuardDTO
+    DanmakuGuardData,
+    DanmakuInterner,
+    InternScope,
 )
+from .danmaku_aggregator import DanmakuAggregator
+from .gift_coalescer import GiftCoalescer
+from .load_shedder import LoadShedder, DanmakuPriority, PRIORITY_RANK, classify
 
 if TYPE_CHECKING:
     from bilibili_api.live import LiveDanmaku
@@ -25,63 +28,182 @@ _log = getLogger("BiliDanmakuSource")
 
 class BiliDanmakuSource(BaseSource):
 
-    def __init__(self, room_id: list[int], debug: bool = False, config_key: str = "bilibili"):
+    # 弹幕命令 -> (对应的事件状态, 处理函数名)，只为有订阅者的状态注册处理函数
+    CMD_HANDLERS: dict[str, tuple[DanmakuType, str]] = {
+        "LIVE": (DanmakuType.OPEN, "on_live"),
+        "DANMU_MSG": (DanmakuType.DANMAKU, "on_danmaku"),
+        "SEND_GIFT": (DanmakuType.GIFT, "on_gift"),
+        "GUARD_BUY": (DanmakuType.GUARD, "on_guard"),
+    }
+
+    def __init__(
+        self,
+        room_id: list[int],
+        debug: bool = False,
+        config_key: str = "bilibili",
+        loop_threads: Optional[int] = None,
+        intern_scope: Optional[InternScope] = None,
+        intern_size: int = 4096,
+        stats_window: Optional[Union[float, int]] = None,
+        stats_slide: Optional[Union[float, int]] = None,
+        stats_top_k: int = 10,
+        gift_hold: Optional[Union[float, int]] = None,
+        shed_lag: Optional[Union[float, int]] = None,
+        shed_depth: int = 2000,
+        shed_sample: float = 0.1
+    ):
         """初始化B站弹幕源
         Args:
             room_id: 房间号列表
             debug: 是否开启调试
             config_key: 配置键，默认"bilibili"
+            loop_threads: 弹幕连接的运行方式
+                None: 每个房间独占一个线程和事件循环（默认）
+                0: 所有房间以 task 方式运行在主事件循环中
+                N: 固定 N 个事件循环线程，房间按 room_id % N 分片
+            intern_scope: 粉丝牌与常见字符串的驻留方式
+                None: 不驻留（默认）
+                InternScope.ROOM: 每个房间独立的驻留池
+                InternScope.SHARED: 所有房间共享一个驻留池
+            intern_size: 粉丝牌驻留池容量（字符串驻留池为其4倍）
+            stats_window: 窗口统计的窗口长度（秒），None 表示不统计；
+                开启后按窗口发布 DanmakuType.STATS 事件，订阅者可只订阅统计、只订阅原始事件或两者都订阅
+            stats_slide: 窗口统计的滑动步长（秒），None 表示滚动窗口
+            stats_top_k: 每个窗口统计的高频弹幕数量
+            gift_hold: 礼物连击合并窗口（秒），None 表示不合并；
+                开启后同一房间、用户、礼物与连击ID的礼物消息合并为一个 GIFT 事件
+            shed_lag: 过载卸载的发布延迟阈值（秒），None 表示不卸载；
+                过载时优先发布上舰与付费礼物，并对普通弹幕、免费礼物采样或丢弃；
+                被卸载的消息仍计入窗口统计的弹幕数/礼物数（见 DanmakuStatsData.shed_count）
+            shed_depth: 过载卸载的队列深度阈值
+            shed_sample: 过载采样时保留的比例
         """
         super().__init__()
+        if loop_threads is not None and loop_threads < 0:
+            raise ValueError("loop_threads 不可小于0")
         self.config_key: str = config_key
         self.room_id: list[int] = room_id
         self.danmaku_list: dict[int, "LiveDanmaku"] = {}
         self.debug = debug
-        self._loops: dict[int, asyncio.AbstractEventLoop] = {}
-        self._threads: dict[int, threading.Thread] = {}
+        self.loop_threads: Optional[int] = loop_threads
+        self._pool: list[LoopThread] = []  # 固定线程池（loop_threads > 0 时使用）
+        self._workers: dict[int, LoopThread] = {}  # 房间 -> 运行其连接的线程（主循环模式下为空）
+        self._connections: dict[int, asyncio.Task] = {}  # 房间 -> 运行在其事件循环中的连接任务
+        self._closing: set[asyncio.Task] = set()  # 主循环内尚未完成的断开任务，stop 时等待
+        self._room_cmds: dict[int, set[str]] = {}  # 房间 -> 已注册处理函数的弹幕命令
+        self.intern_scope: Optional[InternScope] = intern_scope
+        self.intern_size: int = intern_size
+        self._interners: dict[int, DanmakuInterner] = {}  # 房间 -> 驻留器（ROOM 作用域）
+        self._shared_interner: Optional[DanmakuInterner] = (
+            DanmakuInterner(intern_size, intern_size * 4)
+            if intern_scope == InternScope.SHARED else None
+        )
+        self._aggregator: Optional[DanmakuAggregator] = (
+            DanmakuAggregator(stats_window, stats_slide, stats_top_k)
+            if stats_window is not None else None
+        )
+        self._stats_task: asyncio.Task | None = None
+        self._coalescer: Optional[GiftCoalescer] = GiftCoalescer(gift_hold) if gift_hold is not None else None
+        self._merged_gifts: list[Event] = []  # 已合并、等待发布的礼物事件
+        self._gift_timer: asyncio.TimerHandle | None = None
+        self._shedder: Optional[LoadShedder] = (
+            LoadShedder(shed_lag, shed_depth, shed_sample) if shed_lag is not None else None
+        )
         self._main_loop: asyncio.AbstractEventLoop | None = None  # 主事件循环引用
+        # 房间线程 -> 主循环的事件交接队列：(入队时间, 事件)
+        self._pending: deque[tuple[float, Event]] = deque()
+        self._pending_lock = threading.Lock()
+        # 过载卸载、等待计入窗口统计的消息数：(房间, 事件状态) -> 数量，与交接队列共用锁
+        self._shed_counts: dict[tuple[int, DanmakuType], int] = {}
+        self._drain_task: asyncio.Task | None = None
 
-    def _run_room_thread(self, room_id: int, danmaku: "LiveDanmaku", ready: threading.Event) -> None:
-        """线程入口：为该房间创建独立事件循环，以 task 方式运行弹幕连接，loop.run_forever() 驱动。"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    def _get_worker(self, room_id: int) -> Optional[LoopThread]:
+        """按运行方式为房间分配事件循环线程，主循环模式返回 None."""
+        if self.loop_threads is None:
+            worker = LoopThread(f"LiveDanmaku({room_id})")
+            worker.start()
+            return worker
+        if self.loop_threads == 0:
+            return None
+        if not self._pool:
+            for i in range(self.loop_threads):
+                worker = LoopThread(f"LiveDanmakuPool-{i}")
+                worker.start()
+                self._pool.append(worker)
+        return self._pool[room_id % self.loop_threads]
 
-        self._loops[room_id] = loop
+    def _in_loop(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """当前线程是否正在运行指定的事件循环."""
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
 
-        async def _connect():
-            @danmaku.on("VERIFICATION_SUCCESSFUL")
-            async def _on_connected(_):
-                ready.set()
-                if danmaku.get_status() == 2:
-                    _log.info(f"房间 {room_id} 的弹幕姬已连接")
-            try:
-                asyncio.get_event_loop().create_task(danmaku.connect())
-                _log.debug("等待房间 %d 的弹幕姬连接成功...", room_id)
-            except Exception as e:
-                _log.error(f"房间 {room_id} 弹幕姬异常退出: {e}")
-            finally:
-                ready.set()  # 防止异常时 ready 永远不被 set
-        loop.create_task(_connect())
-        loop.run_forever()
+    async def _connect_room(self, room_id: int, danmaku: "LiveDanmaku") -> None:
+        """在房间所属的事件循环中运行弹幕连接，直到断开."""
+        _log.debug("等待房间 %d 的弹幕姬连接成功...", room_id)
+        try:
+            await danmaku.connect()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _log.error(f"房间 {room_id} 弹幕姬异常退出: {e}")
+
+    async def _disconnect_room(self, room_id: int, danmaku: "LiveDanmaku") -> None:
+        """在房间所属的事件循环中断开弹幕连接."""
+        try:
+            await danmaku.disconnect()
+        except Exception as e:
+            _log.error(f"停止房间 {room_id} 时出错: {e}")
+
+    async def _close_room(self, room_id: int, danmaku: "LiveDanmaku", connection: asyncio.Task) -> bool:
+        """在房间所属的事件循环中断开连接，并等待连接任务真正结束.
+
+        Returns:
+            bool: 连接任务已结束返回 True，超时返回 False
+        """
+        try:
+            await asyncio.wait_for(self._disconnect_room(room_id, danmaku), 10)
+        except asyncio.TimeoutError:
+            _log.error(f"断开房间 {room_id} 超时")
+        # disconnect 未能结束连接时直接取消连接任务
+        connection.cancel()
+        done, _ = await asyncio.wait({connection}, timeout=15)
+        if not done:
+            _log.warning(f"房间 {room_id} 的连接未能在超时内结束")
+        return bool(done)
+
+    @staticmethod
+    async def _create_task(coro) -> asyncio.Task:
+        """在当前事件循环中创建任务（经 run_coroutine_threadsafe 在目标循环中调用）."""
+        return asyncio.create_task(coro)
+
+    async def _on_connected(self, msg: dict) -> None:
+        """弹幕姬认证成功."""
+        _log.info(f"房间 {msg.get('room_display_id')} 的弹幕姬已连接")
 
     def _start_room_thread(self, room_id: int, danmaku: "LiveDanmaku") -> None:
-        """为已有的 danmaku 对象启动独立线程并等待连接建立."""
-        if room_id in self._threads and self._threads[room_id].is_alive():
+        """在分配到的事件循环中启动已有的 danmaku 连接."""
+        connection = self._connections.get(room_id)
+        if connection is not None and not connection.done():
             _log.warning(f"房间 {room_id} 的弹幕姬已在运行中")
             return
         name = f"LiveDanmaku({room_id})"
         danmaku.logger = getLogger(name)
         danmaku.logger.setLevel(DEBUG if self.debug else INFO)
-        ready = threading.Event()
-        t = threading.Thread(
-            target=self._run_room_thread,
-            args=(room_id, danmaku, ready),
-            name=name,
-            daemon=True,
-        )
-        self._threads[room_id] = t
-        _log.debug(f"正在为房间 {room_id} 启动弹幕姬线程...")
-        t.start()
+        worker = self._get_worker(room_id)
+        if worker is not None:
+            self._workers[room_id] = worker
+            loop = worker.loop
+        else:
+            loop = self._main_loop
+        _log.debug(f"正在为房间 {room_id} 启动弹幕姬...")
+        coro = self._connect_room(room_id, danmaku)
+        if self._in_loop(loop):
+            self._connections[room_id] = loop.create_task(coro)
+        else:
+            # 在目标循环中创建任务，停止时可直接在该循环中等待任务本身
+            self._connections[room_id] = asyncio.run_coroutine_threadsafe(self._create_task(coro), loop).result()
 
     def start_room(self, room_id: int) -> None:
         """启动已有的房间监控（stop_room 后可重新启动）."""
@@ -92,48 +214,100 @@ class BiliDanmakuSource(BaseSource):
         self._start_room_thread(room_id, danmaku)
 
     def add_new_room(self, room_id: int) -> None:
-        """新建房间监控并在独立线程中启动."""
+        """新建房间监控并按运行方式启动连接."""
         if room_id in self.danmaku_list:
             _log.warning(f"房间 {room_id} 已存在，如需重启请调用 start_room")
             return
         danmaku = self.api.get_live_danmaku(room_id)
-        danmaku.add_event_listener("LIVE", self.on_live)
-        danmaku.add_event_listener("DANMU_MSG", self.on_danmaku)
-        danmaku.add_event_listener("SEND_GIFT", self.on_gift)
-        danmaku.add_event_listener("GUARD_BUY", self.on_guard)
+        danmaku.add_event_listener("VERIFICATION_SUCCESSFUL", self._on_connected)
         self.danmaku_list[room_id] = danmaku
-        _log.debug(f"新建了房间 {room_id} 的弹幕姬对象，正在启动线程...")
+        self._room_cmds[room_id] = set()
+        if self.intern_scope == InternScope.ROOM:
+            self._interners[room_id] = DanmakuInterner(self.intern_size, self.intern_size * 4)
+        self._sync_listeners(room_id)
+        _log.debug(f"新建了房间 {room_id} 的弹幕姬对象，正在启动连接...")
         self._start_room_thread(room_id, danmaku)
 
-    def stop_room(self, room_id: int) -> None:
-        """断开房间连接并等待线程真正退出（保留 danmaku 对象，可通过 start_room 重启）."""
+    def _detach_room(self, room_id: int) -> Optional[tuple["LiveDanmaku", asyncio.Task, Optional[LoopThread]]]:
+        """取出房间的连接任务与所属线程，房间未在运行时返回 None."""
         danmaku = self.danmaku_list.get(room_id)
-        loop = self._loops.get(room_id)
-        if danmaku is None or loop is None:
+        connection = self._connections.pop(room_id, None)
+        if danmaku is None or connection is None:
             _log.warning(f"未找到房间 {room_id} 的弹幕姬或其事件循环")
+            return None
+        return danmaku, connection, self._workers.pop(room_id, None)
+
+    def stop_room(self, room_id: int) -> None:
+        """断开房间连接并阻塞等待连接真正结束（保留 danmaku 对象，可通过 start_room 重启）.
+
+        独占线程模式下同时结束该房间的线程；
+        在连接所在的事件循环内调用时无法阻塞等待，断开以 task 方式完成，此时应改用 stop_room_async。
+        """
+        detached = self._detach_room(room_id)
+        if detached is None:
             return
-        # 先在房间线程的事件循环中调用 disconnect，等待其完成
-        future = asyncio.run_coroutine_threadsafe(danmaku.disconnect(), loop)
+        danmaku, connection, worker = detached
+        loop = connection.get_loop()
+
+        if self._in_loop(loop):
+            # 无法在自身事件循环中阻塞等待，主循环内的断开任务由 stop 统一等待
+            task = loop.create_task(self._close_room(room_id, danmaku, connection))
+            if loop is self._main_loop:
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+            _log.info(f"房间 {room_id} 的弹幕姬正在暂停")
+            return
+
+        # 在连接所属的事件循环中断开并等待连接任务本身结束
         try:
-            future.result(timeout=10)
+            closed = asyncio.run_coroutine_threadsafe(self._close_room(room_id, danmaku, connection), loop).result()
         except Exception as e:
             _log.error(f"停止房间 {room_id} 时出错: {e}")
-        # disconnect 完成后，通知 loop.run_forever() 退出，线程自然结束
-        loop.call_soon_threadsafe(loop.stop)
-        # 等待线程真正退出，确保连接已完全断开
-        t = self._threads.get(room_id)
-        if t and t.is_alive():
-            t.join(timeout=15)
-            if t.is_alive():
-                _log.warning(f"房间 {room_id} 的线程未能在超时内退出，连接可能未完全断开")
-            else:
-                _log.info(f"房间 {room_id} 的弹幕姬已暂停")
-        self._threads.pop(room_id, None)
+            closed = False
+        if self.loop_threads is None and worker is not None:
+            # 独占线程：通知 loop.run_forever() 退出，等待线程真正结束
+            closed = worker.stop(timeout=15) and closed
+        self._log_stopped(room_id, closed)
+
+    async def stop_room_async(self, room_id: int) -> None:
+        """stop_room 的协程版本：等待连接真正结束，可在任意事件循环中调用."""
+        detached = self._detach_room(room_id)
+        if detached is None:
+            return
+        danmaku, connection, worker = detached
+        loop = connection.get_loop()
+        if self._in_loop(loop):
+            closed = await self._close_room(room_id, danmaku, connection)
+        else:
+            try:
+                closed = await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(self._close_room(room_id, danmaku, connection), loop)
+                )
+            except Exception as e:
+                _log.error(f"停止房间 {room_id} 时出错: {e}")
+                closed = False
+        if self.loop_threads is None and worker is not None:
+            closed = await asyncio.to_thread(worker.stop, 15) and closed
+        self._log_stopped(room_id, closed)
+
+    def _log_stopped(self, room_id: int, closed: bool) -> None:
+        """记录房间停止结果."""
+        if closed:
+            _log.info(f"房间 {room_id} 的弹幕姬已暂停")
+        else:
+            _log.warning(f"房间 {room_id} 未能在超时内停止，连接可能未完全断开")
 
     def remove_room(self, room_id: int) -> None:
         """停止并彻底移除房间监控（同时清理 danmaku 对象）."""
-        self.stop_room(room_id)  # 断开连接并等待线程退出
+        self.stop_room(room_id)  # 断开连接并等待连接结束
         self.danmaku_list.pop(room_id, None)
+        self._room_cmds.pop(room_id, None)
+        self._interners.pop(room_id, None)
+        if self._aggregator is not None:
+            with self._pending_lock:
+                for key in [key for key in self._shed_counts if key[0] == room_id]:
+                    del self._shed_counts[key]
+            self._aggregator.remove_room(room_id)
         _log.info(f"房间 {room_id} 的弹幕姬已移除")
 
     async def start(self) -> None:
@@ -145,6 +319,9 @@ class BiliDanmakuSource(BaseSource):
             return
         self._main_loop = asyncio.get_running_loop()  # 保存主事件循环
         self.running = True
+        self.ctx.bus.watch_subscribers(self.uuid, self._on_subscriber_added)
+        if self._aggregator is not None:
+            self._stats_task = asyncio.create_task(self._stats_loop())
         for rid in self.room_id:
             self.add_new_room(rid)
         _log.info("B站弹幕姬已启动")
@@ -155,18 +332,203 @@ class BiliDanmakuSource(BaseSource):
             _log.warning("B站弹幕姬未在运行")
             return
         self.running = False
-        for rid in list(self._threads.keys()):
+        self.ctx.bus.unwatch_subscribers(self.uuid, self._on_subscriber_added)
+        # 先断开各房间，之后不再有新事件进入交接队列
+        for rid in list(self._connections.keys()):
             self.remove_room(rid)
+        # 主循环模式下断开以 task 方式完成，等待连接全部结束
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        for worker in self._pool:
+            worker.stop(timeout=15)
+        self._pool.clear()
+        # 发布交接队列中的剩余事件（其中的礼物会进入合并器）
+        try:
+            if self._drain_task is not None and not self._drain_task.done():
+                await self._drain_task
+            await self._drain_pending()
+        except Exception as e:
+            _log.error(f"发布剩余事件时出错: {e}", exc_info=True)
+        if self._coalescer is not None:
+            if self._gift_timer is not None:
+                self._gift_timer.cancel()
+                self._gift_timer = None
+            remaining = [Event(data=data, status=DanmakuType.GIFT) for data in self._coalescer.drain()]
+            if remaining:
+                await self.ctx.bus.publish_many(self.uuid, remaining)
+        # 房间线程停止前投递的唤醒可能又启动了批量发布任务，此时交接队列已为空
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+            try:
+                await self._stats_task
+            except asyncio.CancelledError:
+                pass
+            self._stats_task = None
+
+    def _wanted_cmds(self) -> set[str]:
+        """有订阅者的弹幕命令集合."""
+        bus = self.ctx.bus
+        wanted = {
+            cmd for cmd, (status, _) in self.CMD_HANDLERS.items()
+            if bus.has_subscribers(self.uuid, status)
+        }
+        if self._aggregator is not None and bus.has_subscribers(self.uuid, DanmakuType.STATS):
+            # 窗口统计需要弹幕、礼物与上舰数据，即使无人订阅原始事件
+            wanted.update(("DANMU_MSG", "SEND_GIFT", "GUARD_BUY"))
+        return wanted
+
+    def _sync_listeners(self, room_id: int) -> None:
+        """为房间补充注册有订阅者的弹幕命令处理函数，无人订阅的命令不做任何解析."""
+        danmaku = self.danmaku_list.get(room_id)
+        registered = self._room_cmds.get(room_id)
+        if danmaku is None or registered is None:
+            return
+        for cmd in self._wanted_cmds() - registered:
+            danmaku.add_event_listener(cmd, getattr(self, self.CMD_HANDLERS[cmd][1]))
+            registered.add(cmd)
+            _log.debug(f"房间 {room_id} 已注册 {cmd} 处理函数")
+
+    def _on_subscriber_added(self, status: BaseType) -> None:
+        """EventBus 新增订阅者时，在各房间所属的事件循环中补充注册处理函数."""
+        for room_id in list(self.danmaku_list.keys()):
+            worker = self._workers.get(room_id)
+            if worker is not None:
+                worker.loop.call_soon_threadsafe(self._sync_listeners, room_id)
+            else:
+                self._sync_listeners(room_id)
 
     def _publish_to_main(self, event: Event) -> None:
-        """将事件发布调度到主事件循环（线程安全）."""
+        """将事件交给主事件循环发布（线程安全）.
+
+        事件先追加到共享队列，仅在队列由空变为非空时唤醒一次主循环，
+        主循环随后批量取出并通过 EventBus.publish_many 发布。
+        """
         if self._main_loop is None:
             _log.error("主事件循环未初始化，无法发布事件")
             raise RuntimeError("主事件循环未初始化")
-        asyncio.run_coroutine_threadsafe(
-            self.ctx.bus.publish(self.uuid, event),
-            self._main_loop
-        )
+        with self._pending_lock:
+            self._pending.append((time.monotonic(), event))
+            wakeup = len(self._pending) == 1
+        if wakeup:
+            self._main_loop.call_soon_threadsafe(self._schedule_drain)
+
+    def _schedule_drain(self) -> None:
+        """在主事件循环中启动批量发布任务（已有任务在运行时由其继续处理）."""
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain_pending())
+
+    async def _drain_pending(self) -> None:
+        """批量取出交接队列中的事件并发布，直到队列为空.
+
+        开启过载卸载时，以本批最早事件的排队时间与队列深度更新卸载等级，
+        过载期间本批事件按优先级排序后发布。
+        """
+        while True:
+            with self._pending_lock:
+                stamped = list(self._pending)
+                self._pending.clear()
+                shed, self._shed_counts = self._shed_counts, {}
+            merged, self._merged_gifts = self._merged_gifts, []
+            for (room_id, status), count in shed.items():
+                self._aggregator.add_shed(room_id, status, count)
+            if not stamped and not merged:
+                if self._shedder is not None:
+                    # 交接队列已清空，按回调等待队列的深度重新评估
+                    self._shedder.update(0.0, self.ctx.bus.executor.queue_depth)
+                return
+            batch = [event for _, event in stamped]
+            if self._shedder is not None and stamped:
+                lag = time.monotonic() - stamped[0][0]
+                depth = len(stamped) + self.ctx.bus.executor.queue_depth
+                if self._shedder.update(lag, depth) > 0:
+                    batch.sort(key=lambda e: PRIORITY_RANK[classify(e.status, e.data)])
+            if self._aggregator is not None:
+                for event in batch:
+                    self._aggregator.add(event.data)
+            if self._coalescer is not None:
+                batch = [event for event in batch if not self._coalesce(event)]
+            await self.ctx.bus.publish_many(self.uuid, merged + batch)
+
+    def _count_shed(self, room_id: int, status: DanmakuType) -> None:
+        """记录一条被过载卸载的消息，由批量发布任务计入窗口统计（可在房间线程中调用）.
+
+        卸载发生在发布之前，不计数时窗口统计在过载期间只反映采样后的流量。
+        """
+        if self._aggregator is None:
+            return
+        key = (room_id, status)
+        with self._pending_lock:
+            self._shed_counts[key] = self._shed_counts.get(key, 0) + 1
+
+    def _coalesce(self, event: Event) -> bool:
+        """将礼物事件交给合并器.
+
+        Returns:
+            bool: 事件已被合并器接管（稍后以合并事件发布）时返回 True
+        """
+        if event.status != DanmakuType.GIFT:
+            return False
+        self._coalescer.add(event.data)
+        if self._gift_timer is None:
+            self._schedule_gift_flush()
+        return True
+
+    def _schedule_gift_flush(self) -> None:
+        """在最早的合并组到期时输出合并后的礼物."""
+        due = self._coalescer.next_due()
+        if due is None:
+            self._gift_timer = None
+            return
+        self._gift_timer = self._main_loop.call_later(max(0.0, due - time.monotonic()), self._flush_gifts)
+
+    def _flush_gifts(self) -> None:
+        """取出到期的合并礼物并交给批量发布任务."""
+        merged = self._coalescer.pop_due()
+        if merged:
+            self._merged_gifts.extend(Event(data=data, status=DanmakuType.GIFT) for data in merged)
+            self._schedule_drain()
+        self._schedule_gift_flush()
+
+    async def _stats_loop(self) -> None:
+        """在每个片段边界输出各房间的窗口统计并发布 STATS 事件."""
+        aggregator = self._aggregator
+        while True:
+            await asyncio.sleep(max(0.0, aggregator.next_flush() - time.time()))
+            try:
+                stats = aggregator.flush()
+                if stats:
+                    await self.ctx.bus.publish_many(
+                        self.uuid,
+                        [Event(data=data, status=DanmakuType.STATS) for data in stats]
+                    )
+            except Exception as e:
+                _log.error(f"发布窗口统计时出错: {e}", exc_info=True)
+
+    def _get_interner(self, msg: dict) -> Optional[DanmakuInterner]:
+        """获取消息所属房间使用的驻留器，未开启驻留时返回 None."""
+        if self._shared_interner is not None:
+            return self._shared_interner
+        if self._interners:
+            return self._interners.get(msg.get("room_display_id"))
+        return None
+
+    def get_metrics(self) -> dict[str, Any]:
+        """获取事件源指标（各驻留池的容量与命中率、窗口统计）."""
+        if self._shared_interner is not None:
+            intern = {"shared": self._shared_interner.get_metrics()}
+        else:
+            intern = {room_id: interner.get_metrics() for room_id, interner in list(self._interners.items())}
+        metrics: dict[str, Any] = {"intern": intern}
+        if self._aggregator is not None:
+            metrics["stats"] = self._aggregator.get_metrics()
+        if self._coalescer is not None:
+            metrics["gift_coalesce"] = self._coalescer.get_metrics()
+        if self._shedder is not None:
+            metrics["shedding"] = self._shedder.get_metrics()
+        return metrics
 
     @property
     def api(self) -> BilibiliApi:
@@ -186,24 +548,29 @@ class BiliDanmakuSource(BaseSource):
 
     async def on_danmaku(self, msg: dict) -> None:
         # 弹幕事件
-        dto_data = DanmakuMsgDTO.from_raw(msg)
-        if dto_data is not None:
-            danmaku_data = DanmakuMsgData.from_dto(dto_data)
+        if self._shedder is not None and not self._shedder.admit(DanmakuPriority.DANMAKU):
+            # 过载卸载：跳过解析，只计入窗口统计的弹幕数
+            self._count_shed(msg.get("room_display_id"), DanmakuType.DANMAKU)
+            return
+        danmaku_data = DanmakuMsgData.from_raw(msg, self._get_interner(msg))
+        if danmaku_data is not None:
             event = Event(data=danmaku_data, status=DanmakuType.DANMAKU)
             self._publish_to_main(event)
 
     async def on_gift(self, msg: dict) -> None:
         # 礼物事件
-        dto_data = DanmakuGiftDTO.from_raw(msg)
-        if dto_data is not None:
-            danmaku_data = DanmakuGiftData.from_dto(dto_data)
+        danmaku_data = DanmakuGiftData.from_raw(msg, self._get_interner(msg))
+        if self._shedder is not None and danmaku_data is not None \
+                and not self._shedder.admit(classify(DanmakuType.GIFT, danmaku_data)):
+            self._count_shed(danmaku_data.room_display_id, DanmakuType.GIFT)
+            return
+        if danmaku_data is not None:
             event = Event(data=danmaku_data, status=DanmakuType.GIFT)
             self._publish_to_main(event)
 
     async def on_guard(self, msg: dict) -> None:
         # 上舰事件
-        dto_data = DanmakuGuardDTO.from_raw(msg)
-        if dto_data is not None:
-            danmaku_data = DanmakuGuardData.from_dto(dto_data)
+        danmaku_data = DanmakuGuardData.from_raw(msg, self._get_interner(msg))
+        if danmaku_data is not None:
             event = Event(data = danmaku_data, status = DanmakuType.GUARD)
             self._publish_to_main(event)
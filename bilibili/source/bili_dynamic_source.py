@@ -7,6 +7,8 @@ from utils import DataPair
 from typing import Union, Optional
 import traceback
 import asyncio
+import heapq
+import time
 from logging import getLogger
 
 
@@ -22,20 +24,34 @@ class BiliDynamicSource(BaseSource):
     def __init__(self,
                  poll_interval: Union[float, int] = 60,
                  watch_targets: Optional[list[int]] = None,
-                 config_key: str = "bilibili"):
+                 config_key: str = "bilibili",
+                 max_concurrency: int = 5):
         """初始化动态事件源.
         Args:
-            poll_interval: 轮询间隔时间（秒）
+            poll_interval: 轮询间隔时间（秒），每个成员在该时间内至少被轮询一次
             watch_targets: 监听用户列表
             config_key: 配置键，默认"bilibili"
+            max_concurrency: 同时进行的轮询请求上限，默认5
         """
         super().__init__()
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency 必须大于0")
         self.config_key: str = config_key
         self.poll_interval: Union[float, int] = poll_interval
+        self.max_concurrency: int = max_concurrency
         self._poll_num: int = 0
         self._members_list: list[int] = []
         self._dynamic_data: dict[int, DataPair[DynamicData]] = {}
         self._task: Optional[asyncio.Task] = None
+        # 调度状态：按下次到期时间排序的最小堆，条目为 (到期时间, uid)
+        self._heap: list[tuple[float, int]] = []
+        self._due: dict[int, float] = {}  # uid -> 当前有效的到期时间，用于识别堆中的过期条目
+        self._wakeup: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._poll_tasks: set[asyncio.Task] = set()
+        self._round_polls: int = 0
+        self._last_poll: dict[int, float] = {}  # uid -> 最近一次轮询的时间戳
+        self._poll_lag: dict[int, float] = {}  # uid -> 最近一次轮询相对到期时间的延迟（秒）
         if watch_targets is not None:
             self.add_members(watch_targets)
 
@@ -46,6 +62,9 @@ class BiliDynamicSource(BaseSource):
             return
 
         self.running = True
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._wakeup = asyncio.Event()
+        self._init_schedule()
         self._task = asyncio.create_task(self._monitor_loop())
         _log.info("B站动态监控已启动")
 
@@ -63,6 +82,14 @@ class BiliDynamicSource(BaseSource):
             except asyncio.CancelledError:
                 pass
         self._task = None
+        tasks = list(self._poll_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._poll_tasks.clear()
+        self._heap.clear()
+        self._due.clear()
         _log.info("B站动态监控已停止")
 
     def add_members(self, keys: list[int]) -> None:
@@ -74,6 +101,9 @@ class BiliDynamicSource(BaseSource):
         for uid in keys:
             if uid not in self._members_list:
                 self._members_list.append(uid)
+                if self.running:
+                    # 新成员立即到期
+                    self._push(uid, asyncio.get_running_loop().time())
                 _log.debug(f"添加 UID '{uid}' 到监控列表")
             else:
                 _log.warning(f"UID '{uid}' 已存在于监控列表中")
@@ -87,6 +117,10 @@ class BiliDynamicSource(BaseSource):
         for uid in keys:
             if uid in self._members_list:
                 self._members_list.remove(uid)
+                # 堆中的条目在出堆时按 _due 判定失效
+                self._due.pop(uid, None)
+                self._last_poll.pop(uid, None)
+                self._poll_lag.pop(uid, None)
                 _log.debug(f"从监控列表移除 UID '{uid}'")
             else:
                 _log.warning(f"UID '{uid}' 不存在于监控列表中")
@@ -120,6 +154,16 @@ class BiliDynamicSource(BaseSource):
         """获取已完成的轮询次数."""
         return self._poll_num
 
+    @property
+    def last_poll_time(self) -> dict[int, float]:
+        """获取各成员最近一次轮询的时间戳."""
+        return dict(self._last_poll)
+
+    @property
+    def poll_lag(self) -> dict[int, float]:
+        """获取各成员最近一次轮询相对到期时间的延迟（秒）."""
+        return dict(self._poll_lag)
+
     async def _poll_data(self, uid: int) -> Optional[DynamicData]:
         """获取并更新动态数据.
 
@@ -190,39 +234,108 @@ class BiliDynamicSource(BaseSource):
             _log.error(f"轮询 UID '{uid}' 动态数据时出错: {e}")
             _log.error(traceback.format_exc())
 
-    async def _monitor_loop(self) -> None:
-        """监控主循环."""
-        _log.info("动态监控循环已启动")
+    def _push(self, uid: int, due: float) -> None:
+        """将成员按到期时间放入调度堆.
 
-        try:
-            while self.running:
-                monitored_uids = list(self._members_list)
+        Args:
+            uid: 用户UID
+            due: 到期时间（事件循环时钟）
+        """
+        self._due[uid] = due
+        heapq.heappush(self._heap, (due, uid))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _init_schedule(self) -> None:
+        """将当前成员的首次到期时间均匀分布在 poll_interval 内."""
+        now = asyncio.get_running_loop().time()
+        self._heap.clear()
+        self._due.clear()
+        members = list(self._members_list)
+        step = self.poll_interval / len(members) if members else 0
+        for index, uid in enumerate(members):
+            self._push(uid, now + index * step)
+
+    async def _next_due(self) -> Optional[tuple[float, int]]:
+        """等待并取出下一个到期的成员.
+
+        堆顶未到期时休眠至到期或被新成员唤醒；
+        已逾期的条目按到期时间先后出堆，逾期越久越先轮询。
+
+        Returns:
+            (到期时间, uid)，停止运行时返回 None
+        """
+        loop = asyncio.get_running_loop()
+        while self.running:
+            # 丢弃已移除或已被重新调度的条目
+            while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            due, uid = self._heap[0]
+            delay = due - loop.time()
+            if delay <= 0:
+                heapq.heappop(self._heap)
+                del self._due[uid]
+                return due, uid
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+        return None
 
-                if not monitored_uids:
-                    await asyncio.sleep(5)
-                    continue
+    async def _run_poll(self, uid: int, due: float) -> None:
+        """轮询成员并在结束后按原节奏安排下次到期.
 
-                for uid in monitored_uids:
-                    if not self.running:
-                        break
+        下次到期时间为 due + poll_interval，与本次轮询的耗时无关；
+        若已落后于当前时间，则作为逾期条目优先出堆。
 
-                    try:
-                        await self._poll_dynamic(uid)
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception as e:
-                        _log.error(f"轮询 UID '{uid}' 时出错: {e}")
+        Args:
+            uid: 用户UID
+            due: 本次到期时间（事件循环时钟）
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            self._poll_lag[uid] = max(0.0, loop.time() - due)
+            self._last_poll[uid] = time.time()
+            await self._poll_dynamic(uid)
+        finally:
+            self._semaphore.release()
+            if self.running and uid in self._members_list and uid not in self._due:
+                self._push(uid, due + self.poll_interval)
 
-                    if not self.running:
-                        break
+    async def _monitor_loop(self) -> None:
+        """监控主循环.
 
-                    try:
-                        await asyncio.sleep(self.poll_interval)
-                    except asyncio.CancelledError:
-                        raise
+        基于到期时间最小堆调度：每个成员按 poll_interval 周期到期，
+        到期后以 task 方式并发轮询（受 max_concurrency 限制），逾期条目优先。
+        """
+        _log.info("动态监控循环已启动")
 
-                self._poll_num += 1
-                _log.debug(f"完成第 {self._poll_num} 轮动态监控")
+        try:
+            while self.running:
+                # 先取得并发额度，保证出堆的始终是此刻最早到期的成员
+                await self._semaphore.acquire()
+                item = await self._next_due()
+                if item is None:
+                    self._semaphore.release()
+                    break
+
+                due, uid = item
+                task = asyncio.create_task(self._run_poll(uid, due))
+                self._poll_tasks.add(task)
+                task.add_done_callback(self._poll_tasks.discard)
+
+                # 调度次数达到成员数量即视为完成一轮
+                self._round_polls += 1
+                if self._round_polls >= len(self._members_list):
+                    self._round_polls = 0
+                    self._poll_num += 1
+                    _log.debug(f"完成第 {self._poll_num} 轮动态监控")
 
         except asyncio.CancelledError:
             _log.debug("监控循环被取消")
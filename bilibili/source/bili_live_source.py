@@ -7,6 +7,7 @@ from utils import DataPair
 from typing import Union, Optional
 import traceback
 import asyncio
+import time
 from logging import getLogger
 
 
@@ -22,20 +23,36 @@ class BiliLiveSource(BaseSource):
     def __init__(self,
                  poll_interval: Union[float, int] = 20,
                  watch_targets: Optional[list[int]] = None,
-                 config_key: str = "bilibili"):
+                 config_key: str = "bilibili",
+                 max_concurrency: int = 5,
+                 batch_status: bool = False,
+                 batch_size: int = 50):
         """初始化直播事件源.
         Args:
-            poll_interval: 轮询间隔时间（秒）
+            poll_interval: 轮询间隔时间（秒），每个房间在该时间内至少被轮询一次
             watch_targets: 监听用户列表
             config_key: 配置键，默认"bilibili"
+            max_concurrency: 同时进行的轮询请求上限，默认5
+            batch_status: 是否通过批量状态接口轮询，仅对直播状态变化的房间获取完整直播间数据
+            batch_size: 批量状态接口单次请求的房间数量上限，默认50
         """
         super().__init__()
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency 必须大于0")
         self.config_key: str = config_key
         self.poll_interval: Union[float, int] = poll_interval
+        self.max_concurrency: int = max_concurrency
+        self.batch_status: bool = batch_status
+        self.batch_size: int = batch_size
         self._poll_num: int = 0
         self._room_list: list[int] = []
         self._live_data: dict[int, DataPair[LiveRoomData]] = {}
         self._task: Optional[asyncio.Task] = None
+        # 调度状态
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._poll_tasks: dict[int, asyncio.Task] = {}  # 房间 -> 在途轮询
+        self._last_poll: dict[int, float] = {}  # 房间 -> 最近一次轮询的时间戳
+        self._poll_lag: dict[int, float] = {}  # 房间 -> 最近一次轮询相对计划时间的延迟（秒）
         if watch_targets is not None:
             self.add_members(watch_targets)
 
@@ -46,6 +63,7 @@ class BiliLiveSource(BaseSource):
             return
 
         self.running = True
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
         self._task = asyncio.create_task(self._monitor_loop())
         _log.info("B站直播监控已启动")
 
@@ -63,6 +81,12 @@ class BiliLiveSource(BaseSource):
             except asyncio.CancelledError:
                 pass
         self._task = None
+        tasks = list(self._poll_tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._poll_tasks.clear()
         _log.info("B站直播监控已停止")
 
     def add_members(self, keys: list[int]) -> None:
@@ -87,6 +111,8 @@ class BiliLiveSource(BaseSource):
         for room_id in keys:
             if room_id in self._room_list:
                 self._room_list.remove(room_id)
+                self._last_poll.pop(room_id, None)
+                self._poll_lag.pop(room_id, None)
                 _log.debug(f"从监控列表移除房间 '{room_id}'")
             else:
                 _log.warning(f"房间 '{room_id}' 不存在于监控列表中")
@@ -120,6 +146,16 @@ class BiliLiveSource(BaseSource):
         """获取已完成的轮询次数."""
         return self._poll_num
 
+    @property
+    def last_poll_time(self) -> dict[int, float]:
+        """获取各房间最近一次轮询的时间戳."""
+        return dict(self._last_poll)
+
+    @property
+    def poll_lag(self) -> dict[int, float]:
+        """获取各房间最近一次轮询相对计划时间的延迟（秒）."""
+        return dict(self._poll_lag)
+
     async def _poll_data(self, room_id: int) -> Optional[LiveRoomData]:
         """获取并更新直播数据.
 
@@ -193,9 +229,87 @@ class BiliLiveSource(BaseSource):
         else:
             return LiveType.OFFLINE
 
+    def _schedule_poll(self, room_id: int, due: float) -> None:
+        """在计划时间点为房间启动一次并发轮询.
+
+        Args:
+            room_id: 直播间ID
+            due: 计划轮询时间（事件循环时钟）
+        """
+        running = self._poll_tasks.get(room_id)
+        if running is not None and not running.done():
+            _log.warning(f"房间 '{room_id}' 的上一次轮询尚未结束，跳过本轮")
+            return
+        task = asyncio.create_task(self._run_poll(room_id, due))
+        self._poll_tasks[room_id] = task
+        task.add_done_callback(lambda t: self._on_poll_done(room_id, t))
+
+    def _on_poll_done(self, room_id: int, task: asyncio.Task) -> None:
+        """轮询结束，移除在途记录."""
+        if self._poll_tasks.get(room_id) is task:
+            del self._poll_tasks[room_id]
+
+    async def _run_poll(self, room_id: int, due: float) -> None:
+        """在并发额度内轮询房间并记录轮询时间与延迟.
+
+        Args:
+            room_id: 直播间ID
+            due: 计划轮询时间（事件循环时钟）
+        """
+        async with self._semaphore:
+            self._poll_lag[room_id] = max(0.0, asyncio.get_running_loop().time() - due)
+            self._last_poll[room_id] = time.time()
+            await self._poll_live(room_id)
+
+    async def _poll_batch(self, rooms: list[int], due: float) -> None:
+        """通过批量状态接口轮询一组房间.
+
+        直播状态未变化的房间沿用上次的直播间数据发布 ONLINE/OFFLINE 事件，
+        状态变化或尚无数据的房间再单独获取完整数据（由 _poll_live 判定 OPEN/CLOSE）。
+
+        Args:
+            rooms: 直播间ID列表
+            due: 计划轮询时间（事件循环时钟）
+        """
+        try:
+            status = await self.api.get_live_status(rooms, self.batch_size)
+        except Exception as e:
+            _log.error(f"批量获取直播状态时出错: {e}")
+            return
+
+        lag = max(0.0, asyncio.get_running_loop().time() - due)
+        now = time.time()
+        for room_id in rooms:
+            live_status = status.get(room_id)
+            if live_status is None:
+                _log.warning(f"批量状态中未找到房间 '{room_id}'")
+                continue
+
+            data_pair = self._live_data.get(room_id)
+            if data_pair is None or data_pair.new.room_info.live_status != live_status:
+                # 状态变化：获取完整数据
+                self._schedule_poll(room_id, due)
+                continue
+
+            self._poll_lag[room_id] = lag
+            self._last_poll[room_id] = now
+            data_pair.update(data_pair.new)
+            event = Event(
+                data=data_pair.new,
+                status=LiveType.ONLINE if live_status == 1 else LiveType.OFFLINE
+            )
+            await self.ctx.bus.publish(self.uuid, event)
+
     async def _monitor_loop(self) -> None:
-        """监控主循环."""
+        """监控主循环.
+
+        每轮将房间的轮询时间点均匀分布在 poll_interval 内，
+        到点后以 task 方式并发轮询（受 max_concurrency 限制），
+        因此无论房间数量多少，每个房间都会在 poll_interval 内被再次轮询。
+        开启 batch_status 时每轮改为一次批量状态查询。
+        """
         _log.info("直播监控循环已启动")
+        loop = asyncio.get_running_loop()
 
         try:
             while self.running:
@@ -205,24 +319,29 @@ class BiliLiveSource(BaseSource):
                     await asyncio.sleep(5)
                     continue
 
-                for room_id in monitored_rooms:
-                    if not self.running:
-                        break
+                cycle_start = loop.time()
+
+                if self.batch_status:
+                    await self._poll_batch(monitored_rooms, cycle_start)
+                else:
+                    step = self.poll_interval / len(monitored_rooms)
+
+                    for index, room_id in enumerate(monitored_rooms):
+                        due = cycle_start + index * step
+                        delay = due - loop.time()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
 
-                    try:
-                        await self._poll_live(room_id)
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception as e:
-                        _log.error(f"轮询房间 '{room_id}' 时出错: {e}")
+                        if not self.running:
+                            break
+                        if room_id not in self._room_list:
+                            continue
 
-                    if not self.running:
-                        break
+                        self._schedule_poll(room_id, due)
 
-                    try:
-                        await asyncio.sleep(self.poll_interval)
-                    except asyncio.CancelledError:
-                        raise
+                remaining = cycle_start + self.poll_interval - loop.time()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
 
                 self._poll_num += 1
                 _log.debug(f"完成第 {self._poll_num} 轮直播监控")
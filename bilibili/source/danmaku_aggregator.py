@@ -0,0 +1,241 @@
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Optional, Union
+
+from utils import HyperLogLog, CountMinSketch
+from bilibili.type import DanmakuType
+from bilibili.data import (
+    DanmakuMsgData,
+    DanmakuGiftData,
+    DanmakuGuardData,
+    DanmakuStatsData,
+)
+
+
+class _Pane:
+    """一个滑动步长内的统计片段."""
+
+    __slots__ = (
+        "danmaku_count", "gift_count", "gift_value", "guard_count", "guard_value", "shed_count",
+        "uids", "words", "candidates", "floor",
+    )
+
+    def __init__(self, hll_precision: int, cms_width: int, cms_depth: int):
+        self.danmaku_count = 0
+        self.gift_count = 0
+        self.gift_value = 0
+        self.guard_count = 0
+        self.guard_value = 0
+        self.shed_count = 0  # 过载卸载、只计数的弹幕与礼物
+        self.uids = HyperLogLog(hll_precision)
+        self.words = CountMinSketch(cms_width, cms_depth)
+        self.candidates: dict[str, int] = {}  # 高频弹幕候选 -> 估计次数
+        self.floor = 0  # 候选集已满时新候选需要超过的估计次数
+
+
+class DanmakuAggregator:
+    """按房间的弹幕窗口聚合.
+
+    时间轴按 slide 切分为片段，每个窗口由最近 window / slide 个片段合并而成：
+    slide 等于 window 时为滚动窗口，小于 window 时为滑动窗口。
+    去重用户数使用 HyperLogLog，高频弹幕使用 Count-Min Sketch 加有界候选集，
+    每个房间的内存占用与流量无关。
+    """
+
+    def __init__(
+        self,
+        window: Union[float, int],
+        slide: Optional[Union[float, int]] = None,
+        top_k: int = 10,
+        hll_precision: int = 12,
+        cms_width: int = 1024,
+        cms_depth: int = 4,
+        clock: Callable[[], float] = time.time
+    ):
+        """初始化聚合器.
+
+        Args:
+            window: 窗口长度（秒）
+            slide: 滑动步长（秒），None 表示与 window 相同（滚动窗口）
+            top_k: 每个窗口输出的高频弹幕数量
+            hll_precision: HyperLogLog 精度
+            cms_width: Count-Min Sketch 宽度
+            cms_depth: Count-Min Sketch 深度
+            clock: 时钟函数，返回时间戳（秒）
+        """
+        slide = window if slide is None else slide
+        if window <= 0 or slide <= 0:
+            raise ValueError("window 与 slide 必须大于0")
+        panes = round(window / slide)
+        if panes < 1 or not math.isclose(panes * slide, window):
+            raise ValueError("window 必须是 slide 的整数倍")
+        self.window = window
+        self.slide = slide
+        self.top_k = top_k
+        self._panes_per_window = panes
+        self._hll_precision = hll_precision
+        self._cms_width = cms_width
+        self._cms_depth = cms_depth
+        self._candidate_limit = max(top_k * 4, 16)
+        self._clock = clock
+        self._rooms: dict[int, deque[tuple[int, _Pane]]] = {}  # 房间 -> [(片段序号, 片段)]
+        self._metrics = {"aggregated": 0, "windows": 0}
+        self._flushed: Optional[int] = None  # 上次输出时的片段序号
+
+    def _pane(self, room_id: int) -> _Pane:
+        """获取房间当前时间所在的片段."""
+        index = math.floor(self._clock() / self.slide)
+        panes = self._rooms.get(room_id)
+        if panes is None:
+            panes = self._rooms[room_id] = deque()
+        if not panes or panes[-1][0] != index:
+            panes.append((index, _Pane(self._hll_precision, self._cms_width, self._cms_depth)))
+        return panes[-1][1]
+
+    def add(self, data: Any) -> bool:
+        """将一条弹幕/礼物/上舰数据计入所属房间的当前片段.
+
+        Returns:
+            bool: 数据类型可被聚合时返回 True
+        """
+        if isinstance(data, DanmakuMsgData):
+            pane = self._pane(data.room_display_id)
+            pane.danmaku_count += 1
+            pane.uids.add(data.uid)
+            word = data.message.strip()
+            if word:
+                estimate = pane.words.add(word)
+                candidates = pane.candidates
+                if word in candidates or estimate > pane.floor:
+                    candidates[word] = estimate
+                    if len(candidates) > self._candidate_limit * 2:
+                        self._prune(pane)
+        elif isinstance(data, DanmakuGiftData):
+            pane = self._pane(data.room_display_id)
+            pane.gift_count += 1
+            if data.coin_type == "gold":
+                pane.gift_value += data.total_coin
+            pane.uids.add(data.uid)
+        elif isinstance(data, DanmakuGuardData):
+            pane = self._pane(data.room_display_id)
+            pane.guard_count += 1
+            pane.guard_value += data.price * data.num
+            pane.uids.add(data.uid)
+        else:
+            return False
+        self._metrics["aggregated"] += 1
+        return True
+
+    def add_shed(self, room_id: int, status: DanmakuType, count: int = 1) -> None:
+        """计入过载卸载的弹幕或礼物数量.
+
+        被卸载的消息未经解析，只计入所属房间当前片段的弹幕数或礼物数，
+        不参与去重用户数、高频弹幕与礼物价值的统计，窗口统计中以 shed_count 标明。
+
+        Args:
+            room_id: 房间号
+            status: 被卸载消息的事件状态（DANMAKU 或 GIFT）
+            count: 卸载数量
+        """
+        pane = self._pane(room_id)
+        if status == DanmakuType.GIFT:
+            pane.gift_count += count
+        else:
+            pane.danmaku_count += count
+        pane.shed_count += count
+
+    def _prune(self, pane: _Pane) -> None:
+        """仅保留估计次数最高的候选，并提高新候选的准入门槛."""
+        keep = sorted(pane.candidates.items(), key=lambda kv: kv[1], reverse=True)[:self._candidate_limit]
+        pane.candidates = dict(keep)
+        pane.floor = keep[-1][1]
+
+    def next_flush(self) -> float:
+        """下一个片段边界（窗口结束）的时间戳."""
+        return (math.floor(self._clock() / self.slide) + 1) * self.slide
+
+    def flush(self) -> list[DanmakuStatsData]:
+        """输出截至当前片段边界的各房间窗口统计.
+
+        应在每个片段边界之后调用一次；窗口内没有任何数据的房间不输出，
+        不再属于任何后续窗口的片段随即释放。
+        同一片段内重复调用（如计时器在边界之前提前唤醒）返回空列表，不会重复输出同一窗口。
+
+        Returns:
+            各房间的窗口统计数据
+        """
+        current = math.floor(self._clock() / self.slide)
+        if self._flushed is not None and current <= self._flushed:
+            return []
+        self._flushed = current
+        first = current - self._panes_per_window
+        window_end = float(current * self.slide)
+        window_start = window_end - self.window
+        results = []
+        for room_id in list(self._rooms):
+            panes = self._rooms[room_id]
+            while panes and panes[0][0] < first:
+                panes.popleft()
+            members = [pane for index, pane in panes if index < current]
+            if members:
+                results.append(self._merge(room_id, members, window_start, window_end))
+            # 最旧的片段不会再出现在下一个窗口中
+            while panes and panes[0][0] <= first:
+                panes.popleft()
+            if not panes:
+                del self._rooms[room_id]
+        self._metrics["windows"] += len(results)
+        return results
+
+    def _merge(
+        self,
+        room_id: int,
+        panes: list[_Pane],
+        window_start: float,
+        window_end: float
+    ) -> DanmakuStatsData:
+        """合并窗口内的片段为统计数据."""
+        if len(panes) == 1:
+            uids, words = panes[0].uids, panes[0].words
+        else:
+            uids = HyperLogLog(self._hll_precision)
+            words = CountMinSketch(self._cms_width, self._cms_depth)
+            for pane in panes:
+                uids.merge(pane.uids)
+                words.merge(pane.words)
+        candidates = set()
+        for pane in panes:
+            candidates.update(pane.candidates)
+        top_words = sorted(
+            ((word, words.estimate(word)) for word in candidates),
+            key=lambda kv: kv[1],
+            reverse=True
+        )[:self.top_k]
+        danmaku_count = sum(pane.danmaku_count for pane in panes)
+        return DanmakuStatsData(
+            room_display_id=room_id,
+            window_start=window_start,
+            window_end=window_end,
+            danmaku_count=danmaku_count,
+            danmaku_rate=danmaku_count / self.window,
+            gift_count=sum(pane.gift_count for pane in panes),
+            gift_value=sum(pane.gift_value for pane in panes),
+            guard_count=sum(pane.guard_count for pane in panes),
+            guard_value=sum(pane.guard_value for pane in panes),
+            unique_uids=uids.count(),
+            top_words=tuple(top_words),
+            shed_count=sum(pane.shed_count for pane in panes),
+        )
+
+    def remove_room(self, room_id: int) -> None:
+        """丢弃房间尚未输出的统计."""
+        self._rooms.pop(room_id, None)
+
+    def get_metrics(self) -> dict[str, int]:
+        """获取聚合指标（已聚合的数据条数、已输出的窗口数、房间数与片段数）."""
+        return {
+            **self._metrics,
+            "rooms": len(self._rooms),
+            "panes": sum(len(panes) for panes in self._rooms.values()),
+        }
@@ -0,0 +1,109 @@
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Callable, Optional, Union
+
+from bilibili.data import DanmakuGiftData
+
+
+class _GiftGroup:
+    """一次送礼动作中已收到的礼物消息."""
+
+    __slots__ = ("deadline", "first", "last", "gift_num", "total_coin", "messages")
+
+    def __init__(self, deadline: float, data: DanmakuGiftData):
+        self.deadline = deadline
+        self.first = data
+        self.last = data
+        self.gift_num = data.gift_num
+        self.total_coin = data.total_coin
+        self.messages = 1
+
+
+class GiftCoalescer:
+    """礼物连击合并.
+
+    批量送礼与连击会拆成多条 SEND_GIFT 消息。以 (房间, 用户, 礼物ID, 连击ID) 为键，
+    从第一条消息起保留 hold 秒，期间同键的消息累加数量与总价值，
+    到期后输出一条合并后的 DanmakuGiftData。
+    """
+
+    def __init__(
+        self,
+        hold: Union[float, int] = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """初始化.
+
+        Args:
+            hold: 合并窗口（秒），从同键的第一条消息开始计算
+            clock: 时钟函数，返回单调时间（秒）
+        """
+        if hold <= 0:
+            raise ValueError("hold 必须大于0")
+        self.hold = hold
+        self._clock = clock
+        # 按到期时间排序（hold 固定，插入顺序即到期顺序）
+        self._groups: OrderedDict[tuple, _GiftGroup] = OrderedDict()
+        self._metrics = {"received": 0, "emitted": 0}
+
+    def add(self, data: DanmakuGiftData) -> bool:
+        """加入一条礼物消息.
+
+        Returns:
+            bool: 该消息开启了新的合并组时返回 True
+        """
+        self._metrics["received"] += 1
+        key = (data.room_display_id, data.uid, data.gift_id, data.batch_combo_id)
+        group = self._groups.get(key)
+        if group is None:
+            self._groups[key] = _GiftGroup(self._clock() + self.hold, data)
+            return True
+        group.last = data
+        group.gift_num += data.gift_num
+        group.total_coin += data.total_coin
+        group.messages += 1
+        return False
+
+    def next_due(self) -> Optional[float]:
+        """最早到期的合并组的到期时间，没有待合并的礼物时返回 None."""
+        for group in self._groups.values():
+            return group.deadline
+        return None
+
+    def pop_due(self) -> list[DanmakuGiftData]:
+        """取出所有已到期的合并组并输出合并后的礼物数据."""
+        now = self._clock()
+        result = []
+        while self._groups:
+            key, group = next(iter(self._groups.items()))
+            if group.deadline > now:
+                break
+            del self._groups[key]
+            result.append(self._merge(group))
+        self._metrics["emitted"] += len(result)
+        return result
+
+    def drain(self) -> list[DanmakuGiftData]:
+        """取出所有合并组（不论是否到期），用于停止时输出剩余礼物."""
+        result = [self._merge(group) for group in self._groups.values()]
+        self._groups.clear()
+        self._metrics["emitted"] += len(result)
+        return result
+
+    @staticmethod
+    def _merge(group: _GiftGroup) -> DanmakuGiftData:
+        """以最后一条消息为准，累加数量与总价值."""
+        if group.messages == 1:
+            return group.first
+        return replace(
+            group.last,
+            gift_num=group.gift_num,
+            total_coin=group.total_coin,
+            is_first=group.first.is_first,
+            combo_total_coin=max(group.last.combo_total_coin, group.total_coin),
+        )
+
+    def get_metrics(self) -> dict[str, int]:
+        """获取合并指标（收到的礼物消息数、输出的礼物事件数、待合并组数）."""
+        return {**self._metrics, "pending": len(self._groups)}
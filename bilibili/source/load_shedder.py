@@ -0,0 +1,124 @@
+import threading
+from enum import Enum
+from typing import Any, Union
+
+from bilibili.type import DanmakuType
+from bilibili.data import DanmakuGiftData
+
+
+class DanmakuPriority(Enum):
+    """弹幕事件优先级，按定义顺序从高到低."""
+    GUARD = "guard"  # 上舰（开播、统计等控制类事件同级）
+    PAID_GIFT = "paid_gift"  # 付费礼物
+    FREE_GIFT = "free_gift"  # 免费礼物
+    DANMAKU = "danmaku"  # 普通弹幕
+
+
+# 优先级 -> 排序序号（越小越优先）
+PRIORITY_RANK: dict[DanmakuPriority, int] = {p: i for i, p in enumerate(DanmakuPriority)}
+
+
+def classify(status: DanmakuType, data: Any) -> DanmakuPriority:
+    """根据事件状态与数据确定优先级."""
+    if status == DanmakuType.DANMAKU:
+        return DanmakuPriority.DANMAKU
+    if status == DanmakuType.GIFT:
+        if isinstance(data, DanmakuGiftData) and data.coin_type == "gold" and data.total_coin > 0:
+            return DanmakuPriority.PAID_GIFT
+        return DanmakuPriority.FREE_GIFT
+    return DanmakuPriority.GUARD
+
+
+class LoadShedder:
+    """按优先级的过载卸载策略.
+
+    以发布延迟（事件从房间线程入队到被主循环取出的时间）和队列深度衡量负载：
+    - 等级0：正常，全部接收
+    - 等级1：延迟或深度超过阈值，普通弹幕按 sample_rate 采样
+    - 等级2：超过阈值两倍，丢弃普通弹幕，免费礼物按 sample_rate 采样
+    付费礼物与上舰从不卸载；负载降到阈值一半以下才恢复等级0。
+    admit 可在房间线程中调用，卸载计数加锁。
+    """
+
+    def __init__(
+        self,
+        lag_threshold: Union[float, int] = 0.5,
+        depth_threshold: int = 2000,
+        sample_rate: float = 0.1
+    ):
+        """初始化.
+
+        Args:
+            lag_threshold: 发布延迟阈值（秒）
+            depth_threshold: 队列深度阈值（交接队列与回调等待队列之和）
+            sample_rate: 采样时保留的比例，取值 (0, 1]
+        """
+        if lag_threshold <= 0 or depth_threshold <= 0:
+            raise ValueError("lag_threshold 与 depth_threshold 必须大于0")
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate 取值范围为 (0, 1]")
+        self.lag_threshold = lag_threshold
+        self.depth_threshold = depth_threshold
+        self.sample_rate = sample_rate
+        self.level = 0
+        self._every = max(1, round(1 / sample_rate))  # 采样时每 _every 条保留1条
+        self._lock = threading.Lock()
+        self._seen: dict[DanmakuPriority, int] = {p: 0 for p in DanmakuPriority}
+        self._shed: dict[DanmakuPriority, int] = {p: 0 for p in DanmakuPriority}
+        self._lag = 0.0
+        self._depth = 0
+        self._max_lag = 0.0
+
+    def update(self, lag: float, depth: int) -> int:
+        """根据最新测得的延迟与队列深度更新卸载等级.
+
+        Args:
+            lag: 发布延迟（秒）
+            depth: 队列深度
+
+        Returns:
+            int: 新的卸载等级
+        """
+        self._lag = lag
+        self._depth = depth
+        self._max_lag = max(self._max_lag, lag)
+        load = max(lag / self.lag_threshold, depth / self.depth_threshold)
+        if load >= 2:
+            self.level = 2
+        elif load >= 1:
+            self.level = 1
+        elif load < 0.5:
+            self.level = 0
+        else:
+            # 阈值一半到阈值之间：只降不升
+            self.level = min(self.level, 1)
+        return self.level
+
+    def admit(self, priority: DanmakuPriority) -> bool:
+        """判断当前等级下是否接收该优先级的事件，被卸载的事件计入统计."""
+        level = self.level
+        if level == 0 or priority in (DanmakuPriority.GUARD, DanmakuPriority.PAID_GIFT):
+            return True
+        if priority == DanmakuPriority.FREE_GIFT and level < 2:
+            return True
+        with self._lock:
+            if priority == DanmakuPriority.DANMAKU and level >= 2:
+                self._shed[priority] += 1
+                return False
+            self._seen[priority] += 1
+            if self._seen[priority] % self._every == 1 % self._every:
+                return True
+            self._shed[priority] += 1
+            return False
+
+    def get_metrics(self) -> dict[str, Any]:
+        """获取卸载等级、最近测得的延迟与深度，以及各优先级被卸载的数量."""
+        with self._lock:
+            shed = {p.value: n for p, n in self._shed.items()}
+        return {
+            "level": self.level,
+            "lag_ms": self._lag * 1000,
+            "max_lag_ms": self._max_lag * 1000,
+            "queue_depth": self._depth,
+            "shed": shed,
+        }
@@ -26,3 +26,4 @@ class DanmakuType(BaseType):
     GUARD = "danmaku.guard"  # 舰长
     OPEN = "danmaku.live_open"  # 开播
     OFFLINE = "danmaku.offline"  # 下播
+    STATS = "danmaku.stats"  # 窗口统计
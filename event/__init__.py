@@ -1,10 +1,13 @@
 from .event import Event
 from .event_bus import EventBus
+from .executor import DispatchExecutor, OverflowPolicy
 from .subscriber import Subscriber, SubscriberGroup
 
 __all__ = [
     "Event",
     "EventBus",
+    "DispatchExecutor",
+    "OverflowPolicy",
     "Subscriber",
     "SubscriberGroup",
 ]
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from uuid import uuid4, UUID
-from typing import Generic
+from typing import Any, Generic, Optional
 from base_cls import BaseDataT, BaseType
 
 
@@ -12,10 +12,12 @@ class Event(Generic[BaseDataT]):
         data: 事件数据
         status: 事件状态
         id: 事件唯一标识符
+        raw: 构造 data 所用的原始数据（可选），供订阅者的原始字段过滤使用
     """
     data: BaseDataT
     status: BaseType
     id: str = field(default_factory=lambda: str(uuid4()))
+    raw: Optional[dict[str, Any]] = field(default=None, repr=False)
 
     def __repr__(self) -> str:
         return f"Event(data={self.data}, status={self.status})"
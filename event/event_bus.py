@@ -1,11 +1,11 @@
-from typing import Callable, Coroutine, Any
+from typing import Callable, Coroutine, Any, Optional, Iterable, Union
 from logging import getLogger
 from functools import wraps
-import asyncio
 import inspect
 from uuid import UUID
-from base_cls import BaseType
+from base_cls import BaseType, BaseFilter
 from .event import Event
+from .executor import DispatchExecutor
 from .subscriber import Subscriber, SubscriberGroup
 
 
@@ -16,73 +16,155 @@ class EventBus:
     """事件总线，管理事件的订阅和发布.
     """
 
-    def __init__(self):
-        """初始化事件总线."""
+    def __init__(self, executor: Optional[DispatchExecutor] = None):
+        """初始化事件总线.
+
+        Args:
+            executor: 回调执行器，默认使用 DispatchExecutor 的默认配置
+        """
         # 使用订阅组管理订阅者
         self._subscriber_group = SubscriberGroup()
+        # 回调执行器，负责并发控制与背压
+        self._executor = executor or DispatchExecutor()
+        # 订阅变化观察者：发布器uuid -> 回调列表
+        self._watchers: dict[UUID, list[Callable[[BaseType], None]]] = {}
+
+    @property
+    def executor(self) -> DispatchExecutor:
+        """获取回调执行器."""
+        return self._executor
 
     def _wrap_callback(
         self,
-        func: Callable
+        func: Callable,
+        inline: bool = False
     ) -> Callable[[Event], Coroutine[Any, Any, None]]:
         """检查并包装回调函数.
 
-        验证函数是否为协程函数，并用 @wraps 保留原函数元信息
+        验证函数是否为协程函数，并用 @wraps 保留原函数元信息；
+        内联订阅者允许使用同步函数，包装为不挂起的协程函数
 
         Args:
             func: 原始回调函数
+            inline: 是否为内联订阅者
 
         Returns:
             包装后的回调函数
 
         Raises:
-            TypeError: 如果回调函数不是协程函数
+            TypeError: 如果回调函数不是协程函数（内联订阅者除外）
         """
-        if not inspect.iscoroutinefunction(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(event: Event) -> None:
+                return await func(event)
+        elif inline and callable(func):
+            @wraps(func)
+            async def wrapper(event: Event) -> None:
+                return func(event)
+        else:
             raise TypeError(f"回调函数 '{func.__name__}' 必须是协程函数")
 
-        @wraps(func)
-        async def wrapper(event: Event) -> None:
-            return await func(event)
-
         return wrapper
 
     def add_subscriber(
         self,
         uuid: UUID,
         callback: Callable[[Event], Coroutine[Any, Any, None]],
-        status: BaseType
+        status: Union[BaseType, Iterable[BaseType]],
+        concurrency: Optional[int] = None,
+        raw_filter: Optional[dict[str, Any]] = None,
+        event_filter: Optional[BaseFilter] = None,
+        filter_reorder: bool = False,
+        inline: bool = False
     ) -> None:
         """添加订阅者.
 
         Args:
             uuid: 发布器的唯一标识符
             callback: 回调函数，接收 Event 参数
-            status: 状态过滤器（同时用于确定事件类别）
+            status: 状态过滤器（同时用于确定事件类别），或多个状态的集合；
+                订阅多个状态时每个事件最多触发一次回调
+            concurrency: 该订阅者同时运行的回调上限，None 表示不限制
+            raw_filter: 原始数据字段过滤 {字段: 值或值的集合}，None 表示不过滤
+            event_filter: 事件过滤器，注册时展开嵌套的与/或组合并编译为单个谓词；
+                FieldFilter（或与组合中的 FieldFilter 项）登记到按字段值查找的倒排索引
+            filter_reorder: 是否按实测开销与通过率重排 event_filter 的子过滤器
+            inline: 是否在发布时直接同步执行回调（可为同步函数），不创建 task；
+                超出执行器的 inline_budget 或协程挂起时自动降级为 task 方式
         """
-        wrapper = self._wrap_callback(callback)
+        wrapper = self._wrap_callback(callback, inline)
 
         subscriber = Subscriber(
             callback = wrapper,
             status_filter = status,
+            concurrency = concurrency,
+            raw_filter = raw_filter,
+            event_filter = event_filter,
+            filter_reorder = filter_reorder,
+            inline = inline,
         )
         self._subscriber_group.add(uuid, subscriber)
         _log.debug(
             f"为 '{uuid}' 注册订阅者"
             f"callback={callback.__name__}, "
-            f"status_filter={status.value})"
+            f"status_filter={[s.value for s in subscriber.statuses]})"
         )
+        for watcher in list(self._watchers.get(uuid, ())):
+            for status in subscriber.statuses:
+                try:
+                    watcher(status)
+                except Exception as e:
+                    _log.error(f"通知订阅变化时出错 (发布器uuid={uuid}): {e}")
+
+    def watch_subscribers(self, uuid: UUID, callback: Callable[[BaseType], None]) -> None:
+        """注册订阅变化观察者.
+
+        发布器新增订阅者时以订阅的状态调用 callback，
+        事件源可据此按需开启对应消息的解析。
+
+        Args:
+            uuid: 发布器的唯一标识符
+            callback: 同步回调函数，接收新订阅者的状态过滤器
+        """
+        self._watchers.setdefault(uuid, []).append(callback)
+
+    def unwatch_subscribers(self, uuid: UUID, callback: Callable[[BaseType], None]) -> None:
+        """移除订阅变化观察者.
+
+        Args:
+            uuid: 发布器的唯一标识符
+            callback: 注册时使用的回调函数
+        """
+        watchers = self._watchers.get(uuid)
+        if watchers and callback in watchers:
+            watchers.remove(callback)
+            if not watchers:
+                del self._watchers[uuid]
 
     def subscribe(
         self,
         uuid: UUID,
-        status: BaseType
+        status: Union[BaseType, Iterable[BaseType]],
+        concurrency: Optional[int] = None,
+        raw_filter: Optional[dict[str, Any]] = None,
+        event_filter: Optional[BaseFilter] = None,
+        filter_reorder: bool = False,
+        inline: bool = False
     ) -> Callable:
         """装饰器：订阅事件.
 
         Args:
             uuid: 发布器的唯一标识符
-            status: 状态过滤器（同时用于确定事件类别）
+            status: 状态过滤器（同时用于确定事件类别），或多个状态的集合；
+                订阅多个状态时每个事件最多触发一次回调
+            concurrency: 该订阅者同时运行的回调上限，None 表示不限制
+            raw_filter: 原始数据字段过滤 {字段: 值或值的集合}，None 表示不过滤
+            event_filter: 事件过滤器，注册时展开嵌套的与/或组合并编译为单个谓词；
+                FieldFilter（或与组合中的 FieldFilter 项）登记到按字段值查找的倒排索引
+            filter_reorder: 是否按实测开销与通过率重排 event_filter 的子过滤器
+            inline: 是否在发布时直接同步执行回调（可为同步函数），不创建 task；
+                超出执行器的 inline_budget 或协程挂起时自动降级为 task 方式
 
         Returns:
             装饰器函数
@@ -93,7 +175,7 @@ class EventBus:
                 print(event)
         """
         def decorator(func: Callable[[Event], Coroutine[Any, Any, None]]) -> Callable:
-            self.add_subscriber(uuid, func, status)
+            self.add_subscriber(uuid, func, status, concurrency, raw_filter, event_filter, filter_reorder, inline)
             return func
         return decorator
 
@@ -104,24 +186,94 @@ class EventBus:
     ) -> None:
         """发布事件.
 
-        发布指定发布器的事件，触发所有匹配的订阅者回调。
+        发布指定发布器的事件，将所有匹配的订阅者回调提交给执行器，内联订阅者直接同步执行。
+        执行器等待队列已满且策略为 BLOCK 时，本方法会等待至队列出现空位。
 
         Args:
             uuid: 发布器的唯一标识符
             event: 要发布的事件
         """
-        for subscriber in self._subscriber_group.get_subscriber(uuid):
+        for subscriber in self._subscriber_group.match(uuid, event.status, event.data):
             try:
-                if not event.status.matches(subscriber.status_filter):
+                # 过滤器抛出的异常只影响当前订阅者
+                if event.raw is not None and not subscriber.accepts(event.raw):
+                    continue
+                if not subscriber.admits(event):
                     continue
-                # 异步执行回调
-                asyncio.create_task(subscriber.callback(event))
+                if subscriber.inline:
+                    # 内联订阅者直接同步执行，不输出逐次触发日志
+                    self._executor.run_inline(subscriber, event)
+                    continue
+                # 交由执行器异步执行回调
+                await self._executor.submit(subscriber, event)
                 _log.debug(
                     f"触发订阅者 (uuid={uuid}, "
                     f"callback={subscriber.callback.__name__}, status={event.status.value})"
                 )
             except Exception as e:
                 _log.error(
-                    f"执行订阅者回调时出错 "
+                    f"过滤或执行订阅者回调时出错 "
                     f"(发布器uuid={uuid}, callback={subscriber.callback.__name__}): {e}"
                 )
+
+    def has_subscribers(self, uuid: UUID, status: BaseType) -> bool:
+        """检查发布器的某个状态是否有订阅者.
+
+        事件源可据此在构造事件数据之前丢弃无人订阅的消息。
+
+        Args:
+            uuid: 发布器的唯一标识符
+            status: 事件状态
+
+        Returns:
+            bool: 存在匹配的订阅者返回 True
+        """
+        group = self._subscriber_group
+        return bool(group.match(uuid, status)) or group.has_keyed(uuid, status)
+
+    def accepts_raw(self, uuid: UUID, status: BaseType, raw: dict[str, Any]) -> bool:
+        """检查是否有订阅者会接收该原始数据.
+
+        Args:
+            uuid: 发布器的唯一标识符
+            status: 事件状态
+            raw: 原始数据
+
+        Returns:
+            bool: 存在状态匹配且 raw_filter 通过的订阅者返回 True；
+                带字段索引的订阅者同时按原始数据中的同名字段查找
+        """
+        group = self._subscriber_group
+        for subscriber in group.match(uuid, status):
+            if subscriber.accepts(raw):
+                return True
+        if group.has_keyed(uuid, status):
+            for subscriber in group.match_raw(uuid, status, raw):
+                if subscriber.accepts(raw):
+                    return True
+        return False
+
+    async def publish_many(
+        self,
+        uuid: UUID,
+        events: Iterable[Event]
+    ) -> None:
+        """批量发布事件.
+
+        按顺序发布同一发布器的一批事件，用于跨线程批量投递等场景，
+        避免为每个事件单独调度一次协程。
+
+        Args:
+            uuid: 发布器的唯一标识符
+            events: 要发布的事件序列
+        """
+        for event in events:
+            await self.publish(uuid, event)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """获取事件总线指标（回调执行器的队列深度与丢弃计数等）."""
+        return self._executor.get_metrics()
+
+    async def shutdown(self) -> None:
+        """取消所有在途及等待中的订阅者回调."""
+        await self._executor.shutdown()
@@ -0,0 +1,344 @@
+from collections import deque
+from enum import Enum
+from itertools import count
+from logging import getLogger
+from typing import Any, Coroutine, Generator, Optional, Union
+import asyncio
+import heapq
+import time
+
+from .event import Event
+from .subscriber import Subscriber
+
+
+_log = getLogger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """等待队列溢出策略."""
+    BLOCK = "block"  # 阻塞发布者直到队列有空位
+    DROP_OLDEST = "drop_oldest"  # 丢弃队列中最旧的回调
+    DROP_NEWEST = "drop_newest"  # 丢弃当前提交的回调
+
+
+class DispatchExecutor:
+    """订阅者回调执行器，限制同时运行的回调数量并提供背压.
+
+    回调以 task 方式运行并被持续追踪：
+    - 全局在途回调数不超过 max_in_flight
+    - 订阅者可声明自己的并发上限 (Subscriber.concurrency)
+    - 超出上限的回调进入有界等待队列，队列满时按 overflow 策略处理
+
+    等待队列按订阅者分别存放，并用按入队序号排序的就绪堆记录"有自身额度且有等待回调"的订阅者。
+    回调结束时只检查能够启动的回调，不再遍历因订阅者并发上限而等待的回调；
+    各订阅者内部保持入队顺序，订阅者之间按入队顺序启动。
+
+    声明为内联的订阅者 (Subscriber.inline) 不创建 task，由 run_inline 直接同步驱动回调，
+    适用于计数、追加到内存等廉价回调。执行超过 inline_budget（默认超出一次即降级，
+    可调大 inline_strikes 以容忍偶发的 GC 停顿），或协程回调在执行中挂起时，
+    记录警告并将订阅者降级为 task 方式；已挂起的协程交给 task 继续运行。
+
+    Attributes:
+        max_in_flight: 全局在途回调上限
+        queue_size: 等待队列容量
+        overflow: 队列溢出策略
+        inline_budget: 内联回调单次执行的时间预算（秒）
+        inline_strikes: 连续超出预算多少次后降级
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 1024,
+        queue_size: int = 8192,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        inline_budget: Union[float, int] = 0.001,
+        inline_strikes: int = 1,
+    ):
+        """初始化执行器.
+
+        Args:
+            max_in_flight: 全局在途回调上限，默认 1024
+            queue_size: 等待队列容量，默认 8192
+            overflow: 队列溢出策略，默认阻塞发布者
+            inline_budget: 内联回调单次执行的时间预算（秒），默认 1ms
+            inline_strikes: 连续超出预算多少次后降级，默认 1（超出即降级）
+        """
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight 必须大于0")
+        if queue_size <= 0:
+            raise ValueError("queue_size 必须大于0")
+        if inline_budget <= 0:
+            raise ValueError("inline_budget 必须大于0")
+        if inline_strikes <= 0:
+            raise ValueError("inline_strikes 必须大于0")
+        self.max_in_flight = max_in_flight
+        self.queue_size = queue_size
+        self.overflow = OverflowPolicy(overflow)
+        self.inline_budget = inline_budget
+        self.inline_strikes = inline_strikes
+
+        # 各订阅者的等待队列：订阅者 -> deque[(入队序号, 事件)]
+        self._waiting: dict[Subscriber, deque[tuple[int, Event]]] = {}
+        # 就绪堆：(队首入队序号, 订阅者)，惰性删除，出堆时校验
+        self._ready: list[tuple[int, Subscriber]] = []
+        self._seq = count()
+        self._depth = 0
+        self._tasks: set[asyncio.Task] = set()
+        self._running: dict[Subscriber, int] = {}
+        self._overruns: dict[Subscriber, int] = {}  # 内联订阅者连续超出预算的次数
+        self._space = asyncio.Event()
+
+        # 指标
+        self._metrics = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "blocked": 0,
+            "dropped_oldest": 0,
+            "dropped_newest": 0,
+            "inline": 0,
+            "demoted": 0,
+        }
+
+    @property
+    def in_flight(self) -> int:
+        """当前在途回调数量."""
+        return len(self._tasks)
+
+    @property
+    def queue_depth(self) -> int:
+        """当前等待队列深度."""
+        return self._depth
+
+    async def submit(self, subscriber: Subscriber, event: Event) -> bool:
+        """提交一次订阅者回调.
+
+        内联订阅者直接同步执行；其余订阅者有空闲额度时立即以 task 方式运行，否则进入等待队列。
+
+        Args:
+            subscriber: 订阅者
+            event: 事件
+
+        Returns:
+            bool: 回调已运行或已入队返回 True，被丢弃返回 False
+        """
+        if subscriber.inline:
+            self.run_inline(subscriber, event)
+            return True
+        self._metrics["submitted"] += 1
+        if self._has_capacity(subscriber):
+            self._launch(subscriber, event)
+            return True
+
+        if self._depth >= self.queue_size:
+            if self.overflow == OverflowPolicy.DROP_NEWEST:
+                self._metrics["dropped_newest"] += 1
+                _log.debug(f"回调队列已满，丢弃 {subscriber.callback.__name__} 的事件 {event.id}")
+                return False
+            elif self.overflow == OverflowPolicy.DROP_OLDEST:
+                dropped, dropped_event = self._pop_oldest()
+                self._metrics["dropped_oldest"] += 1
+                _log.debug(f"回调队列已满，丢弃 {dropped.callback.__name__} 的事件 {dropped_event.id}")
+            else:
+                self._metrics["blocked"] += 1
+                while self._depth >= self.queue_size:
+                    self._space.clear()
+                    await self._space.wait()
+                # 等待期间额度可能已释放
+                if self._has_capacity(subscriber):
+                    self._launch(subscriber, event)
+                    return True
+
+        queue = self._waiting.get(subscriber)
+        if queue is None:
+            queue = self._waiting[subscriber] = deque()
+        queue.append((next(self._seq), event))
+        self._depth += 1
+        if len(queue) == 1:
+            self._mark_ready(subscriber)
+        return True
+
+    def run_inline(self, subscriber: Subscriber, event: Event) -> None:
+        """在当前调用中同步驱动回调，连续超出时间预算或挂起时降级为 task 方式.
+
+        回调抛出的异常记录后吞掉，不影响其他订阅者。
+
+        Args:
+            subscriber: 内联订阅者
+            event: 事件
+        """
+        self._metrics["submitted"] += 1
+        self._metrics["inline"] += 1
+        start = time.perf_counter()
+        coro = subscriber.callback(event)
+        try:
+            yielded = coro.send(None)
+        except StopIteration:
+            self._metrics["completed"] += 1
+        except Exception as e:
+            self._metrics["failed"] += 1
+            _log.error(f"执行订阅者回调时出错 (callback={subscriber.callback.__name__}): {e}")
+        else:
+            # 协程在等待其他对象，交给 task 继续运行
+            self._launch(subscriber, event, _resume(coro, yielded))
+            self._overruns.pop(subscriber, None)
+            self._demote(subscriber, "执行中挂起")
+            return
+        elapsed = time.perf_counter() - start
+        if elapsed <= self.inline_budget:
+            if self._overruns:
+                self._overruns.pop(subscriber, None)
+            return
+        overruns = self._overruns.get(subscriber, 0) + 1
+        if overruns < self.inline_strikes:
+            self._overruns[subscriber] = overruns
+            return
+        self._overruns.pop(subscriber, None)
+        reason = f"执行 {elapsed * 1000:.2f}ms 超出预算 {self.inline_budget * 1000:.2f}ms"
+        self._demote(subscriber, reason if overruns == 1 else f"{reason}（连续 {overruns} 次）")
+
+    def get_metrics(self) -> dict[str, Any]:
+        """获取执行器运行指标.
+
+        Returns:
+            dict[str, Any]: 在途数量、队列深度、提交/完成/失败/丢弃/内联/降级计数
+        """
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "queue_depth": self.queue_depth,
+            "queue_size": self.queue_size,
+            "overflow": self.overflow.value,
+            **self._metrics,
+        }
+
+    async def shutdown(self) -> None:
+        """清空等待队列并取消所有在途回调."""
+        self._waiting.clear()
+        self._ready.clear()
+        self._depth = 0
+        self._space.set()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _has_capacity(self, subscriber: Subscriber) -> bool:
+        """检查全局及订阅者自身是否还有并发额度."""
+        if len(self._tasks) >= self.max_in_flight:
+            return False
+        return self._own_capacity(subscriber)
+
+    def _own_capacity(self, subscriber: Subscriber) -> bool:
+        """检查订阅者自身是否还有并发额度."""
+        limit = subscriber.concurrency
+        return limit is None or self._running.get(subscriber, 0) < limit
+
+    def _mark_ready(self, subscriber: Subscriber) -> None:
+        """订阅者有等待回调且有自身额度时，以队首序号加入就绪堆."""
+        queue = self._waiting.get(subscriber)
+        if queue and self._own_capacity(subscriber):
+            heapq.heappush(self._ready, (queue[0][0], subscriber))
+
+    def _take(self, subscriber: Subscriber) -> Event:
+        """取出订阅者队首的等待回调."""
+        queue = self._waiting[subscriber]
+        _, event = queue.popleft()
+        if not queue:
+            del self._waiting[subscriber]
+        self._depth -= 1
+        return event
+
+    def _pop_oldest(self) -> tuple[Subscriber, Event]:
+        """取出全局最早入队的等待回调（只在队列溢出时调用）."""
+        subscriber = min(self._waiting, key=lambda s: self._waiting[s][0][0])
+        event = self._take(subscriber)
+        # 原队首在就绪堆中的记录已失效
+        self._mark_ready(subscriber)
+        return subscriber, event
+
+    def _demote(self, subscriber: Subscriber, reason: str) -> None:
+        """将内联订阅者降级为 task 方式."""
+        subscriber.inline = False
+        self._metrics["demoted"] += 1
+        _log.warning(f"内联订阅者 {subscriber.callback.__name__} {reason}，降级为 task 方式运行")
+
+    def _launch(self, subscriber: Subscriber, event: Event, coro: Optional[Coroutine] = None) -> None:
+        """以 task 方式运行回调并追踪."""
+        task = asyncio.create_task(coro or subscriber.callback(event))
+        self._tasks.add(task)
+        self._running[subscriber] = self._running.get(subscriber, 0) + 1
+        task.add_done_callback(lambda t: self._on_done(t, subscriber))
+
+    def _on_done(self, task: asyncio.Task, subscriber: Subscriber) -> None:
+        """回调结束：释放额度、记录异常并调度等待中的回调."""
+        self._tasks.discard(task)
+        count = self._running.get(subscriber, 1) - 1
+        if count:
+            self._running[subscriber] = count
+        else:
+            self._running.pop(subscriber, None)
+
+        if subscriber.concurrency is not None and subscriber in self._waiting:
+            # 释放了订阅者自身额度，其等待回调重新就绪（不限并发的订阅者始终在就绪堆中）
+            self._mark_ready(subscriber)
+
+        if task.cancelled():
+            pass
+        elif task.exception() is not None:
+            self._metrics["failed"] += 1
+            _log.error(
+                f"执行订阅者回调时出错 (callback={subscriber.callback.__name__}): {task.exception()}"
+            )
+        else:
+            self._metrics["completed"] += 1
+
+        self._drain()
+
+    def _drain(self) -> None:
+        """按入队顺序启动已就绪订阅者的等待回调."""
+        ready = self._ready
+        while ready and len(self._tasks) < self.max_in_flight:
+            seq, subscriber = heapq.heappop(ready)
+            queue = self._waiting.get(subscriber)
+            if not queue or queue[0][0] != seq or not self._own_capacity(subscriber):
+                # 过期记录：队首已被取走，或订阅者额度已满（释放额度时会重新加入）
+                continue
+            self._launch(subscriber, self._take(subscriber))
+            self._mark_ready(subscriber)
+        if self._depth < self.queue_size:
+            self._space.set()
+
+
+class _Resume:
+    """继续运行内联执行中已挂起的协程.
+
+    协程交出的对象（等待中的 future 或 None）原样交给外层 task，
+    task 恢复时再将结果或异常转发给协程。
+    """
+
+    def __init__(self, coro: Coroutine, yielded: Any):
+        self._coro = coro
+        self._yielded = yielded
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        value = self._yielded
+        while True:
+            try:
+                sent = yield value
+            except BaseException as e:
+                try:
+                    value = self._coro.throw(e)
+                except StopIteration as stop:
+                    return stop.value
+            else:
+                try:
+                    value = self._coro.send(sent)
+                except StopIteration as stop:
+                    return stop.value
+
+
+async def _resume(coro: Coroutine, yielded: Any) -> Any:
+    """以协程形式包装 _Resume，供 asyncio.create_task 使用."""
+    return await _Resume(coro, yielded)
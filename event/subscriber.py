@@ -1,39 +1,145 @@
-from typing import Callable, Coroutine, Any
-from dataclasses import dataclass
+from typing import Callable, Coroutine, Any, Optional, Union, Iterable
+from dataclasses import dataclass, field
 from logging import getLogger
 from uuid import UUID
-from base_cls import BaseType
+from base_cls import BaseType, BaseFilter
+from base_cls.base_filter import Predicate, split_index
 from .event import Event
 
 
 _log = getLogger(__name__)
 
 
-@dataclass
+@dataclass(eq=False)
 class Subscriber:
     """订阅者信息.
 
+    按对象身份比较和哈希，便于执行器按订阅者统计并发.
+
     Attributes:
         callback: 回调函数
-        status_filter: 状态过滤器
+        status_filter: 状态过滤器，或同一回调订阅的多个状态；多个状态在注册时
+            按作用域合并为位掩码，每个事件最多触发一次回调
+        concurrency: 该订阅者同时运行的回调上限，None 表示不限制
+        raw_filter: 原始数据字段过滤 {字段: 值或值的集合}，所有字段均匹配才接收事件，
+            None 表示不过滤；只对携带 raw 的事件生效
+        event_filter: 事件过滤器，注册时编译为单个谓词，None 表示不过滤；
+            其中的 FieldFilter 项拆出作为订阅组的倒排索引键，不再参与谓词求值
+        filter_reorder: 是否按实测开销与通过率重排事件过滤器的子过滤器
+        inline: 是否在发布时直接同步执行回调，执行器降级后置为 False
     """
     callback: Callable[[Event], Coroutine[Any, Any, None]]
-    status_filter: BaseType
+    status_filter: Union[BaseType, Iterable[BaseType]]
+    concurrency: Optional[int] = None
+    raw_filter: Optional[dict[str, Any]] = None
+    event_filter: Optional[BaseFilter] = None
+    filter_reorder: bool = False
+    inline: bool = False
+    _raw_filter: Optional[tuple[tuple[str, frozenset], ...]] = field(default=None, init=False, repr=False)
+    _predicate: Optional[Predicate] = field(default=None, init=False, repr=False)
+    _index: Optional[tuple[str, frozenset]] = field(default=None, init=False, repr=False)
+    _masks: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        if isinstance(self.status_filter, BaseType):
+            self._masks = {self.status_filter.scope: self.status_filter.mask}
+        else:
+            self.status_filter = frozenset(self.status_filter)
+            if not self.status_filter:
+                raise ValueError("至少需要订阅一个状态")
+            if len(self.status_filter) == 1:
+                self.status_filter, = self.status_filter
+                self._masks = {self.status_filter.scope: self.status_filter.mask}
+            else:
+                # 作用域 -> 订阅的状态位掩码
+                for status in self.status_filter:
+                    self._masks[status.scope] = self._masks.get(status.scope, 0) | status.mask
+        # 预先将期望值统一为 frozenset，匹配时只需一次成员判断
+        if self.raw_filter is not None:
+            self._raw_filter = tuple(
+                (key, frozenset(expected) if isinstance(expected, (list, tuple, set, frozenset)) else frozenset((expected,)))
+                for key, expected in self.raw_filter.items()
+            )
+        index, rest = split_index(self.event_filter)
+        if index is not None:
+            self._index = (index.field, index.values)
+        if rest is not None:
+            self._predicate = rest.compile(reorder=self.filter_reorder)
+
+    @property
+    def statuses(self) -> tuple[BaseType, ...]:
+        """订阅的所有状态."""
+        if isinstance(self.status_filter, BaseType):
+            return (self.status_filter,)
+        return tuple(self.status_filter)
+
+    def matches_status(self, status: BaseType) -> bool:
+        """检查事件状态是否属于订阅的状态（一次按位与）."""
+        return bool(self._masks.get(status.scope, 0) & status.mask)
+
+    def accepts(self, raw: dict[str, Any]) -> bool:
+        """检查原始数据是否满足 raw_filter.
+
+        Args:
+            raw: 原始数据
+
+        Returns:
+            bool: 未设置 raw_filter 或所有字段均匹配时返回 True
+        """
+        if self._raw_filter is None:
+            return True
+        for key, expected in self._raw_filter:
+            if raw.get(key) not in expected:
+                return False
+        return True
+
+    def admits(self, event: Event) -> bool:
+        """检查事件是否通过 event_filter 中未建立索引的部分.
+
+        索引部分（字段相等条件）已由 SubscriberGroup.match 保证。
+
+        Args:
+            event: 事件
+
+        Returns:
+            bool: 无剩余过滤条件或编译后的谓词通过时返回 True
+        """
+        return self._predicate is None or self._predicate(event)
+
+
+# 倒排索引：字段 -> 字段值 -> 订阅者列表
+FieldIndex = dict[str, dict[Any, list[Subscriber]]]
 
 
 class SubscriberGroup:
     """订阅组类，管理一类订阅者.
 
-    负责存储同一类订阅者。
+    负责存储同一类订阅者，并在注册时预先建立分发索引：
+    精确状态订阅者按 (uuid, status) 归档，通配符订阅者按 (uuid, scope) 归档，
+    发布时只需两次字典查找，无需逐个调用 BaseType.matches。
+    订阅多个状态的订阅者按作用域位掩码展开为具体状态，逐个归档到精确状态索引，
+    发布时同样只需一次字典查找，且同一事件只会命中一次。
+    带字段相等过滤（FieldFilter）的订阅者另按 字段 -> 值 建立倒排索引，
+    发布时按事件数据的字段值查找，订阅者数量增加不会增加未命中订阅者的过滤开销。
 
     Attributes:
         _subscribers: 订阅者存储字典 dict[UUID, list[Subscriber]]
+        _exact: 精确状态索引 dict[(UUID, BaseType), list[Subscriber]]
+        _wildcard: 通配符索引 dict[(UUID, scope), list[Subscriber]]
+        _exact_keyed: 精确状态的字段倒排索引 dict[(UUID, BaseType), FieldIndex]
+        _wildcard_keyed: 通配符的字段倒排索引 dict[(UUID, scope), FieldIndex]
     """
 
     def __init__(self):
         """初始化订阅组."""
         # 维护一个id - Subscriber 列表的键值对
         self._subscribers: dict[UUID, list[Subscriber]] = {}
+        # 分发索引
+        self._exact: dict[tuple[UUID, BaseType], list[Subscriber]] = {}
+        self._wildcard: dict[tuple[UUID, str], list[Subscriber]] = {}
+        # 字段倒排索引
+        self._exact_keyed: dict[tuple[UUID, BaseType], FieldIndex] = {}
+        self._wildcard_keyed: dict[tuple[UUID, str], FieldIndex] = {}
 
     def add(self, uuid: UUID, subscriber: Subscriber) -> None:
         """添加订阅者到指定发布器.
@@ -47,6 +153,29 @@ class SubscriberGroup:
             self._subscribers[uuid] = []
         self._subscribers[uuid].append(subscriber)
 
+        status = subscriber.status_filter
+        if not isinstance(status, BaseType):
+            # 按位掩码展开为具体状态（通配符已在掩码中覆盖作用域内全部状态）
+            for cls in {type(s) for s in status}:
+                for member in cls:
+                    if not member.is_wildcard and subscriber.matches_status(member):
+                        self._file(subscriber, (uuid, member), self._exact, self._exact_keyed)
+        elif status.is_wildcard:
+            self._file(subscriber, (uuid, status.scope), self._wildcard, self._wildcard_keyed)
+        else:
+            self._file(subscriber, (uuid, status), self._exact, self._exact_keyed)
+
+    @staticmethod
+    def _file(subscriber: Subscriber, key: tuple, plain: dict, keyed: dict) -> None:
+        """将订阅者归档到分发索引，带字段索引的订阅者归档到倒排索引."""
+        if subscriber._index is None:
+            plain.setdefault(key, []).append(subscriber)
+            return
+        field_name, values = subscriber._index
+        table = keyed.setdefault(key, {}).setdefault(field_name, {})
+        for value in values:
+            table.setdefault(value, []).append(subscriber)
+
     @property
     def uids(self) -> list[UUID]:
         """获取所有订阅的发布器列表."""
@@ -55,3 +184,75 @@ class SubscriberGroup:
     def get_subscriber(self, uuid: UUID) -> list[Subscriber]:
         """获取对应发布器的所有订阅者."""
         return self._subscribers.get(uuid, [])
+
+    def match(self, uuid: UUID, status: BaseType, data: Any = None) -> list[Subscriber]:
+        """获取对应发布器中与事件状态匹配的订阅者.
+
+        无字段索引的订阅者与对 get_subscriber 逐个调用 status.matches 等价，
+        精确状态（含多状态）订阅者在前，通配符订阅者在后；
+        传入 data 时再按字段值查找倒排索引，命中的订阅者追加在后。
+
+        Args:
+            uuid: 发布器的唯一标识符
+            status: 事件状态
+            data: 事件数据，None 表示不查找字段索引
+
+        Returns:
+            匹配的订阅者列表
+        """
+        exact = self._exact.get((uuid, status))
+        wildcard = self._wildcard.get((uuid, status.scope))
+        if exact is None:
+            result = wildcard or []
+        elif wildcard is None:
+            result = exact
+        else:
+            result = exact + wildcard
+        if data is None or not (self._exact_keyed or self._wildcard_keyed):
+            return result
+        for keyed in (self._exact_keyed.get((uuid, status)), self._wildcard_keyed.get((uuid, status.scope))):
+            if keyed is None:
+                continue
+            for field_name, table in keyed.items():
+                try:
+                    hit = table.get(getattr(data, field_name, None))
+                except TypeError:
+                    # 字段值不可哈希
+                    continue
+                if hit:
+                    result = result + hit
+        return result
+
+    def has_keyed(self, uuid: UUID, status: BaseType) -> bool:
+        """检查是否存在与事件状态匹配、带字段索引的订阅者."""
+        return (uuid, status) in self._exact_keyed or (uuid, status.scope) in self._wildcard_keyed
+
+    def match_raw(self, uuid: UUID, status: BaseType, raw: dict[str, Any]) -> list[Subscriber]:
+        """按原始数据查找字段索引，用于构造事件数据之前的预过滤.
+
+        原始数据缺少索引字段时无法判断，该字段下的所有订阅者均视为命中。
+
+        Args:
+            uuid: 发布器的唯一标识符
+            status: 事件状态
+            raw: 原始数据
+
+        Returns:
+            可能匹配的带字段索引的订阅者列表
+        """
+        result: list[Subscriber] = []
+        for keyed in (self._exact_keyed.get((uuid, status)), self._wildcard_keyed.get((uuid, status.scope))):
+            if keyed is None:
+                continue
+            for field_name, table in keyed.items():
+                if field_name not in raw:
+                    for subscribers in table.values():
+                        result.extend(subscribers)
+                    continue
+                try:
+                    hit = table.get(raw[field_name])
+                except TypeError:
+                    continue
+                if hit:
+                    result.extend(hit)
+        return result
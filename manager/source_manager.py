@@ -1,11 +1,11 @@
 from uuid import UUID
-from typing import Type, Callable, Coroutine, Any, Optional
+from typing import Type, Callable, Coroutine, Any, Optional, Iterable, Union
 from logging import getLogger
 import asyncio
 
 from .context import RuntimeConfig, APIContext, AppContext
-from event import EventBus, Event
-from base_cls import BaseSource, BaseSourceT, BaseType, BaseApiT
+from event import EventBus, Event, DispatchExecutor
+from base_cls import BaseSource, BaseSourceT, BaseType, BaseApiT, BaseFilter
 
 
 _log = getLogger(__name__)
@@ -21,16 +21,17 @@ class SourceManager:
         sources: 事件源集合
     """
 
-    def __init__(self, config: RuntimeConfig):
+    def __init__(self, config: RuntimeConfig, executor: Optional[DispatchExecutor] = None):
         """初始化 SourceManager.
 
         Args:
             config: 运行时配置
+            executor: 事件总线的回调执行器，默认使用 DispatchExecutor 的默认配置
         """
         # 核心对象
         self._config = config
         self._api_ctx = APIContext(config)
-        self._bus = EventBus()
+        self._bus = EventBus(executor)
 
         # AppContext 统一注入对象
         self._ctx = AppContext(
@@ -152,7 +153,12 @@ class SourceManager:
     def subscribe(
         self,
         source_id: UUID,
-        status: BaseType
+        status: Union[BaseType, Iterable[BaseType]],
+        concurrency: Optional[int] = None,
+        raw_filter: Optional[dict[str, Any]] = None,
+        event_filter: Optional[BaseFilter] = None,
+        filter_reorder: bool = False,
+        inline: bool = False
     ) -> Callable:
         """装饰器：订阅事件.
 
@@ -160,7 +166,12 @@ class SourceManager:
 
         Args:
             source_id: 事件源的 UUID
-            status: 状态过滤器
+            status: 状态过滤器，或多个状态的集合（每个事件最多触发一次回调）
+            concurrency: 该订阅者同时运行的回调上限，None 表示不限制
+            raw_filter: 原始数据字段过滤 {字段: 值或值的集合}，None 表示不过滤
+            event_filter: 事件过滤器，注册时编译为单个谓词，None 表示不过滤
+            filter_reorder: 是否按实测开销与通过率重排 event_filter 的子过滤器
+            inline: 是否在发布时直接同步执行回调（可为同步函数），连续超出时间预算时自动降级为 task 方式
 
         Returns:
             装饰器函数
@@ -170,13 +181,18 @@ class SourceManager:
             async def on_new_dynamic(event: Event):
                 print(event)
         """
-        return self._bus.subscribe(source_id, status)
+        return self._bus.subscribe(source_id, status, concurrency, raw_filter, event_filter, filter_reorder, inline)
 
     def add_subscriber(
         self,
         source_id: UUID,
         callback: Callable[[Event], Coroutine[Any, Any, None]],
-        status: BaseType
+        status: Union[BaseType, Iterable[BaseType]],
+        concurrency: Optional[int] = None,
+        raw_filter: Optional[dict[str, Any]] = None,
+        event_filter: Optional[BaseFilter] = None,
+        filter_reorder: bool = False,
+        inline: bool = False
     ) -> None:
         """添加订阅者.
 
@@ -185,9 +201,14 @@ class SourceManager:
         Args:
             source_id: 事件源的 UUID
             callback: 回调函数
-            status: 状态过滤器
+            status: 状态过滤器，或多个状态的集合（每个事件最多触发一次回调）
+            concurrency: 该订阅者同时运行的回调上限，None 表示不限制
+            raw_filter: 原始数据字段过滤 {字段: 值或值的集合}，None 表示不过滤
+            event_filter: 事件过滤器，注册时编译为单个谓词，None 表示不过滤
+            filter_reorder: 是否按实测开销与通过率重排 event_filter 的子过滤器
+            inline: 是否在发布时直接同步执行回调（可为同步函数），连续超出时间预算时自动降级为 task 方式
         """
-        self._bus.add_subscriber(source_id, callback, status)
+        self._bus.add_subscriber(source_id, callback, status, concurrency, raw_filter, event_filter, filter_reorder, inline)
 
     # ============ 生命周期 ============ #
 
@@ -230,6 +251,7 @@ class SourceManager:
         生命周期顺序：
         1. 停止所有 source
         2. 取消所有任务
+        3. 取消事件总线中未完成的订阅者回调
         """
         if not self._running:
             _log.warning("SourceManager 未在运行")
@@ -255,6 +277,7 @@ class SourceManager:
                     pass
 
         self._tasks.clear()
+        await self._bus.shutdown()
         self._running = False
         _log.info("SourceManager 已停止")
 
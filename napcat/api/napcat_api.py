@@ -1,5 +1,4 @@
 import asyncio
-import json
 from typing import Optional, Any, Callable, Awaitable
 from logging import getLogger
 from dataclasses import dataclass
@@ -7,7 +6,7 @@ from uuid import uuid4
 
 from manager.context import APIContext
 from base_cls import BaseApi
-from utils import AsyncWebSocketClient, MessageType, ListenerId
+from utils import AsyncWebSocketClient, MessageType, ListenerId, SendPriority, get_codec
 
 _log = getLogger("NapcatApi")
 
@@ -85,10 +84,17 @@ class NapcatClient:
             headers=headers or {},
             heartbeat=heartbeat,
             reconnect_attempts=reconnect_attempts,
-            receive_timeout=receive_timeout
+            receive_timeout=receive_timeout,
+            codec=get_codec()
         )
         self._task: Optional[asyncio.Task] = None
         self._listener_id: Optional[ListenerId] = None
+        # 停止标志：取消与 wait_for 的完成同时发生时取消可能被吞掉（Python 3.11），由循环自行检查退出
+        self._stopping = False
+        # 等待响应的请求：echo -> Future，由接收拦截器在接收循环内直接分发，
+        # 不经过事件处理循环，事件处理因发布背压阻塞时（如在订阅者回调中发送请求）也能收到响应
+        self._pending: dict[str, asyncio.Future] = {}
+        self.client.set_interceptor(self._intercept_response)
 
     def set_handler(self, handler: Callable[[dict[str, Any]], Awaitable[None]]):
         """设置消息处理函数
@@ -105,12 +111,14 @@ class NapcatClient:
         if not self._handler:
             raise RuntimeError("消息处理函数未设置，请先调用 set_handler() 设置处理函数")
         await self.client.start()
+        self._stopping = False
         self._listener_id = await self.client.create_listener()
         self._task = asyncio.create_task(self._process_messages())
         _log.info(f"Napcat client started with listener: {self._listener_id}")
 
     async def stop(self):
         """停止客户端"""
+        self._stopping = True
         if self._task and not self._task.done():
             try:
                 self._task.cancel()
@@ -122,45 +130,72 @@ class NapcatClient:
         if self._listener_id:
             await self.client.remove_listener(self._listener_id)
 
+        # 取消所有等待响应的请求
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+
         await self.client.stop()
         _log.info("Napcat client stopped")
 
     async def send_request(self, message: dict) -> Optional[dict]:
         """发送请求到服务器
 
+        响应在接收循环内按 echo 分发，不再为每个请求创建监听器，也不依赖消息处理循环。
+
         Args:
             message: 请求内容，Dict
+
+        Returns:
+            Optional[dict]: 带有相同 echo 的响应
+
+        Raises:
+            ConnectionError: 客户端未运行时抛出
+            asyncio.TimeoutError: 超过 receive_timeout 仍未收到响应时抛出
         """
         _log.debug(f"Sent message: {message}")
         echo = str(uuid4())
         message["echo"] = echo
-        listener_id = None
+        future = asyncio.get_running_loop().create_future()
+        self._pending[echo] = future
 
         try:
-            listener_id = await self.client.create_listener()
-            await self.client.send(message)
+            await self.client.send(message, SendPriority.High)
             _log.debug(f"发送请求{echo}")
-
-            while True:
-                #  等待响应，直到收到带有相同 echo 的消息
-                message, t = await self._get_message(listener_id)
-                match t:
-                    case MessageType.Text:
-                        try:
-                            results: dict = json.loads(message)
-                        except json.JSONDecodeError as e:
-                            _log.error(f"解析错误: {e}")
-                            return None
-                        if results.get("echo") == echo:
-                            return results
-                    case _:
-                        _log.debug(f"未知类型返回: {t}, 内容: {message}")
-                        return None
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            _log.warning(f"请求 {echo} 等待响应超时")
+            raise
         except asyncio.CancelledError:
             _log.debug(f"请求 {echo} 被取消")
             raise
         finally:
-            _ = await self.client.remove_listener(listener_id) if listener_id is not None else None
+            self._pending.pop(echo, None)
+
+    def _intercept_response(self, message: Any, msg_type: MessageType) -> bool:
+        """接收拦截器：带有 echo 的消息是请求的响应，直接分发给等待中的请求
+
+        Returns:
+            bool: 消息是响应并已消费返回 True
+        """
+        if msg_type != MessageType.Json or not isinstance(message, dict) or not message.get("echo", 0):
+            return False
+        self._resolve_response(message)
+        return True
+
+    def _resolve_response(self, data: dict) -> None:
+        """将带有 echo 的响应交给对应的等待请求
+
+        Args:
+            data: 已解析的响应
+        """
+        future = self._pending.pop(str(data["echo"]), None)
+        if future is None:
+            _log.debug(f"未找到响应 {data['echo']} 对应的请求（可能已超时）")
+            return
+        if not future.done():
+            future.set_result(data)
 
     async def _get_message(self, listener_id: Optional[ListenerId] = None) -> tuple[Any, MessageType]:
         """获取一条消息（阻塞）
@@ -175,24 +210,22 @@ class NapcatClient:
         _log.info("Started processing messages")
 
         try:
-            while self.client.running:
+            while self.client.running and not self._stopping:
                 try:
                     message, msg_type = await self._get_message()
 
-                    if msg_type == MessageType.Text:
-                        # 解析 JSON 消息
+                    if msg_type == MessageType.Json:
+                        # 消息已由客户端解码器解析，各监听器共享同一对象
                         try:
-                            data: dict = json.loads(message)
-                            if data.get("echo", 0):
-                                # 跳过带有 echo 的消息，这些是请求的响应，不需要处理
-                                continue
+                            data: dict = message
                             _log.debug(data)
                             # noinspection PyCallingNonCallable
                             await self._handler(data)  # post_type: ignore (运行时设置 handler)
-                        except json.JSONDecodeError:
-                            _log.error(f"Failed to parse message: {message}")
                         except Exception as e:
                             _log.error(f"Handler error: {e}")
+                    elif msg_type == MessageType.Text:
+                        # 解码器无法解析的文本消息
+                        _log.error(f"Failed to parse message: {message}")
                     elif msg_type == MessageType.Close:
                         _log.warning("Received close message")
                         break
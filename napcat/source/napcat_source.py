@@ -28,27 +28,54 @@ class NapcatSource(BaseSource):
         """
         super().__init__()
         self.config_key = config_key
+        # 指标
+        self._metrics = {
+            "received": 0,
+            "published": 0,
+            "skipped_no_subscriber": 0,
+            "skipped_raw_filter": 0,
+            "parse_errors": 0,
+        }
 
     async def _process_messages(self, message: dict[str, Any]) -> None:
-        """处理接收到的消息."""
+        """处理接收到的消息.
+
+        构造事件数据之前先询问 EventBus：无人订阅该状态、
+        或所有订阅者的 raw_filter 都不匹配的消息直接丢弃，不做 pydantic 校验。
+        """
+        self._metrics["received"] += 1
         post_type = message.get("post_type", "")
         napcat_type = NapcatType.get_type(post_type)
         event: Optional[Event] = None
 
+        bus = self.ctx.bus
+        if not bus.has_subscribers(self.uuid, napcat_type):
+            self._metrics["skipped_no_subscriber"] += 1
+            return
+        if not bus.accepts_raw(self.uuid, napcat_type, message):
+            self._metrics["skipped_raw_filter"] += 1
+            return
+
         try:
             # 使用 BaseDataModel 的自动分发构造
             napcat_event = NapcatEvent.from_dict(message)
 
             if napcat_type.matches(NapcatType.ALL):
-                event = Event(data=napcat_event, status=napcat_type)
+                event = Event(data=napcat_event, status=napcat_type, raw=message)
             else:
                 _log.warning("未处理的消息类型: %s", napcat_type)
         except Exception as e:
+            self._metrics["parse_errors"] += 1
             _log.error("解析消息失败: %s, 原始消息: %s", e, message)
             return
 
         if event is not None:
-            await self.ctx.bus.publish(self.uuid, event)
+            self._metrics["published"] += 1
+            await bus.publish(self.uuid, event)
+
+    def get_metrics(self) -> dict[str, int]:
+        """获取事件源指标（接收、发布、各类跳过及解析失败的消息数量）."""
+        return dict(self._metrics)
 
     async def start(self) -> None:
         self.api.set_handler(self._process_messages)
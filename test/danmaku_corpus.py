@@ -0,0 +1,140 @@
+"""弹幕原始帧语料（固定随机种子，可重复生成）
+
+按 B 站直播弹幕服务器推送的结构构造 DANMU_MSG / SEND_GIFT / GUARD_BUY 原始帧，
+mutate 生成字段类型或结构异常的帧，用于覆盖快速解析路径的 all_type 回退规则。
+"""
+import copy
+import random
+from typing import Callable
+
+ROOM_DISPLAY_ID = 21452505
+ROOM_REAL_ID = 21452505
+WORDS = ["哈哈哈哈", "来了", "草", "主播好", "？？？", "666", "晚上好", "好耶", "这也行", "awsl", "下次一定", "前方高能"]
+
+
+def msg(rng: random.Random, room_display_id: int = ROOM_DISPLAY_ID) -> dict:
+    """构造一条 DANMU_MSG 原始帧（约 70% 带粉丝牌，80% 带头像）."""
+    uid = rng.randint(1, 10 ** 9)
+    medal = [
+        rng.randint(1, 30), rng.choice(["粉丝团", "小鱼干", "舰长团"]), rng.choice(["主播A", "主播B"]),
+        rng.randint(1, 10 ** 8), 6067854, "", 0, 6809855, 398668, 6850801, 0, rng.choice([0, 1]), rng.randint(1, 10 ** 9),
+    ] if rng.random() < 0.7 else []
+    user = {"uid": uid, "base": {"name": "用户%d" % (uid % 100000), "face": "https://i0.hdslb.com/bfs/face/%d.jpg" % (uid % 5000)}}
+    detail = [0, 1, 25, 16777215, 1700000000000, 0, 0, "x", 0, 0, 0, "", 0, "{}", "{}",
+              {"user": user} if rng.random() < 0.8 else {}, {}]
+    info = [
+        detail,
+        rng.choice(WORDS) if rng.random() < 0.6 else "弹幕内容%d" % rng.randint(0, 999),
+        [uid, "用户%d" % (uid % 100000), 0, 0, 0, 10000, 1, ""],
+        medal,
+        [rng.randint(0, 60), 0, 9868950, ">50000", 0],
+        ["", ""], 0, 0, None,
+        {"ts": 1700000000 + rng.randint(0, 86400), "ct": "AB"},
+        {"mode": 0, "show_player_type": 0}, {}, None, None, None, None, [], [],
+    ]
+    return {"room_display_id": room_display_id, "room_real_id": ROOM_REAL_ID, "type": "DANMU_MSG",
+            "data": {"cmd": "DANMU_MSG", "info": info}}
+
+
+def gift(rng: random.Random, room_display_id: int = ROOM_DISPLAY_ID) -> dict:
+    """构造一条 SEND_GIFT 原始帧（约 60% 带粉丝牌，20% 为盲盒礼物）."""
+    paid = rng.random() < 0.4
+    num = rng.randint(1, 99)
+    price = 100 if paid else 0
+    data = {
+        "giftId": 31036 if paid else 1, "giftName": "小花花" if paid else "辣条", "num": num, "price": price,
+        "total_coin": price * num, "coin_type": "gold" if paid else "silver", "action": "投喂",
+        "uid": rng.randint(1, 10 ** 9), "uname": "用户%d" % rng.randint(0, 99999), "face": "https://i0.hdslb.com/bfs/face/f.jpg",
+        "guard_level": rng.choice([0, 0, 0, 3]), "wealth_level": rng.randint(0, 40), "timestamp": 1700000000 + rng.randint(0, 86400),
+        "is_first": rng.choice([True, False]), "combo_total_coin": price * num,
+        "batch_combo_id": "batch:gift:combo_id:%d" % rng.randint(1, 9),
+        "receiver_uinfo": {"uid": 99, "base": {"name": "主播", "face": "https://a", "official_info": {"title": "认证"}}},
+        "gift_info": {"img_basic": "https://img", "gif": "https://gif", "webp": "https://webp"},
+    }
+    if rng.random() < 0.6:
+        data["medal_info"] = {"medal_level": rng.randint(1, 30), "medal_name": "粉丝团", "anchor_roomid": ROOM_REAL_ID,
+                              "anchor_uname": "主播", "guard_level": 0, "is_lighted": 1, "target_id": 99}
+    if rng.random() < 0.2:
+        data["blind_gift"] = {"blind_gift_config_id": 1, "original_gift_id": 2, "original_gift_name": "盲盒",
+                              "original_gift_price": 500, "gift_action": "爆出", "gift_tip_price": 1000}
+    return {"room_display_id": room_display_id, "room_real_id": ROOM_REAL_ID, "data": {"cmd": "SEND_GIFT", "data": data}}
+
+
+def guard(rng: random.Random, room_display_id: int = ROOM_DISPLAY_ID) -> dict:
+    """构造一条 GUARD_BUY 原始帧."""
+    level = rng.choice([1, 2, 3])
+    return {"room_display_id": room_display_id, "room_real_id": ROOM_REAL_ID, "data": {"cmd": "GUARD_BUY", "data": {
+        "uid": rng.randint(1, 10 ** 9), "username": "用户%d" % rng.randint(0, 99999), "guard_level": level, "num": 1,
+        "price": {1: 19998000, 2: 1998000, 3: 198000}[level], "gift_id": 10000 + level,
+        "gift_name": {1: "总督", 2: "提督", 3: "舰长"}[level], "start_time": 1700000000, "end_time": 1700000000,
+    }}}
+
+
+def _odd(rng: random.Random, value):
+    """同一值的非常规类型：数字字符串、bool、float、None."""
+    if type(value) is int:
+        return rng.choice([str(value), bool(value % 2), float(value), None])
+    if type(value) is str:
+        return rng.choice([123, None, value.encode()])
+    if type(value) is bool:
+        return rng.choice([int(value), str(value).lower()])
+    return None
+
+
+def mutate(rng: random.Random, frame: dict) -> dict:
+    """随机改动一处字段的类型或结构."""
+    frame = copy.deepcopy(frame)
+    if rng.random() < 0.1:
+        # 房间号类型异常
+        key = rng.choice(["room_display_id", "room_real_id"])
+        frame[key] = _odd(rng, frame[key])
+        return frame
+    if "info" in frame["data"]:
+        info = frame["data"]["info"]
+        k = rng.randrange(10)
+        if k == 0:
+            info[2][0] = _odd(rng, info[2][0])  # uid
+        elif k == 1:
+            info[2][1] = _odd(rng, info[2][1])  # 用户名
+        elif k == 2:
+            info[1] = _odd(rng, info[1])  # 弹幕内容
+        elif k == 3:
+            info[9] = rng.choice([None, [], {"ts": "1700000000"}, {}])  # 时间戳
+        elif k == 4:
+            info[3] = info[3][:rng.randint(1, 12)] or [1]  # 截断的粉丝牌
+        elif k == 5 and info[3]:
+            i = rng.choice([0, 1, 2, 3, 11, 12])
+            info[3][i] = _odd(rng, info[3][i])
+        elif k == 6:
+            del info[rng.randint(2, 10):]  # 截断的 info
+        elif k == 7:
+            info[0] = info[0][:rng.randint(0, 15)]  # 缺少用户详情
+        elif k == 8 and len(info[0]) > 15 and info[0][15]:
+            info[0][15]["user"]["base"]["face"] = _odd(rng, "x")
+        else:
+            info[4][0] = _odd(rng, info[4][0])  # 用户等级
+        return frame
+    data = frame["data"]["data"]
+    nested = [key for key in ("medal_info", "blind_gift", "receiver_uinfo", "gift_info") if key in data]
+    if nested and rng.random() < 0.3:
+        sub = data[rng.choice(nested)]
+        key = rng.choice(list(sub))
+        sub[key] = _odd(rng, sub[key])
+    elif rng.random() < 0.1:
+        del data[rng.choice(list(data))]
+    else:
+        key = rng.choice(list(data))
+        data[key] = _odd(rng, data[key])
+    return frame
+
+
+GENERATORS: dict[str, Callable[[random.Random], dict]] = {"msg": msg, "gift": gift, "guard": guard}
+
+
+def corpus(kind: str, good: int = 2000, bad: int = 500, seed: int = 1) -> list[dict]:
+    """生成 good 条正常帧与 bad 条异常帧."""
+    rng = random.Random(seed)
+    generate = GENERATORS[kind]
+    frames = [generate(rng) for _ in range(good)]
+    frames += [mutate(rng, generate(rng)) for _ in range(bad)]
+    return frames
@@ -0,0 +1,111 @@
+"""弹幕快速解析路径一致性检查与吞吐基准
+
+语料见 danmaku_corpus.py：每类 2000 条正常帧 + 500 条字段类型或结构异常的帧。
+- 检查：DanmakuMsgData / DanmakuGiftData / DanmakuGuardData.from_raw（含使用驻留器时）
+  与 DTO 路径（XxxDTO.from_raw -> from_dto）结果一致（逐字段比较值与类型），异常帧抛出相同类型的异常；
+  同时统计异常帧中经 all_type 判定回退到 DTO 路径的数量
+- 基准：两条路径在正常帧上的吞吐（条/秒）
+
+语料摘要固定在 CORPUS_DIGEST 中，修改生成规则时需同步更新。
+
+运行: python test/danmaku_decode_parity.py
+"""
+import dataclasses
+import hashlib
+import logging
+
+from harness import run, per_item
+from danmaku_corpus import corpus
+from bilibili.data import DanmakuMsgData, DanmakuGiftData, DanmakuGuardData, DanmakuInterner
+from bilibili.data.dto import DanmakuMsgDTO, DanmakuGiftDTO, DanmakuGuardDTO
+
+KINDS = {
+    "msg": (DanmakuMsgDTO, DanmakuMsgData),
+    "gift": (DanmakuGiftDTO, DanmakuGiftData),
+    "guard": (DanmakuGuardDTO, DanmakuGuardData),
+}
+CORPUS_DIGEST = {
+    "msg": "e77e629f02bb574f",
+    "gift": "ef43dbcc1fcdcf67",
+    "guard": "cd0291054c5d20e0",
+}
+
+
+def typed(value):
+    """连同类型展开数据，使 True 与 1、"1" 与 1 不再相等."""
+    if dataclasses.is_dataclass(value):
+        return type(value), tuple(typed(getattr(value, f.name)) for f in dataclasses.fields(value))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(typed(v) for v in value)
+    return type(value), value
+
+
+def outcome(parse, raw: dict):
+    try:
+        return typed(parse(raw))
+    except Exception as e:
+        return type(e)
+
+
+def dto_path(dto, data):
+    def parse(raw: dict):
+        parsed = dto.from_raw(raw)
+        return data.from_dto(parsed) if parsed is not None else None
+    return parse
+
+
+def digest(frames: list[dict]) -> str:
+    return hashlib.sha1(repr(frames).encode()).hexdigest()[:16]
+
+
+def check_parity(kind: str) -> tuple[int, int]:
+    """返回 (不一致的帧数, 异常帧中回退到 DTO 路径的数量)."""
+    dto, data = KINDS[kind]
+    frames = corpus(kind)
+    expected = CORPUS_DIGEST[kind]
+    assert digest(frames) == expected, f"{kind} 语料已变化: {digest(frames)}"
+    reference = dto_path(dto, data)
+    interner = DanmakuInterner(64, 256)
+    fallbacks = 0
+    original = data._from_raw_dto.__func__
+
+    def counting(cls, raw):
+        nonlocal fallbacks
+        fallbacks += 1
+        return original(cls, raw)
+
+    mismatches = 0
+    data._from_raw_dto = classmethod(counting)
+    try:
+        for i, raw in enumerate(frames):
+            if i == 2000:
+                fallbacks = 0  # 只统计异常帧
+            want = outcome(reference, raw)
+            if outcome(data.from_raw, raw) != want:
+                mismatches += 1
+            counted = fallbacks
+            if outcome(lambda r: data.from_raw(r, interner), raw) != want:
+                mismatches += 1
+            fallbacks = counted
+    finally:
+        del data._from_raw_dto
+    return mismatches, fallbacks
+
+
+def throughput(parse, frames: list[dict]) -> float:
+    return 1 / per_item(parse, frames)
+
+
+def main() -> None:
+    for kind, (dto, data) in KINDS.items():
+        mismatches, fallbacks = check_parity(kind)
+        print(f"{kind:5s} corpus {digest(corpus(kind))}: {mismatches} mismatches / 2500 frames, "
+              f"{fallbacks}/500 mutated frames fell back to the DTO path")
+        assert mismatches == 0
+        clean = corpus(kind, good=20000, bad=0, seed=2)
+        print(f"      dto  {throughput(dto_path(dto, data), clean):10,.0f} msgs/s")
+        print(f"      fast {throughput(data.from_raw, clean):10,.0f} msgs/s")
+
+
+if __name__ == '__main__':
+    run(main, logging.CRITICAL)
@@ -0,0 +1,91 @@
+"""DanmakuInterner 命中率与内存基准
+
+回放一个热门房间的弹幕流：3000 名观众中 300 名活跃用户贡献约 70% 的弹幕，
+每名用户的用户名、头像与粉丝牌固定，约 70% 的用户佩戴粉丝牌。
+录制的 5000 帧原始文本循环回放，每帧都经 json.loads 重新解码（与实际接收一致），
+在内存中保留全部 DanmakuMsgData，对比使用与不使用驻留器时的内存占用。
+
+- 检查：使用驻留器时解析结果与不使用时一致
+- 基准：各驻留池命中率、保留的内存（tracemalloc）与解析吞吐
+
+运行: python test/danmaku_intern_bench.py [数量]
+"""
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from typing import Optional
+
+from harness import run, per_item
+from danmaku_corpus import ROOM_DISPLAY_ID, ROOM_REAL_ID, WORDS
+from bilibili.data import DanmakuMsgData, DanmakuInterner
+
+
+def record_room(frames: int = 5000, audience: int = 3000, core: int = 300, seed: int = 7) -> list[str]:
+    """录制一段房间弹幕流，返回原始帧文本."""
+    rng = random.Random(seed)
+    users = [
+        (rng.randint(1, 10 ** 9), "用户_%06d" % i, "https://i0.hdslb.com/bfs/face/%032x.jpg" % rng.getrandbits(128))
+        for i in range(audience)
+    ]
+    medals = [
+        [rng.randint(1, 30), "粉丝团%d" % (i % 40), "主播%d" % (i % 40), rng.randint(1, 10 ** 8),
+         6067854, "", 0, 6809855, 398668, 6850801, 0, 1, rng.randint(1, 10 ** 6)]
+        for i in range(audience)
+    ]
+    texts = []
+    for n in range(frames):
+        i = rng.randrange(core) if rng.random() < 0.7 else rng.randrange(audience)
+        uid, name, face = users[i]
+        detail = [0, 1, 25, 16777215, 1700000000000, 0, 0, "x", 0, 0, 0, "", 0, "{}", "{}",
+                  {"user": {"uid": uid, "base": {"name": name, "face": face}}}, {}]
+        info = [
+            detail,
+            rng.choice(WORDS) if rng.random() < 0.6 else "弹幕内容%d" % rng.randint(0, 999),
+            [uid, name, 0, 0, 0, 10000, 1, ""],
+            medals[i] if i % 10 < 7 else [],
+            [i % 60, 0, 9868950, ">50000", 0],
+            ["", ""], 0, 0, None,
+            {"ts": 1700000000 + n, "ct": "AB"},
+        ]
+        texts.append(json.dumps({"room_display_id": ROOM_DISPLAY_ID, "room_real_id": ROOM_REAL_ID,
+                                 "data": {"cmd": "DANMU_MSG", "info": info}}, ensure_ascii=False))
+    return texts
+
+
+def replay(texts: list[str], count: int, interner: Optional[DanmakuInterner]) -> tuple[int, float]:
+    """回放 count 帧并保留全部结果，返回 (保留的内存字节数, 解析吞吐)."""
+    gc.collect()
+    tracemalloc.start()
+    buffer = []
+    for i in range(count):
+        buffer.append(DanmakuMsgData.from_raw(json.loads(texts[i % len(texts)]), interner))
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del buffer
+
+    decode = per_item(lambda text: DanmakuMsgData.from_raw(json.loads(text), interner), texts * 40, repeat=3)
+    return held, 1 / decode
+
+
+def main(count: int) -> None:
+    texts = record_room()
+    check = DanmakuInterner(4096, 16384)
+    for text in texts:
+        assert DanmakuMsgData.from_raw(json.loads(text), check) == DanmakuMsgData.from_raw(json.loads(text))
+    print(f"parity: {len(texts)} 帧使用驻留器的解析结果一致")
+
+    for name, interner in (("plain", None), ("interned", DanmakuInterner(4096, 16384))):
+        held, rate = replay(texts, count, interner)
+        print(f"{name:8s} {count:,} danmaku: {held / 2 ** 20:7.1f} MiB ({held / count:4.0f} B/msg), "
+              f"decode {rate:,.0f} msgs/s (incl json.loads)")
+        if interner is not None:
+            for pool, metrics in interner.get_metrics().items():
+                if metrics["hits"] or metrics["misses"]:
+                    print(f"         {pool:8s} size {metrics['size']:5d}/{metrics['maxsize']:<5d} "
+                          f"hit rate {metrics['hit_rate']:.3f} evictions {metrics['evictions']}")
+
+
+if __name__ == '__main__':
+    run(lambda: main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000))
@@ -0,0 +1,84 @@
+"""BiliDanmakuSource 按需注册弹幕命令处理函数检查
+
+以 danmaku_rooms_bench 中的假弹幕连接启动 3 个房间（独占线程与主循环两种方式）：
+- 启动时没有订阅者，房间只注册认证成功的监听，不注册任何弹幕命令处理函数
+- 之后 add_subscriber(DANMAKU) 才为各房间注册 DANMU_MSG；多状态订阅 {GIFT, GUARD} 注册 SEND_GIFT 与 GUARD_BUY；
+  重复订阅已注册的状态不会重复注册
+- 开启窗口统计时，只订阅 STATS 也会注册弹幕、礼物与上舰的处理函数
+- 启动后新增的房间直接注册已有订阅者对应的处理函数
+
+运行: python test/danmaku_listeners_check.py
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from harness import run
+from danmaku_rooms_bench import Context
+from event import EventBus
+from bilibili import BiliDanmakuSource, DanmakuType
+
+ROOMS = [1, 2, 3]
+
+
+async def callback(event):
+    pass
+
+
+async def started(loop_threads: Optional[int], **kwargs) -> tuple[BiliDanmakuSource, EventBus]:
+    bus = EventBus()
+    source = BiliDanmakuSource(room_id=ROOMS, loop_threads=loop_threads, **kwargs)
+    source.bind(Context(bus))
+    await source.start()
+    return source, bus
+
+
+async def commands(source: BiliDanmakuSource) -> dict[int, dict[str, int]]:
+    """各房间已注册的弹幕命令及其处理函数数量（等待房间线程中的补充注册完成）."""
+    await asyncio.sleep(0.05)
+    return {
+        room_id: {cmd: len(handlers) for cmd, handlers in danmaku.listeners.items() if cmd in source.CMD_HANDLERS}
+        for room_id, danmaku in source.danmaku_list.items()
+    }
+
+
+def every_room(cmds: dict[str, int], rooms: list[int] = ROOMS) -> dict[int, dict[str, int]]:
+    return {room_id: cmds for room_id in rooms}
+
+
+async def check(loop_threads: Optional[int]) -> None:
+    source, bus = await started(loop_threads)
+    try:
+        assert await commands(source) == every_room({}), await commands(source)
+        assert all(list(danmaku.listeners) == ["VERIFICATION_SUCCESSFUL"] for danmaku in source.danmaku_list.values())
+
+        bus.add_subscriber(source.uuid, callback, DanmakuType.DANMAKU)
+        assert await commands(source) == every_room({"DANMU_MSG": 1}), await commands(source)
+
+        bus.add_subscriber(source.uuid, callback, {DanmakuType.GIFT, DanmakuType.GUARD})
+        bus.add_subscriber(source.uuid, callback, DanmakuType.DANMAKU)
+        wanted = {"DANMU_MSG": 1, "SEND_GIFT": 1, "GUARD_BUY": 1}
+        assert await commands(source) == every_room(wanted), await commands(source)
+
+        source.add_new_room(4)
+        assert await commands(source) == every_room(wanted, ROOMS + [4]), await commands(source)
+    finally:
+        await source.stop()
+
+    source, bus = await started(loop_threads, stats_window=60)
+    try:
+        bus.add_subscriber(source.uuid, callback, DanmakuType.STATS)
+        wanted = {"DANMU_MSG": 1, "SEND_GIFT": 1, "GUARD_BUY": 1}
+        assert await commands(source) == every_room(wanted), await commands(source)
+    finally:
+        await source.stop()
+    print(f"loop_threads={loop_threads}: 处理函数只在对应状态出现订阅者后注册，且只注册一次")
+
+
+async def main() -> None:
+    for loop_threads in (None, 0):
+        await check(loop_threads)
+
+
+if __name__ == '__main__':
+    run(main, logging.CRITICAL)
@@ -0,0 +1,73 @@
+"""弹幕数据类内存基准（tracemalloc）
+
+在内存中保留 1,000,000 条弹幕（如回放缓冲区），对比 slots 数据类 DanmakuMsgData / MedalData
+与字段相同、带 __dict__ 的数据类的内存占用与构造耗时。
+弹幕内容与用户名取自 5000 个字符串的池（与真实流量中大量重复的弹幕一致），约 70% 带粉丝牌。
+
+运行: python test/danmaku_memory_bench.py [数量]
+"""
+import dataclasses
+import gc
+import sys
+import time
+import tracemalloc
+
+from harness import run
+from base_cls import BaseDataMixin
+from bilibili.data import DanmakuMsgData, MedalData
+
+
+def with_dict(cls: type) -> type:
+    """构造字段相同、不使用 slots 的冻结数据类作为对照."""
+    return dataclasses.make_dataclass(
+        cls.__name__,
+        [(f.name, f.type) for f in dataclasses.fields(cls)],
+        bases=(BaseDataMixin,),
+        frozen=True,
+    )
+
+
+def fill(msg_cls: type, medal_cls: type, count: int) -> tuple[list, float, int]:
+    """构造 count 条弹幕，返回 (缓冲区, 构造耗时, 保留的内存字节数)."""
+    messages = ["弹幕%d" % i for i in range(5000)]
+    names = ["用户%d" % i for i in range(5000)]
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    buffer = []
+    for i in range(count):
+        medal = medal_cls(level=i % 30, name="粉丝团", anchor_name="主播", room_id=456, is_light=1, anchor_uid=99) \
+            if i % 10 < 7 else None
+        buffer.append(msg_cls(
+            room_display_id=123, room_real_id=456, message=messages[i % 5000], uid=i,
+            username=names[i % 5000], user_level=i % 60, face=None, medal=medal, timestamp=1700000000 + i,
+        ))
+    elapsed = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return buffer, elapsed, held
+
+
+def check_equivalent() -> None:
+    """slots 数据类没有 __dict__，repr 与 to_dict 与对照类一致."""
+    plain_msg, plain_medal = with_dict(DanmakuMsgData), with_dict(MedalData)
+    kwargs = dict(room_display_id=1, room_real_id=2, message="hi", uid=3, username="u", user_level=4, face=None, timestamp=5)
+    slotted = DanmakuMsgData(medal=MedalData(1, "n", "a", 1, 1, 2), **kwargs)
+    plain = plain_msg(medal=plain_medal(1, "n", "a", 1, 1, 2), **kwargs)
+    assert not hasattr(slotted, "__dict__") and hasattr(plain, "__dict__")
+    assert repr(slotted) == repr(plain) and slotted.to_dict() == plain.to_dict()
+
+
+def main(count: int) -> None:
+    check_equivalent()
+    for name, msg_cls, medal_cls in (
+        ("__dict__", with_dict(DanmakuMsgData), with_dict(MedalData)),
+        ("slots", DanmakuMsgData, MedalData),
+    ):
+        buffer, elapsed, held = fill(msg_cls, medal_cls, count)
+        print(f"{name:8s} {count:,} danmaku: {held / 2 ** 20:7.1f} MiB ({held / count:5.0f} B/msg), build {elapsed:.2f}s")
+        del buffer
+
+
+if __name__ == '__main__':
+    run(lambda: main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000))
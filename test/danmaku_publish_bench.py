@@ -0,0 +1,67 @@
+"""弹幕跨线程发布基准
+
+50 个模拟房间线程各发布 2000 条弹幕事件，对比：
+- per-msg：每条事件 run_coroutine_threadsafe(bus.publish(...)) 唤醒一次主循环（旧实现）
+- batched：_publish_to_main 追加到交接队列，队列由空变为非空时唤醒一次，主循环以 publish_many 批量发布
+
+运行: python test/danmaku_publish_bench.py
+"""
+import asyncio
+import threading
+import time
+
+from harness import run, FakeContext
+from event import EventBus, Event, DispatchExecutor
+from bilibili import BiliDanmakuSource, DanmakuType
+
+ROOMS = 50
+PER_ROOM = 2000
+
+
+async def publish_rate(mode: str) -> float:
+    total = ROOMS * PER_ROOM
+    bus = EventBus(DispatchExecutor(max_in_flight=total, queue_size=total))
+    source = BiliDanmakuSource(room_id=[])
+    source.bind(FakeContext(bus))
+    loop = source._main_loop = asyncio.get_running_loop()
+    received = 0
+    done = asyncio.Event()
+
+    async def callback(event):
+        nonlocal received
+        received += 1
+        if received == total:
+            done.set()
+
+    bus.add_subscriber(source.uuid, callback, DanmakuType.DANMAKU)
+    event = Event(data=None, status=DanmakuType.DANMAKU)
+
+    def per_msg(e: Event) -> None:
+        asyncio.run_coroutine_threadsafe(bus.publish(source.uuid, e), loop)
+
+    publish = source._publish_to_main if mode == "batched" else per_msg
+
+    def room() -> None:
+        for _ in range(PER_ROOM):
+            publish(event)
+
+    threads = [threading.Thread(target=room) for _ in range(ROOMS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    await asyncio.wait_for(done.wait(), timeout=120)
+    elapsed = time.perf_counter() - start
+    for thread in threads:
+        thread.join()
+    assert received == total
+    return total / elapsed
+
+
+def main() -> None:
+    for mode in ("per-msg", "batched", "per-msg", "batched"):
+        rate = asyncio.run(publish_rate(mode))
+        print(f"{mode:8s} {ROOMS} rooms x {PER_ROOM}: {rate:10,.0f} msg/s")
+
+
+if __name__ == '__main__':
+    run(main)
@@ -0,0 +1,108 @@
+"""BiliDanmakuSource 多房间运行方式对比
+
+以不联网的假弹幕连接启动 N 个房间，分别在 loop_threads=None（每房间独占线程）、
+0（主事件循环）与 4（固定线程池）三种方式下运行；一半房间的 disconnect 不会结束连接，需要取消连接任务。
+
+- 检查：stop_room / stop_room_async / stop 返回时连接任务均已结束，房间线程全部退出
+- 输出：各方式运行时的线程数（threading.active_count）与启动房间后进程 RSS 的增量
+
+运行: python test/danmaku_rooms_bench.py [房间数]
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+from typing import Optional
+
+from harness import run, FakeContext
+from event import EventBus
+from bilibili import BiliDanmakuSource
+
+
+class FakeDanmaku:
+    """假的弹幕连接：connect 一直挂起，stubborn 时 disconnect 不会让其返回."""
+
+    def __init__(self, room_id: int, stubborn: bool):
+        self.room_display_id = room_id
+        self.stubborn = stubborn
+        self.logger = None
+        self.listeners: dict[str, list] = {}
+        self._closed: Optional[asyncio.Event] = None
+
+    def add_event_listener(self, name, handler) -> None:
+        self.listeners.setdefault(name, []).append(handler)
+
+    async def connect(self) -> None:
+        self._closed = asyncio.Event()
+        await self._closed.wait()
+
+    async def disconnect(self) -> None:
+        if self._closed is not None and not self.stubborn:
+            self._closed.set()
+
+
+class FakeApi:
+    async def get_room_info(self, room_id: int):
+        return None
+
+    def get_live_danmaku(self, room_id: int) -> FakeDanmaku:
+        return FakeDanmaku(room_id, stubborn=room_id % 2 == 1)
+
+
+class Context(FakeContext):
+    """提供 Credential 配置与假 API 的应用上下文."""
+
+    def __init__(self, bus: EventBus):
+        super().__init__(bus)
+        self.config = type("Config", (), {"get_config": staticmethod(lambda key: {"sessdata": ""})})()
+        self.api_ctx = type("ApiContext", (), {"get": staticmethod(lambda cls, key: FakeApi())})()
+
+
+def rss() -> int:
+    """当前进程的常驻内存（字节），读取 /proc/self/statm."""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def room_threads() -> int:
+    """弹幕连接占用的线程数（独占线程与线程池）."""
+    return sum(1 for thread in threading.enumerate() if thread.name.startswith("LiveDanmaku"))
+
+
+def mode_name(loop_threads: Optional[int]) -> str:
+    return {None: "thread/room", 0: "main loop"}.get(loop_threads, f"pool({loop_threads})")
+
+
+async def bench(rooms: int, loop_threads: Optional[int]) -> None:
+    before = rss()
+    source = BiliDanmakuSource(room_id=list(range(rooms)), loop_threads=loop_threads)
+    source.bind(Context(EventBus()))
+    await source.start()
+    await asyncio.sleep(0.1)
+    threads, memory = threading.active_count(), rss() - before
+    assert room_threads() == {None: rooms, 0: 0}.get(loop_threads, loop_threads), room_threads()
+
+    # 阻塞的 stop_room 不能在连接所在的循环中调用，主循环模式放到其他线程调用
+    connection = source._connections[0]
+    await asyncio.to_thread(source.stop_room, 0)
+    assert connection.done(), "stop_room 返回时连接仍在运行"
+    connection = source._connections[1]
+    await source.stop_room_async(1)
+    assert connection.done(), "stop_room_async 返回时连接仍在运行"
+    source.start_room(1)
+
+    connections = list(source._connections.values())
+    await source.stop()
+    assert all(connection.done() for connection in connections), "stop 返回时仍有连接在运行"
+    assert room_threads() == 0, f"stop 后仍有 {room_threads()} 个房间线程"
+    print(f"{mode_name(loop_threads):12s} {rooms:4d} rooms: threads {threads:4d}  RSS +{max(memory, 0) / 2 ** 20:6.1f} MiB")
+
+
+async def main(rooms: int) -> None:
+    for loop_threads in (None, 0, 4):
+        await bench(rooms, loop_threads)
+
+
+if __name__ == '__main__':
+    run(lambda: main(int(sys.argv[1]) if len(sys.argv) > 1 else 200), logging.CRITICAL)
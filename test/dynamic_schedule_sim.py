@@ -0,0 +1,74 @@
+"""BiliDynamicSource 到期时间调度模拟（虚拟时钟）
+
+1000 个成员、poll_interval=60s、max_concurrency=16，每次轮询耗时 0.1~0.8s（随机），
+在虚拟时钟下运行 10 分钟，统计每个 uid 实际观测到的刷新周期。
+旧实现逐个轮询并在每次之间等待 poll_interval，每个 uid 的刷新周期为 成员数 * poll_interval。
+
+运行: python test/dynamic_schedule_sim.py
+"""
+import asyncio
+import random
+
+from harness import run
+from bilibili.source.bili_dynamic_source import BiliDynamicSource
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """虚拟时钟事件循环：没有就绪回调时直接跳到下一个定时器."""
+
+    def __init__(self):
+        super().__init__()
+        self._now = 0.0
+
+    def time(self) -> float:
+        return self._now
+
+    def _run_once(self) -> None:
+        if not self._ready and self._scheduled:
+            when = self._scheduled[0]._when
+            if when > self._now:
+                self._now = when
+        super()._run_once()
+
+
+async def simulate(members: int, interval: float, concurrency: int, horizon: float) -> dict[int, list[float]]:
+    """运行调度器，返回 uid -> 各次轮询开始的虚拟时间."""
+    loop = asyncio.get_running_loop()
+    source = BiliDynamicSource(poll_interval=interval, watch_targets=list(range(members)), max_concurrency=concurrency)
+    rng = random.Random(1)
+    polls: dict[int, list[float]] = {}
+
+    async def fake_poll(uid: int) -> None:
+        polls.setdefault(uid, []).append(loop.time())
+        await asyncio.sleep(rng.uniform(0.1, 0.8))
+
+    source._poll_dynamic = fake_poll
+    await source.start()
+    await asyncio.sleep(horizon)
+    await source.stop()
+    return polls
+
+
+def main(members: int = 1000, interval: float = 60.0, concurrency: int = 16, horizon: float = 600.0) -> None:
+    loop = VirtualTimeLoop()
+    try:
+        polls = loop.run_until_complete(simulate(members, interval, concurrency, horizon))
+    finally:
+        loop.close()
+    assert len(polls) == members, f"{members - len(polls)} 个成员从未被轮询"
+    periods = {uid: [b - a for a, b in zip(times, times[1:])] for uid, times in polls.items()}
+    worst = {uid: max(gaps) for uid, gaps in periods.items() if gaps}
+    assert len(worst) == members, "部分成员在模拟时长内只被轮询了一次"
+    late = [uid for uid, gap in worst.items() if gap > interval + 1e-6]
+    all_gaps = sorted(gap for gaps in periods.values() for gap in gaps)
+    print(f"members={members} interval={interval:.0f}s concurrency={concurrency} horizon={horizon:.0f}s")
+    print(f"  polls={len(all_gaps) + members}  per-uid period min/median/max = "
+          f"{all_gaps[0]:.2f} / {all_gaps[len(all_gaps) // 2]:.2f} / {all_gaps[-1]:.2f} s")
+    print(f"  first poll of the last uid at {max(times[0] for times in polls.values()):.2f} s")
+    print(f"  uids with a period above the interval: {len(late)}")
+    print(f"  sequential baseline period: {members * interval:.0f} s")
+    assert not late, f"{len(late)} 个成员的刷新周期超过 poll_interval"
+
+
+if __name__ == '__main__':
+    run(main)
@@ -0,0 +1,112 @@
+"""DispatchExecutor 等待队列基准与正确性检查
+
+- 基准：订阅者 concurrency=1、max_in_flight=64 时清空 1k/4k/8k 积压回调的单事件耗时，
+  回调结束时只应检查能启动的回调，耗时不随积压量增长
+- 检查：订阅者并发上限、订阅者内入队顺序、全局在途上限、DROP_OLDEST 丢弃全局最早的回调
+
+运行: python test/executor_drain_bench.py
+"""
+import asyncio
+import time
+
+from harness import run
+from event import DispatchExecutor, Event, OverflowPolicy
+from event.subscriber import Subscriber
+from bilibili.type import DanmakuType
+
+
+def make_subscriber(callback, concurrency=None) -> Subscriber:
+    return Subscriber(callback=callback, status_filter=DanmakuType.DANMAKU, concurrency=concurrency)
+
+
+async def bench(backlog: int) -> float:
+    """一个 concurrency=1 的慢订阅者积压 backlog 个回调，另有不限并发的订阅者持续完成."""
+    executor = DispatchExecutor(max_in_flight=64, queue_size=backlog * 2)
+    done = 0
+
+    async def slow(event):
+        await asyncio.sleep(0)
+
+    async def fast(event):
+        nonlocal done
+        done += 1
+
+    blocked = make_subscriber(slow, concurrency=1)
+    free = make_subscriber(fast)
+    event = Event(data=None, status=DanmakuType.DANMAKU)
+    # 慢订阅者的积压回调排在队首
+    for _ in range(backlog):
+        await executor.submit(blocked, event)
+    start = time.perf_counter()
+    for _ in range(backlog):
+        await executor.submit(free, event)
+    while executor.in_flight or executor.queue_depth:
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    assert done == backlog
+    return elapsed / (backlog * 2)
+
+
+async def check_order_and_limits() -> None:
+    executor = DispatchExecutor(max_in_flight=4, queue_size=1000)
+    running = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0, "all": 0}
+    seen = {"a": [], "b": []}
+
+    def make(name):
+        async def callback(event):
+            running[name] += 1
+            peak[name] = max(peak[name], running[name])
+            peak["all"] = max(peak["all"], running["a"] + running["b"])
+            seen[name].append(event.data)
+            await asyncio.sleep(0.001)
+            running[name] -= 1
+        return callback
+
+    a = make_subscriber(make("a"), concurrency=1)
+    b = make_subscriber(make("b"), concurrency=2)
+    for n in range(50):
+        await executor.submit(a, Event(data=n, status=DanmakuType.DANMAKU))
+        await executor.submit(b, Event(data=n, status=DanmakuType.DANMAKU))
+    while executor.in_flight or executor.queue_depth:
+        await asyncio.sleep(0.001)
+    assert seen["a"] == list(range(50)), "订阅者内顺序被打乱"
+    assert sorted(seen["b"]) == list(range(50))
+    assert peak["a"] == 1 and peak["b"] <= 2 and peak["all"] <= 4, peak
+    m = executor.get_metrics()
+    assert m["completed"] == 100 and m["queue_depth"] == 0, m
+
+
+async def check_drop_oldest() -> None:
+    executor = DispatchExecutor(max_in_flight=1, queue_size=3, overflow=OverflowPolicy.DROP_OLDEST)
+    gate = asyncio.Event()
+    order = []
+
+    async def callback(event):
+        await gate.wait()
+        order.append(event.data)
+
+    x = make_subscriber(callback)
+    y = make_subscriber(callback)
+    # 第一个回调占用唯一额度，其余依次入队：x1 y2 x3，再提交 y4 时丢弃 x1
+    for n, sub in enumerate((x, x, y, x, y)):
+        await executor.submit(sub, Event(data=n, status=DanmakuType.DANMAKU))
+    assert executor.queue_depth == 3
+    gate.set()
+    while executor.in_flight or executor.queue_depth:
+        await asyncio.sleep(0.001)
+    assert order == [0, 2, 3, 4], order
+    assert executor.get_metrics()["dropped_oldest"] == 1
+
+
+async def main() -> None:
+    await check_order_and_limits()
+    await check_drop_oldest()
+    print("order / limits / drop_oldest: ok")
+    for backlog in (1000, 4000, 8000):
+        per_event = await bench(backlog)
+        print(f"backlog {backlog:5d}: {per_event * 1e6:7.1f} us/event")
+
+
+if __name__ == '__main__':
+    run(main)
@@ -0,0 +1,92 @@
+"""组合过滤器编译与重排基准
+
+一个常见的弹幕订阅过滤链：屏蔽词（503 个关键词的 KeywordFilter, exclude=True）
+& 弹幕长度 >= 2 & uid 尾号为 0 & 房间号（FieldFilter）。
+声明顺序把昂贵的屏蔽词放在最前，最具选择性的 uid 条件放在其后。
+事件为 danmaku_corpus 生成的 20000 条弹幕解析后的 DanmakuMsgData。
+
+- 检查：旧实现、树形 check、编译后的谓词与按实测重排的谓词对每个事件结果一致
+- 基准：各方式的单事件耗时；旧实现为 & 逐层嵌套 AndFilter、每次判定都格式化调试日志
+
+运行: python test/filter_chain_bench.py
+"""
+import logging
+import random
+from typing import Any, Callable
+
+from harness import run, per_item
+from danmaku_corpus import msg, ROOM_DISPLAY_ID
+from base_cls import BaseFilter
+from base_cls.base_filter import FieldFilter
+from bilibili import DanmakuType
+from bilibili.data import DanmakuMsgData
+from event import Event
+from utils import KeywordFilter
+
+_log = logging.getLogger(__name__)
+
+
+class Where(BaseFilter):
+    """按事件数据字段上的任意条件过滤."""
+
+    def __init__(self, field: str, predicate: Callable[[Any], bool]):
+        self.field = field
+        self.predicate = predicate
+        self.filters = field
+
+    def check(self, event: Event) -> bool:
+        return self.predicate(getattr(event.data, self.field))
+
+
+class LegacyAndFilter(BaseFilter):
+    """旧实现：不展开嵌套，每次判定都格式化调试日志."""
+
+    def __init__(self, *filters: BaseFilter):
+        self.filters = list(filters)
+
+    def check(self, event: Event) -> bool:
+        for f in self.filters:
+            if not f.check(event):
+                _log.debug(f"事件{event.id}被过滤器参数 {f.filters} 拦截, 不再继续检查")
+                return False
+        _log.debug(f"事件{event.id}通过所有{self}与过滤器")
+        return True
+
+
+def build_chain() -> list[BaseFilter]:
+    words = [f"kw{i}" for i in range(500)] + ["哈哈", "666", "主播"]
+    return [
+        KeywordFilter(words, exclude=True),
+        Where("message", lambda message: len(message) >= 2),
+        Where("uid", lambda uid: uid % 10 == 0),
+        FieldFilter("room_display_id", ROOM_DISPLAY_ID),
+    ]
+
+
+def main() -> None:
+    rng = random.Random(1)
+    events = [Event(data=DanmakuMsgData.from_raw(msg(rng)), status=DanmakuType.DANMAKU) for _ in range(20000)]
+    a, b, c, d = build_chain()
+    chain = a & b & c & d
+    legacy = LegacyAndFilter(LegacyAndFilter(LegacyAndFilter(a, b), c), d)
+    adaptive = chain.compile(reorder=True, warmup=1000)
+
+    compiled = chain.compile()
+    expected = [legacy.check(event) for event in events]
+    for name, predicate in (("tree", chain.check), ("compiled", compiled), ("adaptive", adaptive)):
+        assert [predicate(event) for event in events] == expected, name
+    print(f"parity: {len(events)} 事件四种方式结果一致, {sum(expected)} 通过")
+    print(f"reorder stats (declared order): {[{k: round(v, 3) for k, v in s.items()} for s in adaptive.get_stats()]}")
+
+    for name, predicate in (
+        ("legacy nested check", legacy.check),
+        ("tree check", chain.check),
+        ("compiled", compiled),
+        ("compiled + reorder", chain.compile(reorder=True, warmup=1000)),
+    ):
+        passed = sum(1 for event in events if predicate(event))
+        print(f"{name:20s} {per_item(predicate, events) * 1e9:7.0f} ns/event  passed={passed}")
+
+
+if __name__ == '__main__':
+    run(main)
@@ -0,0 +1,48 @@
+"""test/ 下检查与基准脚本的公共部分
+
+脚本以 python test/xxx.py 运行，脚本所在目录位于 sys.path 首位，可直接 `import harness`；
+导入本模块时将仓库根目录加入 sys.path，之后即可导入仓库内的包。
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Any, Callable, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+class FakeContext:
+    """只提供事件总线的应用上下文，供 source.bind 使用."""
+
+    def __init__(self, bus: Any):
+        self.bus = bus
+
+
+def best_time(run: Callable[[], Any], repeat: int = 5) -> float:
+    """重复运行 repeat 次，返回最短耗时（秒）."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def per_item(fn: Callable[[Any], Any], items: Sequence, repeat: int = 5) -> float:
+    """对每一项调用 fn，重复 repeat 次取最短耗时，返回每项耗时（秒）."""
+    def run() -> None:
+        for item in items:
+            fn(item)
+    return best_time(run, repeat) / len(items)
+
+
+def run(main: Callable[[], Any], quiet: int = logging.INFO) -> None:
+    """脚本入口：关闭 quiet 及以下级别的日志后运行 main，main 返回协程时交给 asyncio.run."""
+    logging.disable(quiet)
+    result = main()
+    if asyncio.iscoroutine(result):
+        asyncio.run(result)
@@ -0,0 +1,105 @@
+"""内联订阅者执行与降级检查
+
+- 同步内联回调：发布时直接执行完毕，不创建 task，不降级
+- 执行中挂起的协程回调：第一次发布即降级，已挂起的协程交给 task 继续运行，后续事件以 task 方式运行
+- 超出 inline_budget 的回调：第一次超出即记录警告并降级（inline_strikes 默认 1）
+
+运行: python test/inline_executor_check.py
+"""
+import asyncio
+import logging
+import time
+from uuid import UUID, uuid4
+
+from harness import run
+from event import DispatchExecutor, Event, EventBus
+from bilibili.type import DanmakuType
+
+
+class Records(logging.Handler):
+    """收集执行器的日志记录."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def setup(callback) -> tuple[EventBus, UUID, Records]:
+    bus = EventBus(DispatchExecutor(inline_budget=0.001))
+    uuid = uuid4()
+    bus.add_subscriber(uuid, callback, DanmakuType.DANMAKU, inline=True)
+    records = Records()
+    logging.getLogger("event.executor").addHandler(records)
+    return bus, uuid, records
+
+
+async def publish(bus: EventBus, uuid: UUID, times: int) -> None:
+    for i in range(times):
+        await bus.publish(uuid, Event(data=i, status=DanmakuType.DANMAKU))
+
+
+def subscriber_of(bus: EventBus, uuid: UUID):
+    subscriber, = bus._subscriber_group.get_subscriber(uuid)
+    return subscriber
+
+
+async def check_sync() -> None:
+    seen = []
+    bus, uuid, records = setup(lambda event: seen.append(event.data))
+    await publish(bus, uuid, 100)
+    # 同步执行：publish 返回时已执行完毕，没有在途 task
+    assert seen == list(range(100)) and bus.executor.in_flight == 0, seen
+    metrics = bus.executor.get_metrics()
+    assert metrics["inline"] == 100 and metrics["demoted"] == 0, metrics
+    assert subscriber_of(bus, uuid).inline and not records.records
+    print("sync inline: 100 次发布直接执行，未降级")
+
+
+async def check_suspend() -> None:
+    seen = []
+
+    async def callback(event: Event) -> None:
+        await asyncio.sleep(0)
+        seen.append(event.data)
+
+    bus, uuid, records = setup(callback)
+    await publish(bus, uuid, 10)
+    assert not subscriber_of(bus, uuid).inline
+    await asyncio.sleep(0.01)
+    # 挂起的第一个回调由 task 继续运行完毕，之后的回调以 task 方式运行
+    assert sorted(seen) == list(range(10)), seen
+    metrics = bus.executor.get_metrics()
+    assert metrics["inline"] == 1 and metrics["demoted"] == 1 and metrics["completed"] == 10, metrics
+    assert len(records.records) == 1 and "挂起" in records.records[0].getMessage()
+    print("suspending coroutine: 第一次挂起即降级，10 个回调全部完成")
+
+
+async def check_over_budget() -> None:
+    seen = []
+
+    def callback(event: Event) -> None:
+        time.sleep(0.005)
+        seen.append(event.data)
+
+    bus, uuid, records = setup(callback)
+    await publish(bus, uuid, 5)
+    assert not subscriber_of(bus, uuid).inline
+    await asyncio.sleep(0.1)
+    assert sorted(seen) == list(range(5)), seen
+    metrics = bus.executor.get_metrics()
+    assert metrics["inline"] == 1 and metrics["demoted"] == 1, metrics
+    assert len(records.records) == 1 and "超出预算" in records.records[0].getMessage()
+    print(f"over budget: {records.records[0].getMessage()}")
+
+
+async def main() -> None:
+    for check in (check_sync, check_suspend, check_over_budget):
+        await check()
+        logging.getLogger("event.executor").handlers.clear()
+
+
+if __name__ == '__main__':
+    run(main)
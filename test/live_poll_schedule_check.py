@@ -0,0 +1,97 @@
+"""BiliLiveSource 轮询调度检查（假 API，每次请求耗时 60ms）
+
+40 个房间、poll_interval=0.8s，逐个顺序轮询一轮需要 2.4s：
+- 检查：max_concurrency=4 时每轮的轮询时间点均匀分布在 poll_interval 内，
+  每个房间都在 poll_interval 内被再次轮询；last_poll_time 覆盖全部房间，poll_lag 接近 0；
+  remove_members 同时清理该房间的 last_poll_time 与 poll_lag
+- 过载：max_concurrency=1 时处理能力不足，poll_lag 随排队增长
+
+运行: python test/live_poll_schedule_check.py
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+from harness import run, FakeContext
+from bilibili.source.bili_live_source import BiliLiveSource
+from event import EventBus
+
+ROOMS = list(range(1, 41))
+INTERVAL = 0.8
+LATENCY = 0.06
+
+
+class FakeApi:
+    """记录每个房间被轮询的时间点（事件循环时钟）."""
+
+    def __init__(self):
+        self.polls: dict[int, list[float]] = {room_id: [] for room_id in ROOMS}
+
+    async def get_room_info(self, room_id: int):
+        self.polls[room_id].append(asyncio.get_running_loop().time())
+        await asyncio.sleep(LATENCY)
+        return SimpleNamespace(room_info=SimpleNamespace(room_id=room_id, live_status=0))
+
+
+class Context(FakeContext):
+    def __init__(self, bus: EventBus, api: FakeApi):
+        super().__init__(bus)
+        self.api_ctx = SimpleNamespace(get=lambda cls, key: api)
+
+
+async def poll(max_concurrency: int, cycles: int) -> tuple[BiliLiveSource, FakeApi]:
+    api = FakeApi()
+    source = BiliLiveSource(poll_interval=INTERVAL, watch_targets=ROOMS, max_concurrency=max_concurrency)
+    source.bind(Context(EventBus(), api))
+    await source.start()
+    await asyncio.sleep(INTERVAL * cycles + LATENCY)
+    return source, api
+
+
+async def check_schedule() -> None:
+    source, api = await poll(max_concurrency=4, cycles=3)
+    try:
+        step = INTERVAL / len(ROOMS)
+        first = sorted(times[0] for times in api.polls.values())
+        gaps = [b - a for a, b in zip(first, first[1:])]
+        # 均匀分布：相邻房间的首次轮询间隔约为 step，整轮跨度接近 poll_interval
+        assert max(gaps) < step * 3, max(gaps)
+        assert first[-1] - first[0] > INTERVAL * 0.9, first[-1] - first[0]
+        revisits = [b - a for times in api.polls.values() for a, b in zip(times, times[1:])]
+        assert all(len(times) >= 3 for times in api.polls.values()), {r: len(t) for r, t in api.polls.items()}
+        assert max(revisits) < INTERVAL * 1.1, max(revisits)
+
+        now = time.time()
+        last_poll = source.last_poll_time
+        assert sorted(last_poll) == ROOMS and all(now - t < INTERVAL * 1.1 for t in last_poll.values())
+        lag = source.poll_lag
+        assert sorted(lag) == ROOMS and max(lag.values()) < 0.02, max(lag.values())
+        print(f"max_concurrency 4: first-cycle gap max {max(gaps) * 1000:.1f}ms (step {step * 1000:.1f}ms), "
+              f"revisit max {max(revisits) * 1000:.0f}ms, poll_lag max {max(lag.values()) * 1000:.1f}ms")
+
+        source.remove_members([ROOMS[0]])
+        assert ROOMS[0] not in source.last_poll_time and ROOMS[0] not in source.poll_lag
+    finally:
+        await source.stop()
+
+
+async def check_overload() -> None:
+    source, api = await poll(max_concurrency=1, cycles=1)
+    try:
+        lag = source.poll_lag
+        polled = sum(1 for times in api.polls.values() if times)
+        # 每 LATENCY 秒只能完成一次轮询，排队越靠后延迟越大
+        assert polled < len(ROOMS) and max(lag.values()) > INTERVAL / 2, (polled, max(lag.values()))
+        print(f"max_concurrency 1: {polled}/{len(ROOMS)} rooms polled in one interval, "
+              f"poll_lag max {max(lag.values()) * 1000:.0f}ms")
+    finally:
+        await source.stop()
+
+
+async def main() -> None:
+    await check_schedule()
+    await check_overload()
+
+
+if __name__ == '__main__':
+    run(main)
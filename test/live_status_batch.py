@@ -0,0 +1,133 @@
+"""BiliLiveSource 批量状态轮询测试（本地模拟 HTTP 服务器）
+
+本地服务器模拟批量直播状态接口（getRoomBaseInfo，按真实房间号返回 short_id 与 live_status），
+200 个房间、batch_size=50，连续三轮：
+- 第一轮：所有房间尚无数据，各获取一次完整数据，不发布 OPEN/CLOSE
+- 第二轮：房间 7 开播、房间 5 下播，只为这两个房间获取完整数据，发布 OPEN(7)、CLOSE(5)
+- 第三轮：房间 7 下播、房间 5 开播，发布 OPEN(5)、CLOSE(7)
+每轮批量接口请求 4 次（200 / 50），状态未变化的房间沿用上次数据发布 ONLINE/OFFLINE。
+
+运行: python test/live_status_batch.py
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+from harness import run, FakeContext
+from aiohttp import web
+from bilibili_api import Credential
+
+import bilibili.api.bili_api as bili_api
+from bilibili.source.bili_live_source import BiliLiveSource
+from bilibili.type import LiveType
+from event import EventBus
+
+ROOMS = list(range(1, 201))
+REAL_ID_OFFSET = 100000  # 真实房间号 = 短号 + 偏移
+
+
+class FakeLiveStatusServer:
+    """本地模拟批量直播状态接口."""
+
+    def __init__(self, status: dict[int, int]):
+        self.status = status  # 短号 -> live_status
+        self.requests = 0
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/getRoomBaseInfo", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/getRoomBaseInfo"
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        room_ids = [int(x) for x in request.query.getall("room_ids")]
+        by_room_ids = {
+            str(room_id + REAL_ID_OFFSET): {
+                "room_id": room_id + REAL_ID_OFFSET,
+                "short_id": room_id,
+                "live_status": self.status[room_id],
+            }
+            for room_id in room_ids if room_id in self.status
+        }
+        return web.json_response({"code": 0, "message": "0", "ttl": 1, "data": {"by_room_ids": by_room_ids}})
+
+
+async def wait_cycle(server: FakeLiveStatusServer, source: BiliLiveSource, requests: int) -> None:
+    """等待批量接口收到 requests 次请求，且状态变化的房间都已获取完整数据."""
+    deadline = time.monotonic() + 10
+    while server.requests < requests or source._poll_tasks:
+        assert time.monotonic() < deadline, "轮询未在超时内完成"
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+
+
+async def main() -> None:
+    status = {room_id: 0 for room_id in ROOMS}
+    status[5] = 1
+    server = FakeLiveStatusServer(status)
+    await server.start()
+    original_url = bili_api.LIVE_STATUS_API["url"]
+    bili_api.LIVE_STATUS_API["url"] = server.url
+
+    api = bili_api.BilibiliApi(Credential(sessdata="s", bili_jct="j", buvid3="b3", buvid4="b4", ac_time_value="a"))
+    full_fetches: list[int] = []
+
+    async def get_room_info(room_id: int):
+        # 完整直播间数据只需 live_status，由本地状态表给出
+        full_fetches.append(room_id)
+        return SimpleNamespace(room_info=SimpleNamespace(room_id=room_id, live_status=status[room_id]))
+
+    api.get_room_info = get_room_info
+    bus = EventBus()
+    source = BiliLiveSource(poll_interval=0.5, watch_targets=ROOMS, max_concurrency=10, batch_status=True, batch_size=50)
+    source.bind(FakeContext(bus))
+    type(source).api = property(lambda self: api)
+    events: list[tuple[LiveType, int]] = []
+
+    async def record(event):
+        events.append((event.status, event.data.room_info.room_id))
+
+    bus.add_subscriber(source.uuid, record, LiveType.ALL)
+
+    def transitions() -> list[tuple[LiveType, int]]:
+        return sorted((s, r) for s, r in events if s in (LiveType.OPEN, LiveType.CLOSE))
+
+    await source.start()
+    try:
+        await wait_cycle(server, source, 4)
+        assert server.requests == 4, server.requests
+        assert sorted(full_fetches) == ROOMS, "首轮应为每个房间获取一次完整数据"
+        assert transitions() == [], transitions()
+        print(f"cycle 1: {server.requests} batch requests, {len(full_fetches)} full fetches, no OPEN/CLOSE")
+
+        for cycle, (opened, closed) in enumerate(((7, 5), (5, 7)), start=2):
+            full_fetches.clear()
+            events.clear()
+            status[opened], status[closed] = 1, 0
+            await wait_cycle(server, source, cycle * 4)
+            assert server.requests == cycle * 4, server.requests
+            assert sorted(full_fetches) == sorted((opened, closed)), full_fetches
+            assert transitions() == sorted([(LiveType.OPEN, opened), (LiveType.CLOSE, closed)]), transitions()
+            steady = [s for s, _ in events if s in (LiveType.ONLINE, LiveType.OFFLINE)]
+            assert len(steady) == len(ROOMS) - 2, len(steady)
+            print(f"cycle {cycle}: 4 batch requests, full fetches {sorted(full_fetches)}, "
+                  f"OPEN {opened} / CLOSE {closed}, {len(steady)} ONLINE/OFFLINE from cached data")
+    finally:
+        await source.stop()
+        await server.stop()
+        bili_api.LIVE_STATUS_API["url"] = original_url
+
+
+if __name__ == '__main__':
+    run(main)
@@ -0,0 +1,114 @@
+"""弹幕过载卸载模拟
+
+一个房间线程在 3 秒内以约 10000 条/秒的速率推送弹幕（每 10ms 100 条），
+每 30ms 一个礼物（约 40% 付费），每 100ms 一次上舰；
+订阅者回调耗时 2ms，执行器在途上限 8（处理能力约 4000 事件/秒），等待队列 256，队列满时阻塞发布。
+分别在不卸载与 shed_lag=0.05、shed_depth=500 下运行，直到全部事件处理完毕。
+
+- 检查：上舰与付费礼物从不卸载；窗口统计的弹幕数/礼物数包含被卸载的消息，shed_count 与卸载数量一致；
+  卸载时上舰延迟中位数低于不卸载时
+- 输出：处理完毕耗时、送达的弹幕数、上舰从进入事件源到回调的延迟（p50/max）与卸载指标
+
+运行: python test/load_shed_sim.py
+"""
+import asyncio
+import random
+import time
+from typing import Optional
+
+from harness import run, FakeContext
+from danmaku_corpus import msg, gift, guard
+from event import EventBus, DispatchExecutor
+from bilibili import BiliDanmakuSource, DanmakuType
+from bilibili.source.danmaku_aggregator import DanmakuAggregator
+from utils import LoopThread
+
+TICKS = 300
+PER_TICK = 100
+GIFT_EVERY = 3
+GUARD_EVERY = 10
+
+
+async def simulate(shed_lag: Optional[float]) -> list[float]:
+    rng = random.Random(3)
+    frames = [msg(rng) for _ in range(2000)]
+    gifts = [gift(rng) for _ in range(TICKS // GIFT_EVERY)]
+    guards = [guard(rng) for _ in range(TICKS // GUARD_EVERY)]
+    for uid, frame in enumerate(guards):
+        frame["data"]["data"]["uid"] = uid
+    paid = sum(1 for frame in gifts if frame["data"]["data"]["coin_type"] == "gold")
+
+    bus = EventBus(DispatchExecutor(max_in_flight=8, queue_size=256))
+    source = BiliDanmakuSource(room_id=[], shed_lag=shed_lag, shed_depth=500)
+    source.bind(FakeContext(bus))
+    source._main_loop = asyncio.get_running_loop()
+    # 固定时钟：整个模拟落在同一个统计窗口内
+    now = [30.0]
+    source._aggregator = DanmakuAggregator(60, clock=lambda: now[0])
+
+    sent: dict[int, float] = {}
+    latency: list[float] = []
+    delivered = {DanmakuType.DANMAKU: 0, DanmakuType.GIFT: 0, DanmakuType.GUARD: 0}
+
+    async def subscriber(event) -> None:
+        await asyncio.sleep(0.002)
+        delivered[event.status] += 1
+        if event.status == DanmakuType.GUARD:
+            latency.append(time.monotonic() - sent[event.data.uid])
+
+    bus.add_subscriber(source.uuid, subscriber, DanmakuType.ALL)
+
+    async def room() -> None:
+        for tick in range(TICKS):
+            for i in range(PER_TICK):
+                await source.on_danmaku(frames[(tick * PER_TICK + i) % len(frames)])
+            if tick % GIFT_EVERY == 0:
+                await source.on_gift(gifts[tick // GIFT_EVERY])
+            if tick % GUARD_EVERY == 0:
+                sent[tick // GUARD_EVERY] = time.monotonic()
+                await source.on_guard(guards[tick // GUARD_EVERY])
+            await asyncio.sleep(0.01)
+
+    worker = LoopThread("room")
+    worker.start()
+    start = time.monotonic()
+    try:
+        await asyncio.wrap_future(worker.submit(room()))
+    finally:
+        worker.stop()
+    while source._pending or bus.executor.queue_depth or bus.executor.in_flight \
+            or (source._drain_task is not None and not source._drain_task.done()):
+        await asyncio.sleep(0.01)
+    elapsed = time.monotonic() - start
+
+    total_danmaku = TICKS * PER_TICK
+    latency.sort()
+    print(f"shedding {'on ' if shed_lag else 'off'}: drained in {elapsed:.2f}s, "
+          f"danmaku delivered {delivered[DanmakuType.DANMAKU]}/{total_danmaku}, "
+          f"guard latency p50 {latency[len(latency) // 2] * 1000:.0f}ms max {latency[-1] * 1000:.0f}ms")
+
+    assert delivered[DanmakuType.GUARD] == len(guards)
+    assert delivered[DanmakuType.GIFT] >= paid
+    now[0] = 60.0
+    stats, = source._aggregator.flush()
+    assert stats.danmaku_count == total_danmaku and stats.gift_count == len(gifts) and stats.guard_count == len(guards)
+    if shed_lag:
+        metrics = source.get_metrics()["shedding"]
+        assert metrics["shed"]["guard"] == metrics["shed"]["paid_gift"] == 0
+        assert stats.shed_count == sum(metrics["shed"].values())
+        print(f"  {metrics}")
+        print(f"  stats: danmaku {stats.danmaku_count} gift {stats.gift_count} guard {stats.guard_count} "
+              f"shed {stats.shed_count}")
+    else:
+        assert stats.shed_count == 0
+    return latency
+
+
+async def main() -> None:
+    baseline = await simulate(None)
+    shed = await simulate(0.05)
+    assert shed[len(shed) // 2] < baseline[len(baseline) // 2], "卸载后上舰延迟应下降"
+
+
+if __name__ == '__main__':
+    run(main)
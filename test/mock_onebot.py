@@ -0,0 +1,112 @@
+import asyncio
+import json
+from typing import Optional
+
+from aiohttp import web, WSMsgType
+
+
+class MockOneBotServer:
+    """本地模拟 OneBot11 (napcat) WebSocket 服务器
+
+    - 收到带 echo 的请求时回复同 echo 的响应，可设置响应延迟
+    - 可按固定频率向所有连接推送群消息事件，模拟背景流量
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        """
+        Args:
+            host: 监听地址
+            port: 监听端口，0 表示随机端口
+            latency: 每个请求的响应延迟（秒）
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.requests = 0
+        self._clients: set[web.WebSocketResponse] = set()
+        self._runner: Optional[web.AppRunner] = None
+        self._noise_task: Optional[asyncio.Task] = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/"
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._noise_task:
+            self._noise_task.cancel()
+        for ws in list(self._clients):
+            await ws.close()
+        if self._runner:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._clients.add(ws)
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                data = json.loads(msg.data)
+                if "echo" in data:
+                    self.requests += 1
+                    asyncio.create_task(self._reply(ws, data))
+        finally:
+            self._clients.discard(ws)
+        return ws
+
+    async def _reply(self, ws: web.WebSocketResponse, data: dict) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if ws.closed:
+            return
+        await ws.send_str(json.dumps({
+            "status": "ok",
+            "retcode": 0,
+            "data": {"action": data.get("action"), "message_id": self.requests},
+            "echo": data["echo"],
+        }))
+
+    async def push(self, frame: dict) -> None:
+        """向所有连接推送一条事件."""
+        text = json.dumps(frame)
+        for ws in list(self._clients):
+            if not ws.closed:
+                await ws.send_str(text)
+
+    def start_noise(self, rate: float) -> None:
+        """按每秒 rate 条的频率推送群消息事件."""
+        async def noise():
+            n = 0
+            while True:
+                n += 1
+                await self.push(group_message(n))
+                await asyncio.sleep(1 / rate)
+        self._noise_task = asyncio.create_task(noise())
+
+
+def group_message(n: int, group_id: int = 123456, user_id: int = 10001) -> dict:
+    """构造一条 OneBot11 群消息事件."""
+    return {
+        "time": 1700000000 + n,
+        "self_id": 99999,
+        "post_type": "message",
+        "message_type": "group",
+        "sub_type": "normal",
+        "message_id": n,
+        "group_id": group_id,
+        "user_id": user_id,
+        "message": [{"type": "text", "data": {"text": f"消息 {n}"}}],
+        "raw_message": f"消息 {n}",
+        "font": 0,
+        "sender": {"user_id": user_id, "nickname": "测试", "card": "", "role": "member"},
+    }
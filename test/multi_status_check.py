@@ -0,0 +1,65 @@
+"""多状态订阅的单次送达检查
+
+一个订阅者以状态集合订阅（含同一作用域的多个状态、状态与其通配符重叠、跨作用域，
+以及同时带 FieldFilter 字段索引），通过 publish 与 publish_many 发布各类状态的事件：
+- 事件状态属于订阅集合（或被其中的通配符覆盖）时回调恰好执行一次，否则不执行
+- 重复出现在集合中的状态不会导致重复送达
+
+运行: python test/multi_status_check.py
+"""
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+from uuid import uuid4
+
+from harness import run
+from base_cls import FieldFilter
+from event import Event, EventBus
+from bilibili.type import DanmakuType, LiveType
+
+SUBSCRIPTIONS = [
+    {DanmakuType.DANMAKU, DanmakuType.GIFT},
+    {DanmakuType.DANMAKU, DanmakuType.ALL},
+    [DanmakuType.GUARD, DanmakuType.GUARD, DanmakuType.GIFT],
+    {DanmakuType.DANMAKU, LiveType.OPEN, LiveType.CLOSE},
+    {LiveType.ALL, DanmakuType.ALL},
+]
+EVENT_STATUSES = [status for cls in (DanmakuType, LiveType) for status in cls if not status.is_wildcard]
+
+
+def covered(subscription, status) -> bool:
+    return any(status.matches(rule) for rule in subscription)
+
+
+async def check(subscription, indexed: bool) -> None:
+    bus = EventBus()
+    uuid = uuid4()
+    calls: Counter = Counter()
+
+    async def callback(event):
+        calls[event.data.n] += 1
+
+    event_filter = FieldFilter("room_display_id", [1, 2]) if indexed else None
+    bus.add_subscriber(uuid, callback, subscription, event_filter=event_filter)
+    events = [
+        Event(data=SimpleNamespace(n=n, room_display_id=1), status=status)
+        for n, status in enumerate(EVENT_STATUSES)
+    ]
+    for event in events[::2]:
+        await bus.publish(uuid, event)
+    await bus.publish_many(uuid, events[1::2])
+    await asyncio.sleep(0.01)
+    want = Counter(event.data.n for event in events if covered(subscription, event.status))
+    assert calls == want, (subscription, indexed, calls, want)
+    assert set(calls.values()) <= {1}, f"同一事件重复送达: {subscription}"
+
+
+async def main() -> None:
+    for subscription in SUBSCRIPTIONS:
+        for indexed in (False, True):
+            await check(subscription, indexed)
+    print(f"{len(SUBSCRIPTIONS)} 种多状态订阅 x {len(EVENT_STATUSES)} 种事件状态：匹配的事件各送达一次")
+
+
+if __name__ == '__main__':
+    run(main)
@@ -0,0 +1,118 @@
+"""Napcat 请求响应基准与回归检查
+
+- 对比接收循环内按 echo 分发响应与旧的"每个请求一个监听器"方式，在 1/10/100 个在途请求下的吞吐
+- 回归检查：事件处理因 EventBus 背压阻塞时，订阅者回调中发送的请求仍能及时收到响应
+
+运行: python test/napcat_echo_bench.py
+"""
+import asyncio
+import json
+import time
+from uuid import uuid4
+
+from harness import run
+from mock_onebot import MockOneBotServer, group_message
+from napcat.api.napcat_api import NapcatClient
+from event import EventBus, Event, DispatchExecutor
+from napcat.type import NapcatType
+from utils import MessageType
+
+
+async def send_with_listener(client: NapcatClient, message: dict) -> dict:
+    """旧实现：每个请求创建一个监听器，逐条检查 echo."""
+    echo = str(uuid4())
+    message["echo"] = echo
+    listener_id = await client.client.create_listener(buffer_size=1000)
+    try:
+        await client.client.send(message)
+        while True:
+            data, msg_type = await client.client.get_message(listener_id, client.timeout)
+            if msg_type == MessageType.Text:
+                data = json.loads(data)
+            if data.get("echo") == echo:
+                return data
+    finally:
+        await client.client.remove_listener(listener_id)
+
+
+async def bench(total: int = 3000, noise_rate: float = 200) -> None:
+    server = MockOneBotServer()
+    await server.start()
+    server.start_noise(noise_rate)
+    client = NapcatClient(server.url, receive_timeout=10)
+
+    async def ignore(data):
+        pass
+
+    client.set_handler(ignore)
+    await client.start()
+    await asyncio.sleep(0.2)
+    try:
+        for in_flight in (1, 10, 100):
+            for name, send in (
+                ("listener", lambda: send_with_listener(client, {"action": "get_status"})),
+                ("echo", lambda: client.send_request({"action": "get_status"})),
+            ):
+                # 旧实现需要响应广播到监听器，临时取消接收拦截器
+                client.client.set_interceptor(None if name == "listener" else client._intercept_response)
+                sem = asyncio.Semaphore(in_flight)
+
+                async def one():
+                    async with sem:
+                        await send()
+
+                start = time.perf_counter()
+                await asyncio.gather(*(one() for _ in range(total)))
+                elapsed = time.perf_counter() - start
+                print(f"in-flight {in_flight:3d}  {name:8s} {total / elapsed:8.0f} req/s")
+    finally:
+        await client.stop()
+        await server.stop()
+
+
+async def check_backpressure(events: int = 20) -> float:
+    """订阅者在回调中发送请求，同时事件处理被 BLOCK 策略阻塞.
+
+    响应若依赖事件处理循环，将等到 receive_timeout 才超时。
+    """
+    server = MockOneBotServer(latency=0.01)
+    await server.start()
+    client = NapcatClient(server.url, receive_timeout=5)
+    bus = EventBus(DispatchExecutor(max_in_flight=1, queue_size=1))
+    uid = uuid4()
+    replied = []
+
+    async def handler(data: dict) -> None:
+        await bus.publish(uid, Event(data=data, status=NapcatType.MESSAGE))
+
+    async def reply(event: Event) -> None:
+        replied.append(await client.send_request({"action": "send_group_msg"}))
+
+    bus.add_subscriber(uid, reply, NapcatType.MESSAGE, concurrency=1)
+    client.set_handler(handler)
+    await client.start()
+    await asyncio.sleep(0.2)
+    try:
+        start = time.perf_counter()
+        for n in range(events):
+            await server.push(group_message(n))
+        while len(replied) < events and time.perf_counter() - start < client.timeout * 2:
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - start
+    finally:
+        await bus.shutdown()
+        await client.stop()
+        await server.stop()
+    assert len(replied) == events and elapsed < client.timeout, f"响应被事件处理阻塞: {len(replied)}/{events}, {elapsed:.1f}s"
+    print(f"backpressure: {events} 个回调内请求在 {elapsed:.2f}s 内全部收到响应")
+    return elapsed
+
+
+async def main() -> None:
+    await check_backpressure()
+    await bench()
+
+
+if __name__ == '__main__':
+    # 日志输出会掩盖被测开销
+    run(main)
@@ -0,0 +1,84 @@
+"""NapcatSource 原始数据预过滤检查
+
+以夹具 fixtures/onebot11_mix.json 的 OneBot11 上报逐帧调用 NapcatSource._process_messages：
+- 只订阅 MESSAGE 且 raw_filter 限定两个群：其他状态的帧计入 skipped_no_subscriber，
+  其他群与私聊消息计入 skipped_raw_filter，两者都不构造 NapcatEvent；
+  送达的事件与先构造全部事件、再按 group_id 过滤的结果一致
+- 再为同一状态添加一个不带 raw_filter 的订阅者：不再有帧被 raw_filter 跳过，
+  带 raw_filter 的订阅者仍只收到两个群的消息
+- 没有任何订阅者时全部帧计入 skipped_no_subscriber
+
+运行: python test/napcat_prefilter_check.py
+"""
+import asyncio
+
+from harness import run, FakeContext
+from napcat_dispatch_bench import load_mix
+from event import EventBus
+from napcat.data import NapcatEvent
+from napcat.source.napcat_source import NapcatSource
+from napcat.type import NapcatType
+
+GROUPS = {614278901, 730145226}
+
+
+def make_source() -> tuple[NapcatSource, EventBus]:
+    bus = EventBus()
+    source = NapcatSource()
+    source.bind(FakeContext(bus))
+    return source, bus
+
+
+async def feed(source: NapcatSource, frames: list[dict]) -> dict[str, int]:
+    for frame in frames:
+        await source._process_messages(frame)
+    await asyncio.sleep(0.05)
+    return source.get_metrics()
+
+
+async def main() -> None:
+    frames = load_mix()
+    messages = [frame for frame in frames if NapcatType.get_type(frame.get("post_type", "")) == NapcatType.MESSAGE]
+    wanted = [frame for frame in messages if frame.get("group_id") in GROUPS]
+    # 参考结果：先构造全部事件，再按 group_id 过滤
+    expected = [NapcatEvent.from_dict(frame) for frame in wanted]
+
+    source, bus = make_source()
+    filtered: list = []
+
+    async def on_group(event):
+        filtered.append(event.data)
+
+    bus.add_subscriber(source.uuid, on_group, NapcatType.MESSAGE, raw_filter={"group_id": GROUPS})
+    metrics = await feed(source, frames)
+    assert filtered == expected, "送达的事件与先构造再过滤的结果不一致"
+    assert metrics == {
+        "received": len(frames),
+        "published": len(wanted),
+        "skipped_no_subscriber": len(frames) - len(messages),
+        "skipped_raw_filter": len(messages) - len(wanted),
+        "parse_errors": 0,
+    }, metrics
+    print(f"raw_filter: {metrics}")
+
+    everything: list = []
+
+    async def on_message(event):
+        everything.append(event.data)
+
+    bus.add_subscriber(source.uuid, on_message, NapcatType.MESSAGE)
+    filtered.clear()
+    skipped = metrics["skipped_raw_filter"]
+    metrics = await feed(source, frames)
+    assert metrics["skipped_raw_filter"] == skipped, "有不带 raw_filter 的订阅者时不应再跳过任何帧"
+    assert len(everything) == len(messages) and filtered == expected
+    print(f"with an unfiltered subscriber: {len(everything)} messages, {len(filtered)} passed raw_filter")
+
+    source, _ = make_source()
+    metrics = await feed(source, frames)
+    assert metrics["skipped_no_subscriber"] == len(frames) and metrics["published"] == 0, metrics
+    print(f"no subscriber: skipped_no_subscriber {metrics['skipped_no_subscriber']}")
+
+
+if __name__ == '__main__':
+    run(main)
@@ -0,0 +1,97 @@
+"""SubscriberGroup 分发索引基准与一致性检查
+
+- 基准：同一发布器下 10/100/500/1000 个订阅者时，索引查找（match）与逐个调用 BaseType.matches 的耗时
+- 检查：随机订阅组合（精确、通配符、多状态、FieldFilter 字段索引）下，
+  match 的结果与逐个调用 matches 得到的订阅者集合一致
+
+运行: python test/subscriber_dispatch_bench.py
+"""
+import random
+from types import SimpleNamespace
+from uuid import uuid4
+
+from harness import run, per_item
+from base_cls import FieldFilter
+from event import SubscriberGroup
+from event.subscriber import Subscriber
+from bilibili.type import DanmakuType, LiveType, DynamicType
+
+TYPES = (DanmakuType, LiveType, DynamicType)
+STATUSES = [member for cls in TYPES for member in cls]
+# 事件只会以具体状态发布，通配符仅作为订阅规则
+EVENT_STATUSES = [status for status in STATUSES if not status.is_wildcard]
+
+
+async def callback(event):
+    pass
+
+
+def linear_match(group: SubscriberGroup, uid, status, data=None) -> list[Subscriber]:
+    """参考实现：逐个订阅者调用 BaseType.matches，再检查字段过滤."""
+    result = []
+    for subscriber in group.get_subscriber(uid):
+        if not any(status.matches(rule) for rule in subscriber.statuses):
+            continue
+        if subscriber._index is not None:
+            if data is None:
+                continue
+            field_name, values = subscriber._index
+            if getattr(data, field_name, None) not in values:
+                continue
+        result.append(subscriber)
+    return result
+
+
+def random_subscriber(rng: random.Random) -> Subscriber:
+    kind = rng.random()
+    if kind < 0.5:
+        status = rng.choice(STATUSES)
+    else:
+        cls = rng.choice(TYPES)
+        status = rng.sample(list(cls), rng.randint(2, 3))
+        if rng.random() < 0.3:
+            # 跨作用域的多状态订阅
+            status.append(rng.choice(STATUSES))
+    event_filter = FieldFilter("room_display_id", rng.sample(range(5), rng.randint(1, 2))) if rng.random() < 0.3 else None
+    return Subscriber(callback=callback, status_filter=status, event_filter=event_filter)
+
+
+def check_parity(rounds: int = 200, seed: int = 1) -> int:
+    rng = random.Random(seed)
+    checked = 0
+    for _ in range(rounds):
+        group = SubscriberGroup()
+        uid = uuid4()
+        for _ in range(rng.randint(1, 40)):
+            group.add(uid, random_subscriber(rng))
+        for status in EVENT_STATUSES:
+            for data in (None, SimpleNamespace(room_display_id=rng.randrange(6))):
+                got = group.match(uid, status, data)
+                want = linear_match(group, uid, status, data)
+                assert sorted(map(id, got)) == sorted(map(id, want)), (status, data)
+                assert len(set(map(id, got))) == len(got), f"同一事件重复命中: {status}"
+                checked += 1
+    return checked
+
+
+def bench(subscribers: int, lookups: int = 20000) -> tuple[float, float]:
+    group = SubscriberGroup()
+    uid = uuid4()
+    rules = [DanmakuType.DANMAKU, DanmakuType.GIFT, DanmakuType.GUARD, DanmakuType.ALL, LiveType.OPEN]
+    for i in range(subscribers):
+        group.add(uid, Subscriber(callback=callback, status_filter=rules[i % len(rules)]))
+    status = DanmakuType.DANMAKU
+    linear = per_item(lambda _: [s for s in group.get_subscriber(uid) if status.matches(s.status_filter)], range(lookups))
+    indexed = per_item(lambda _: group.match(uid, status), range(lookups))
+    return linear, indexed
+
+
+def main() -> None:
+    print(f"parity: {check_parity()} 次查找与逐个 matches 一致")
+    for n in (10, 100, 500, 1000):
+        linear, indexed = bench(n)
+        print(f"subscribers {n:5d}: matches {linear * 1e6:8.2f} us  index {indexed * 1e6:6.2f} us")
+
+
+if __name__ == '__main__':
+    run(main)
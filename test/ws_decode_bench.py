@@ -0,0 +1,111 @@
+"""AsyncWebSocketClient 文本帧解码基准与检查
+
+以假连接向接收循环回放夹具 fixtures/onebot11_mix.json 中的 OneBot11 上报（每帧作为文本消息）。
+
+- 检查：设置 codec 后每帧只解码一次，各监听器收到同一个解析结果 (obj, MessageType.Json)；
+  无法解码的帧仍以 MessageType.Text 原样投递，并计入 get_metrics()["codec"]["decode_errors"]
+- 基准：1/4/8 个监听器时，每帧 接收 + 广播 + 消费 的 CPU 时间：
+  不设 codec、每个监听器各自 json.loads，与设置 codec（json / orjson）解码一次
+
+运行: python test/ws_decode_bench.py
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Optional
+
+from harness import run
+from napcat_dispatch_bench import load_mix
+from utils import AsyncWebSocketClient, MessageType
+from utils.wsclient import JsonCodec, get_codec, orjson
+
+URI = "ws://127.0.0.1:1/"  # 不建立连接，由假连接提供消息
+
+
+class FakeConnection:
+    """按顺序返回文本帧，回放完毕后停止客户端的接收循环."""
+
+    def __init__(self, client: AsyncWebSocketClient, frames: list[str]):
+        self.client = client
+        self.frames = iter(frames)
+        self.metrics: dict = {}
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def receive(self) -> tuple[str, MessageType]:
+        try:
+            return next(self.frames), MessageType.Text
+        except StopIteration:
+            self.client._running = False
+            raise asyncio.TimeoutError
+
+
+async def replay(frames: list[str], listeners: int, codec: Optional[JsonCodec]) -> tuple[AsyncWebSocketClient, list[list]]:
+    """回放全部帧，返回客户端与各监听器收到的消息."""
+    client = AsyncWebSocketClient(URI, listener_buffer_size=len(frames) + 10, codec=codec)
+    ids = [await client.create_listener() for _ in range(listeners)]
+    client.connection = FakeConnection(client, frames)
+    client._running = True
+    await client._process_receive()
+    received = []
+    for listener_id in ids:
+        messages = []
+        while (item := client.get_message_nowait(listener_id)) is not None:
+            messages.append(item)
+        received.append(messages)
+    return client, received
+
+
+async def check(frames: list[str]) -> None:
+    bad = ["{bad", "not json", ""]
+    mixed = frames[:50] + bad + frames[50:100]
+    client, received = await replay(mixed, 3, JsonCodec())
+    first = received[0]
+    assert len(first) == len(mixed)
+    for i, (message, msg_type) in enumerate(first):
+        if mixed[i] in bad:
+            assert msg_type == MessageType.Text and message == mixed[i], (i, message)
+        else:
+            assert msg_type == MessageType.Json and message == json.loads(mixed[i]), i
+            # 同一帧只解码一次，所有监听器共享同一个对象
+            assert all(other[i][0] is message for other in received[1:]), i
+    metrics = client.get_metrics()["codec"]
+    assert metrics == {"name": "json", "decoded": 100, "decode_errors": len(bad)}, metrics
+
+    client, received = await replay(mixed, 1, None)
+    assert [message for message, _ in received[0]] == mixed
+    assert all(msg_type == MessageType.Text for _, msg_type in received[0])
+    assert client.get_metrics()["codec"] == {"name": None, "decoded": 0, "decode_errors": 0}
+    print(f"decode once: {len(mixed)} frames, shared objects across listeners, decode_errors {len(bad)}")
+
+
+async def bench(frames: list[str], listeners: int, codec: Optional[JsonCodec], repeat: int = 3) -> float:
+    """每帧 接收 + 广播 + 消费 的 CPU 时间（秒）."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        _, received = await replay(frames, listeners, codec)
+        for messages in received:
+            for message, msg_type in messages:
+                data = json.loads(message) if msg_type == MessageType.Text else message
+                data.get("post_type")
+        best = min(best, time.process_time() - start)
+    return best / len(frames)
+
+
+async def main() -> None:
+    frames = [json.dumps(raw, ensure_ascii=False) for raw in load_mix()] * 20
+    await check(frames)
+    codecs = [("decode-once json", get_codec("json"))]
+    if orjson is not None:
+        codecs.append(("decode-once orjson", get_codec("orjson")))
+    for listeners in (1, 4, 8):
+        results = [("per-listener json", await bench(frames, listeners, None))]
+        results += [(name, await bench(frames, listeners, codec)) for name, codec in codecs]
+        print(f"listeners {listeners}: " + "  ".join(f"{name} {cpu * 1e6:6.1f} us" for name, cpu in results))
+
+
+if __name__ == '__main__':
+    run(main, logging.CRITICAL)
@@ -0,0 +1,82 @@
+"""AsyncWebSocketClient 监听器后端基准与检查
+
+- 基准：1/10/100/1000 个监听器时，Queue 与 Ring 后端广播一帧的耗时；
+  Ring 后端只写入共享缓冲区一次，耗时与监听器数量无关
+- 检查：Ring 后端下 100 个并发消费者按序收到全部消息；
+  消费落后超过容量时抛出 ListenerLaggedError 并报告丢失数量，之后从最旧的可读消息继续
+
+运行: python test/ws_ring_bench.py
+"""
+import asyncio
+import time
+
+from harness import run
+from utils import AsyncWebSocketClient, MessageType
+from utils.wsclient import ListenerLaggedError
+
+URI = "ws://127.0.0.1:1/"  # 不建立连接，直接调用广播
+
+
+async def bench(backend: str, listeners: int, frames: int = 20000) -> float:
+    client = AsyncWebSocketClient(URI, listener_backend=backend, listener_buffer_size=frames + 10, max_listeners=5000)
+    for _ in range(listeners):
+        await client.create_listener()
+    start = time.perf_counter()
+    for _ in range(frames):
+        await client._broadcast_message("x", MessageType.Text)
+    return (time.perf_counter() - start) / frames
+
+
+async def check_fanout(listeners: int = 100, frames: int = 1000) -> None:
+    client = AsyncWebSocketClient(URI, listener_backend="ring", listener_buffer_size=frames)
+    ids = [await client.create_listener() for _ in range(listeners)]
+
+    async def consume(listener_id) -> list:
+        return [(await client.get_message(listener_id, 5))[0] for _ in range(frames)]
+
+    consumers = [asyncio.create_task(consume(listener_id)) for listener_id in ids]
+    for n in range(frames):
+        await client._broadcast_message(n, MessageType.Json)
+        if n % 100 == 0:
+            await asyncio.sleep(0)
+    received = await asyncio.gather(*consumers)
+    assert all(messages == list(range(frames)) for messages in received), "消费者未按序收到全部消息"
+
+
+async def check_lag() -> None:
+    client = AsyncWebSocketClient(URI, listener_backend="ring", listener_buffer_size=10)
+    listener_id = await client.create_listener()
+    for n in range(25):
+        await client._broadcast_message(n, MessageType.Json)
+    try:
+        await client.get_message(listener_id, 1)
+        raise AssertionError("落后超过容量时应抛出 ListenerLaggedError")
+    except ListenerLaggedError as e:
+        assert e.missed == 15, e.missed
+    assert (await client.get_message(listener_id, 1))[0] == 15
+    assert client.get_metrics()["listeners"]["lagged"] == 15
+
+    # 等待中的消费者在下一次写入时被唤醒
+    for _ in range(9):
+        await client.get_message(listener_id, 1)
+
+    async def later():
+        await asyncio.sleep(0.05)
+        await client._broadcast_message("wake", MessageType.Json)
+
+    asyncio.create_task(later())
+    assert (await client.get_message(listener_id, 1))[0] == "wake"
+
+
+async def main() -> None:
+    await check_fanout()
+    await check_lag()
+    print("fan-out / lag / wakeup: ok")
+    for listeners in (1, 10, 100, 1000):
+        queue = await bench("queue", listeners)
+        ring = await bench("ring", listeners)
+        print(f"listeners {listeners:5d}: queue {queue * 1e6:8.2f} us/frame  ring {ring * 1e6:6.2f} us/frame")
+
+
+if __name__ == '__main__':
+    run(main)
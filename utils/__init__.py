@@ -3,17 +3,53 @@ from .logger import (
 )
 from .wsclient import (
     AsyncWebSocketClient,
+    JsonCodec,
+    OrjsonCodec,
+    get_codec,
+    ListenerBackend,
     ListenerId,
-    MessageType
+    ListenerLaggedError,
+    MessageType,
+    SendPriority
 )
 from .data_pair import (
     DataPair
 )
+from .loop_thread import (
+    LoopThread
+)
+from .intern_pool import (
+    InternPool
+)
+from .sketch import (
+    HyperLogLog,
+    CountMinSketch
+)
+from .aho_corasick import (
+    AhoCorasick
+)
+from .keyword_filter import (
+    KeywordFilter,
+    extract_text
+)
 
 __all__ = [
     "setup_logging",
     "AsyncWebSocketClient",
+    "JsonCodec",
+    "OrjsonCodec",
+    "get_codec",
+    "ListenerBackend",
     "ListenerId",
+    "ListenerLaggedError",
     "MessageType",
-    "DataPair"
+    "SendPriority",
+    "DataPair",
+    "LoopThread",
+    "InternPool",
+    "HyperLogLog",
+    "CountMinSketch",
+    "AhoCorasick",
+    "KeywordFilter",
+    "extract_text",
 ]
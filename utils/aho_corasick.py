@@ -0,0 +1,148 @@
+from collections import deque
+from typing import Iterable
+
+
+class AhoCorasick:
+    """Aho-Corasick 多关键词匹配自动机.
+
+    一次扫描文本即可找出所有出现的关键词，耗时与关键词数量无关。
+    关键词增删是增量的：新增只插入新的 trie 路径，删除只取消节点的输出标记，
+    失配指针在下一次匹配前统一重新计算；删除累积过多时才整体重建以回收节点。
+    """
+
+    def __init__(self, words: Iterable[str] = (), ignore_case: bool = False):
+        """初始化自动机.
+
+        Args:
+            words: 初始关键词
+            ignore_case: 是否忽略大小写
+        """
+        self.ignore_case = ignore_case
+        self._goto: list[dict[str, int]] = [{}]  # 状态 -> {字符: 下一状态}
+        self._word: list[str | None] = [None]  # 状态 -> 在该状态结束的关键词
+        self._fail: list[int] = [0]  # 状态 -> 失配指针
+        self._out: list[tuple[str, ...]] = [()]  # 状态 -> 该状态可输出的所有关键词（含失配链）
+        self._words: set[str] = set()
+        self._removed = 0  # 已删除但仍占用节点的关键词数量
+        self._dirty = False
+        self.add(*words)
+
+    def _normalize(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def add(self, *words: str) -> None:
+        """添加关键词（空字符串忽略）."""
+        goto, word_at = self._goto, self._word
+        for word in words:
+            key = self._normalize(word)
+            if not key or key in self._words:
+                continue
+            state = 0
+            for ch in key:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    word_at.append(None)
+                state = nxt
+            word_at[state] = key
+            self._words.add(key)
+            self._dirty = True
+
+    def remove(self, *words: str) -> None:
+        """删除关键词，不存在的关键词忽略."""
+        for word in words:
+            key = self._normalize(word)
+            if key not in self._words:
+                continue
+            self._words.discard(key)
+            state = 0
+            for ch in key:
+                state = self._goto[state][ch]
+            self._word[state] = None
+            self._removed += 1
+            self._dirty = True
+        if self._removed > max(len(self._words), 64):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """按当前关键词整体重建 trie，回收已删除关键词的节点."""
+        words = list(self._words)
+        self._goto, self._word = [{}], [None]
+        self._words.clear()
+        self._removed = 0
+        self.add(*words)
+
+    def _build(self) -> None:
+        """广度优先计算失配指针及各状态的输出."""
+        goto, word_at = self._goto, self._word
+        fail = [0] * len(goto)
+        out: list[tuple[str, ...]] = [()] * len(goto)
+        queue = deque()
+        for state in goto[0].values():
+            queue.append(state)
+            out[state] = (word_at[state],) if word_at[state] is not None else ()
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                f = goto[f].get(ch, 0)
+                fail[nxt] = f
+                own = (word_at[nxt],) if word_at[nxt] is not None else ()
+                out[nxt] = own + out[f]
+        self._fail, self._out = fail, out
+        self._dirty = False
+
+    def find(self, text: str) -> list[str]:
+        """找出文本中出现的所有关键词.
+
+        Args:
+            text: 待匹配文本
+
+        Returns:
+            list[str]: 出现的关键词（去重，按首次出现的结束位置排序）
+        """
+        if self._dirty:
+            self._build()
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        found: dict[str, None] = {}
+        state = 0
+        for ch in self._normalize(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = (goto[state] if state else root).get(ch, 0)
+            if out[state]:
+                for word in out[state]:
+                    found[word] = None
+        return list(found)
+
+    def search(self, text: str) -> bool:
+        """文本中是否出现任一关键词（命中即返回）."""
+        if self._dirty:
+            self._build()
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        state = 0
+        for ch in self._normalize(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = (goto[state] if state else root).get(ch, 0)
+            if out[state]:
+                return True
+        return False
+
+    @property
+    def words(self) -> set[str]:
+        """当前关键词集合（忽略大小写时为小写形式）."""
+        return set(self._words)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        return self._normalize(word) in self._words
@@ -0,0 +1,104 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class InternPool(Generic[T]):
+    """有界 LRU 驻留池.
+
+    以 key 缓存值，命中时返回已缓存的实例，使重复出现的数据共享同一个对象；
+    超出容量时淘汰最久未使用的条目。内部加锁，可在多个线程间共享。
+
+    Attributes:
+        maxsize: 最大条目数
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """初始化驻留池.
+
+        Args:
+            maxsize: 最大条目数，必须大于0
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize 必须大于0")
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, T] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """查找已驻留的值，命中时将其标记为最近使用.
+
+        Args:
+            key: 键
+
+        Returns:
+            已驻留的值，未命中返回 None
+        """
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: T) -> T:
+        """驻留一个值，池满时淘汰最久未使用的条目.
+
+        Args:
+            key: 键
+            value: 值
+
+        Returns:
+            驻留后的值（其他线程已先驻留同一键时返回已有的值）
+        """
+        with self._lock:
+            existing = self._data.get(key)
+            if existing is not None:
+                return existing
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+            return value
+
+    def intern(self, value: T) -> T:
+        """以值本身为键驻留（适用于字符串等可哈希值）.
+
+        Args:
+            value: 值
+
+        Returns:
+            与 value 相等的已驻留实例
+        """
+        existing = self.get(value)
+        if existing is not None:
+            return existing
+        return self.put(value, value)
+
+    def clear(self) -> None:
+        """清空池（不重置统计）."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """获取命中、未命中、淘汰次数及命中率."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,77 @@
+from typing import Any, Iterable, Optional, TYPE_CHECKING
+
+from base_cls import BaseFilter
+from .aho_corasick import AhoCorasick
+
+if TYPE_CHECKING:
+    from event import Event
+
+
+def extract_text(data: Any) -> Optional[str]:
+    """提取事件数据中的文本.
+
+    支持 message 为字符串的数据（如 DanmakuMsgData），
+    以及 message 为消息段列表的数据（如 napcat 消息事件，取所有 TextNode 的文本）。
+
+    Returns:
+        文本内容，数据不含文本时返回 None
+    """
+    message = getattr(data, "message", None)
+    if isinstance(message, str):
+        return message
+    texts = getattr(message, "texts", None)
+    if texts is not None:
+        return "\n".join(texts)
+    return None
+
+
+class KeywordFilter(BaseFilter):
+    """关键词过滤器.
+
+    基于 Aho-Corasick 自动机，对每条消息只扫描一次文本，与关键词数量无关。
+    默认作为触发词：消息包含任一关键词时通过；exclude=True 时作为屏蔽词：包含任一关键词时拦截。
+    """
+
+    def __init__(self, keywords: Iterable[str], exclude: bool = False, ignore_case: bool = False):
+        """初始化关键词过滤器.
+
+        Args:
+            keywords: 关键词列表
+            exclude: 是否作为屏蔽词使用
+            ignore_case: 是否忽略大小写
+        """
+        self.exclude = exclude
+        self._automaton = AhoCorasick(keywords, ignore_case)
+
+    @property
+    def filters(self) -> set[str]:
+        """当前关键词集合."""
+        return self._automaton.words
+
+    def add(self, *keywords: str) -> None:
+        """增加关键词，下一次检查前增量重建自动机."""
+        self._automaton.add(*keywords)
+
+    def remove(self, *keywords: str) -> None:
+        """删除关键词，下一次检查前增量重建自动机."""
+        self._automaton.remove(*keywords)
+
+    def matched(self, event: "Event") -> list[str]:
+        """返回事件文本中出现的关键词.
+
+        Args:
+            event: 消息事件
+
+        Returns:
+            list[str]: 命中的关键词，事件不含文本时为空列表
+        """
+        text = extract_text(event.data)
+        if not text:
+            return []
+        return self._automaton.find(text)
+
+    def check(self, event: "Event") -> bool:
+        """检查事件是否通过过滤器."""
+        text = extract_text(event.data)
+        hit = bool(text) and self._automaton.search(text)
+        return not hit if self.exclude else hit
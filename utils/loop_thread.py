@@ -0,0 +1,94 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from logging import getLogger
+from typing import Any, Coroutine, Optional
+
+_log = getLogger("LoopThread")
+
+
+class LoopThread:
+    """在独立线程中运行的事件循环.
+
+    线程启动后以 loop.run_forever() 驱动循环，协程通过 submit 线程安全地投递，
+    stop 时停止循环并等待线程退出。
+
+    Attributes:
+        name: 线程名称
+        loop: 线程持有的事件循环，start 之后可用
+    """
+
+    def __init__(self, name: str):
+        """初始化循环线程.
+
+        Args:
+            name: 线程名称
+        """
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    def start(self) -> None:
+        """启动线程并等待事件循环就绪."""
+        if self.is_alive:
+            return
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run(self) -> None:
+        """线程入口：创建事件循环并运行至 stop."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            # 取消仍未结束的任务后关闭循环
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """线程安全地向该循环投递协程.
+
+        Args:
+            coro: 协程
+
+        Returns:
+            concurrent.futures.Future: 协程结果
+        """
+        if self.loop is None:
+            raise RuntimeError(f"{self.name} 尚未启动")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """停止事件循环并等待线程退出.
+
+        Args:
+            timeout: 等待线程退出的超时时间（秒），None 表示无限等待
+
+        Returns:
+            bool: 线程已退出返回 True，超时返回 False
+        """
+        if self._thread is None:
+            return True
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            _log.warning(f"{self.name} 未能在超时内退出")
+            return False
+        self._thread = None
+        return True
+
+    @property
+    def is_alive(self) -> bool:
+        """检查线程是否在运行."""
+        return self._thread is not None and self._thread.is_alive()
@@ -1,6 +1,7 @@
 # @Author Fish.zh@outlook.com
 # @Version 1.1
 import asyncio
+from collections import deque
 from enum import Enum
 import json
 import logging
@@ -10,11 +11,16 @@ import time
 import uuid
 from asyncio import QueueFull
 from dataclasses import dataclass, field
-from typing import Any, Dict, NewType, Optional, Tuple, Union
+from typing import Any, Callable, Dict, NewType, Optional, Tuple, Union
 
 import aiohttp
 from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
 
+try:
+    import orjson
+except ImportError:  # 可选依赖
+    orjson = None
+
 ListenerId = NewType("ListenerId", str)
 
 
@@ -26,9 +32,71 @@ class MessageType(Enum):
     Pong = "pong"
     Close = "close"
     Error = "error"
+    Json = "json"  # 已由客户端解码器解析的文本消息
     NONE = "none"
 
 
+class JsonCodec:
+    """基于标准库 json 的编解码器
+
+    子类可替换 loads/dumps 以使用其他实现。
+
+    Attributes:
+        name: 编解码器名称
+    """
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """解码文本消息"""
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        """编码为文本消息"""
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JsonCodec):
+    """基于 orjson 的编解码器（需安装 orjson）"""
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """解码文本消息"""
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        """编码为文本消息"""
+        return orjson.dumps(obj).decode()
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """获取编解码器
+
+    Args:
+        name: "json" 或 "orjson"，None 表示已安装 orjson 时优先使用 orjson
+
+    Returns:
+        JsonCodec: 编解码器实例
+    """
+    if name is None:
+        name = "orjson" if orjson is not None else "json"
+    if name == "orjson":
+        return OrjsonCodec()
+    if name == "json":
+        return JsonCodec()
+    raise ValueError(f"Unknown codec: {name}")
+
+
+class SendPriority(Enum):
+    """发送优先级枚举，按定义顺序出队"""
+    High = "high"  # API 请求等需要尽快发出的消息
+    Normal = "normal"
+    Low = "low"  # 批量广播等可延后的消息
+
+
 class WebSocketState(Enum):
     """WebSocket 连接状态枚举"""
     Disconnected = "disconnected"
@@ -59,6 +127,24 @@ class ListenerClosedError(WebSocketError):
     pass
 
 
+class ListenerLaggedError(WebSocketError):
+    """监听器消费过慢，未读消息已被环形缓冲区覆盖
+
+    Attributes:
+        missed: 被覆盖（丢失）的消息数量
+    """
+
+    def __init__(self, listener_id: "ListenerId", missed: int):
+        super().__init__(f"Listener {listener_id} lagged by {missed} messages")
+        self.missed = missed
+
+
+class ListenerBackend(Enum):
+    """监听器后端枚举"""
+    Queue = "queue"  # 每个监听器独立的 asyncio.Queue
+    Ring = "ring"  # 所有监听器共享一个环形缓冲区，各自持有读游标
+
+
 @dataclass
 class WebSocketConfig:
     """WebSocket 配置类
@@ -81,7 +167,9 @@ class WebSocketConfig:
         compression: 压缩级别 0-15，默认 15，0 表示不压缩
         verify_ssl: 是否验证 SSL 证书，默认 True
         max_listeners: 最大监听器数量，默认 1000
-        listener_buffer_size: 每个监听器的缓冲区大小，默认 100
+        listener_buffer_size: 每个监听器的缓冲区大小，默认 100；
+            Ring 后端下为共享环形缓冲区的容量
+        listener_backend: 监听器后端，默认 Queue
     """
     uri: str
     headers: Dict[str, str] = field(default_factory = dict)
@@ -98,6 +186,7 @@ class WebSocketConfig:
     verify_ssl: bool = True
     max_listeners: int = 1000
     listener_buffer_size: int = 100
+    listener_backend: ListenerBackend = ListenerBackend.Queue
 
     def __post_init__(self):
         """配置验证
@@ -111,6 +200,9 @@ class WebSocketConfig:
             raise ValueError("Heartbeat must be positive")
         if self.reconnect_attempts < 0:
             raise ValueError("Reconnect attempts cannot be negative")
+        if self.listener_buffer_size <= 0:
+            raise ValueError("Listener buffer size must be positive")
+        self.listener_backend = ListenerBackend(self.listener_backend)
 
 
 class WebSocketListener:
@@ -247,6 +339,187 @@ class WebSocketListener:
             raise StopAsyncIteration
 
 
+class RingBuffer:
+    """监听器共享的有界环形缓冲区
+
+    写入只覆盖一个槽位并推进序号，与监听器数量无关；
+    等待中的消费者通过同一个 Future 统一唤醒。
+
+    Attributes:
+        capacity: 缓冲区容量
+        seq: 已写入的消息总数（下一条消息的序号）
+    """
+
+    def __init__(self, capacity: int):
+        """初始化环形缓冲区
+
+        Args:
+            capacity: 缓冲区容量
+        """
+        self.capacity = capacity
+        self.seq = 0
+        self._slots: list = [None] * capacity
+        self._waiter: Optional[asyncio.Future] = None
+
+    def append(self, item: Tuple[Any, MessageType]) -> None:
+        """写入一条消息并唤醒等待中的消费者
+
+        Args:
+            item: (消息内容, 消息类型)
+        """
+        self._slots[self.seq % self.capacity] = item
+        self.seq += 1
+        self.wake()
+
+    def read(self, cursor: int) -> Tuple[Any, MessageType]:
+        """读取指定序号的消息，调用方需保证该序号仍在缓冲区内"""
+        return self._slots[cursor % self.capacity]
+
+    @property
+    def oldest(self) -> int:
+        """缓冲区内最旧消息的序号"""
+        return max(0, self.seq - self.capacity)
+
+    async def wait(self) -> None:
+        """等待下一次写入或唤醒"""
+        if self._waiter is None or self._waiter.done():
+            self._waiter = asyncio.get_running_loop().create_future()
+        await asyncio.shield(self._waiter)
+
+    def wake(self) -> None:
+        """唤醒所有等待中的消费者"""
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+        self._waiter = None
+
+
+class RingListener:
+    """基于共享环形缓冲区的消息监听器
+
+    只持有读游标，不复制消息；消费落后超过缓冲区容量时，
+    下一次读取抛出 ListenerLaggedError 并将游标移到最旧的可读消息，而不是被驱逐。
+
+    Attributes:
+        id: 监听器唯一标识符
+        cursor: 下一条待读消息的序号
+        created_at: 创建时间戳
+        lagged: 累计丢失的消息数量
+    """
+
+    def __init__(self, ring: RingBuffer):
+        """初始化监听器，只接收创建之后的消息
+
+        Args:
+            ring: 共享的环形缓冲区
+        """
+        self.id = ListenerId(str(uuid.uuid4()))
+        self.cursor = ring.seq
+        self.created_at = time.time()
+        self.lagged = 0
+        self._ring = ring
+        self._closed = False
+
+    def _take(self) -> Optional[Tuple[Any, MessageType]]:
+        """读取下一条消息，无数据返回 None
+
+        Raises:
+            ListenerClosedError: 监听器已关闭时抛出
+            ListenerLaggedError: 未读消息已被覆盖时抛出
+        """
+        if self._closed:
+            raise ListenerClosedError(f"Listener {self.id} is closed")
+
+        ring = self._ring
+        if self.cursor < ring.oldest:
+            missed = ring.oldest - self.cursor
+            self.cursor = ring.oldest
+            self.lagged += missed
+            raise ListenerLaggedError(self.id, missed)
+        if self.cursor >= ring.seq:
+            return None
+
+        item = ring.read(self.cursor)
+        self.cursor += 1
+        return item
+
+    async def get(self, timeout: Optional[float] = None) -> Tuple[Any, MessageType]:
+        """获取消息（阻塞）
+
+        Args:
+            timeout: 超时时间（秒），None 表示无限等待
+
+        Returns:
+            Tuple[Any, MessageType]: 消息内容和类型
+
+        Raises:
+            ListenerClosedError: 监听器已关闭时抛出
+            ListenerLaggedError: 消费过慢导致消息丢失时抛出
+            asyncio.TimeoutError: 超时时抛出
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            item = self._take()
+            if item is not None:
+                return item
+            if deadline is None:
+                await self._ring.wait()
+            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                await asyncio.wait_for(self._ring.wait(), timeout = remaining)
+
+    def get_nowait(self) -> Optional[Tuple[Any, MessageType]]:
+        """非阻塞获取消息
+
+        Returns:
+            Optional[Tuple[Any, MessageType]]: 消息内容和类型，无数据时返回 None
+
+        Raises:
+            ListenerClosedError: 监听器已关闭时抛出
+            ListenerLaggedError: 消费过慢导致消息丢失时抛出
+        """
+        return self._take()
+
+    def close(self) -> None:
+        """关闭监听器并唤醒等待中的消费者"""
+        self._closed = True
+        self._ring.wake()
+
+    @property
+    def is_closed(self) -> bool:
+        """检查监听器是否已关闭
+
+        Returns:
+            bool: 已关闭返回 True，否则返回 False
+        """
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        """未读消息数量"""
+        return self._ring.seq - max(self.cursor, self._ring.oldest)
+
+    def __aiter__(self):
+        """返回异步迭代器"""
+        return self
+
+    async def __anext__(self):
+        """异步迭代下一个消息
+
+        Returns:
+            Tuple[Any, MessageType]: 消息内容和类型
+
+        Raises:
+            StopAsyncIteration: 监听器关闭时抛出
+        """
+        try:
+            return await self.get()
+        except ListenerClosedError:
+            raise StopAsyncIteration
+
+
 class AioHttpWebSocketConnection:
     """基于 aiohttp 的 WebSocket 连接管理
 
@@ -262,15 +535,22 @@ class AioHttpWebSocketConnection:
         metrics: 连接指标统计
     """
 
-    def __init__(self, config: WebSocketConfig, logger: logging.Logger):
+    def __init__(
+        self,
+        config: WebSocketConfig,
+        logger: logging.Logger,
+        codec: Optional[JsonCodec] = None,
+    ):
         """初始化连接管理器
 
         Args:
             config: WebSocket 配置对象
             logger: 日志记录器实例
+            codec: 字典消息的编码器，默认使用标准库 json
         """
         self.config = config
         self.logger = logger
+        self.codec = codec or JsonCodec()
 
         self.websocket: Optional[ClientWebSocketResponse] = None
         self.session: Optional[ClientSession] = None
@@ -390,7 +670,7 @@ class AioHttpWebSocketConnection:
         try:
             # 格式化消息
             if isinstance(message, dict):
-                formatted = json.dumps(message)
+                formatted = self.codec.dumps(message)
             elif isinstance(message, bytes):
                 formatted = message
             else:
@@ -582,6 +862,8 @@ class AsyncWebSocketClient:
         verify_ssl: bool = True,
         max_listeners: int = 1000,
         listener_buffer_size: int = 100,
+        listener_backend: Union[ListenerBackend, str] = ListenerBackend.Queue,
+        codec: Optional[JsonCodec] = None,
     ):
         """初始化异步 WebSocket 客户端
 
@@ -602,6 +884,10 @@ class AsyncWebSocketClient:
             verify_ssl: 验证 SSL，默认 True
             max_listeners: 最大监听器数，默认 1000
             listener_buffer_size: 监听器缓冲区大小，默认 100
+            listener_backend: 监听器后端，默认 Queue；Ring 为共享环形缓冲区
+            codec: 文本消息解码器，设置后每条文本消息只解码一次，
+                监听器收到共享的解析结果 (obj, MessageType.Json)，不应修改该对象；
+                解码失败的消息仍以 MessageType.Text 原样投递。默认不解码
         """
         # 创建配置
         self.config = WebSocketConfig(
@@ -620,25 +906,47 @@ class AsyncWebSocketClient:
             verify_ssl = verify_ssl,
             max_listeners = max_listeners,
             listener_buffer_size = listener_buffer_size,
+            listener_backend = listener_backend,
         )
 
         # 设置日志
         self.logger = logger or logging.getLogger(__name__)
 
+        # 解码器
+        self.codec = codec
+        self._codec_metrics = {
+            "decoded": 0,
+            "decode_errors": 0,
+        }
+
         # 核心组件
-        self.connection = AioHttpWebSocketConnection(self.config, self.logger)
+        self.connection = AioHttpWebSocketConnection(self.config, self.logger, codec)
         self.reconnection = ReconnectionStrategy(self.config)
 
         # 监听器管理
-        self._listeners: Dict[ListenerId, WebSocketListener] = {}
+        self._listeners: Dict[ListenerId, Union[WebSocketListener, RingListener]] = {}
         self._listeners_lock = threading.Lock()
+        self._ring: Optional[RingBuffer] = None
+        if self.config.listener_backend == ListenerBackend.Ring:
+            self._ring = RingBuffer(self.config.listener_buffer_size)
+        # 接收拦截器：在广播前于接收循环内调用，返回 True 表示消息已被消费
+        self._interceptor: Optional[Callable[[Any, MessageType], bool]] = None
 
         # 状态控制
         self._running = False
         self._main_task: Optional[asyncio.Task] = None
 
-        # 发送队列
-        self._send_queue = asyncio.Queue(maxsize = self.config.send_queue_size)
+        # 发送队列：按优先级分道，条目为 (消息, 入队时间)
+        self._send_lanes: Dict[SendPriority, deque] = {priority: deque() for priority in SendPriority}
+        self._send_pending = 0
+        self._send_ready = asyncio.Event()
+        self._connected = asyncio.Event()
+        self._send_metrics = {
+            "sent": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+            "wait_last": 0.0,
+        }
 
     @property
     def running(self) -> bool:
@@ -712,13 +1020,25 @@ class AsyncWebSocketClient:
 
         self.logger.info("WebSocket client stopped")
 
+    def set_interceptor(self, interceptor: Optional[Callable[[Any, MessageType], bool]]) -> None:
+        """设置接收拦截器
+
+        拦截器在接收循环内、广播到监听器之前同步调用，返回 True 的消息不再广播。
+        不经过监听器缓冲区，因此不会因监听器积压被丢弃或被淘汰，
+        适合按 echo 分发请求响应等必须送达且处理很轻的消息。拦截器不得阻塞。
+
+        Args:
+            interceptor: (消息内容, 消息类型) -> 是否已消费，None 表示取消拦截
+        """
+        self._interceptor = interceptor
+
     async def create_listener(self, buffer_size: Optional[int] = None) -> ListenerId:
         """创建消息监听器
 
         如果监听器数量达到上限，自动淘汰最旧的监听器。
 
         Args:
-            buffer_size: 缓冲区大小，默认使用配置值
+            buffer_size: 缓冲区大小，默认使用配置值；Ring 后端下忽略
 
         Returns:
             ListenerId: 新监听器的唯一标识符
@@ -726,7 +1046,10 @@ class AsyncWebSocketClient:
         if buffer_size is None:
             buffer_size = self.config.listener_buffer_size
 
-        listener = WebSocketListener(buffer_size)
+        if self._ring is not None:
+            listener = RingListener(self._ring)
+        else:
+            listener = WebSocketListener(buffer_size)
 
         with self._listeners_lock:
             # 检查监听器数量限制
@@ -766,6 +1089,7 @@ class AsyncWebSocketClient:
         Raises:
             ListenerEvictedError: 监听器不存在时抛出
             ListenerClosedError: 监听器已关闭时抛出
+            ListenerLaggedError: Ring 后端下消费过慢导致消息丢失时抛出
             asyncio.TimeoutError: 超时时抛出
         """
         with self._listeners_lock:
@@ -797,13 +1121,18 @@ class AsyncWebSocketClient:
 
         return listener.get_nowait()
 
-    async def send(self, message: Union[str, bytes, Dict]) -> None:
+    async def send(
+        self,
+        message: Union[str, bytes, Dict],
+        priority: SendPriority = SendPriority.Normal,
+    ) -> None:
         """发送消息到 WebSocket 服务器
 
-        消息会被放入发送队列，由后台任务异步发送。
+        消息会被放入对应优先级的发送队列，由后台任务异步发送，高优先级先出队。
 
         Args:
             message: 要发送的消息，支持字符串、字节或字典
+            priority: 发送优先级，默认 Normal
 
         Raises:
             ConnectionError: 客户端未运行时抛出
@@ -812,11 +1141,31 @@ class AsyncWebSocketClient:
         if not self._running:
             raise ConnectionError("Client not running")
 
-        try:
-            self._send_queue.put_nowait(message)
-        except QueueFull:
+        if self._send_pending >= self.config.send_queue_size:
             raise WebSocketError("Send queue is full")
 
+        self._send_lanes[SendPriority(priority)].append((message, time.monotonic()))
+        self._send_pending += 1
+        self._send_ready.set()
+
+    def _pop_send(self) -> Tuple[SendPriority, Any, float]:
+        """按优先级取出一条待发送消息，调用方需保证队列非空
+
+        Returns:
+            Tuple[SendPriority, Any, float]: 优先级、消息和入队时间
+        """
+        for priority, lane in self._send_lanes.items():
+            if lane:
+                message, enqueued_at = lane.popleft()
+                self._send_pending -= 1
+                return priority, message, enqueued_at
+        raise IndexError("Send queue is empty")
+
+    def _requeue_send(self, priority: SendPriority, message: Any, enqueued_at: float) -> None:
+        """发送失败时将消息放回所在队列的队首，保持发送顺序"""
+        self._send_lanes[priority].appendleft((message, enqueued_at))
+        self._send_pending += 1
+
     async def _evict_oldest_listener(self) -> None:
         """淘汰最旧的监听器
 
@@ -843,12 +1192,17 @@ class AsyncWebSocketClient:
     async def _broadcast_message(self, message: Any, msg_type: MessageType) -> None:
         """广播消息到所有监听器
 
-        如果某个监听器队列满，该监听器会被自动移除。
+        Queue 后端下如果某个监听器队列满，该监听器会被自动移除；
+        Ring 后端下只写入共享环形缓冲区一次，由监听器各自按游标读取。
 
         Args:
             message: 消息内容
             msg_type: 消息类型
         """
+        if self._ring is not None:
+            self._ring.append((message, msg_type))
+            return
+
         listeners_to_remove = []
 
         with self._listeners_lock:
@@ -874,14 +1228,38 @@ class AsyncWebSocketClient:
         reconnection_state = self.reconnection.get_state()
 
         with self._listeners_lock:
-            active_listeners = len(self._listeners)
+            listeners = list(self._listeners.values())
+
+        listener_metrics = {
+            "active": len(listeners),
+            "max": self.config.max_listeners,
+            "backend": self.config.listener_backend.value,
+        }
+        if self._ring is not None:
+            listener_metrics["ring_size"] = self._ring.capacity
+            listener_metrics["ring_seq"] = self._ring.seq
+            listener_metrics["lagged"] = sum(listener.lagged for listener in listeners)
+            listener_metrics["max_pending"] = max((listener.pending for listener in listeners), default = 0)
+
+        sent = self._send_metrics["sent"]
+        send_metrics = {
+            "depth": self._send_pending,
+            "size": self.config.send_queue_size,
+            "lanes": {priority.value: len(lane) for priority, lane in self._send_lanes.items()},
+            "sent": sent,
+            "wait_avg_ms": self._send_metrics["wait_total"] / sent * 1000 if sent else 0.0,
+            "wait_max_ms": self._send_metrics["wait_max"] * 1000,
+            "wait_last_ms": self._send_metrics["wait_last"] * 1000,
+        }
 
         return {
             "connection": connection_metrics,
             "reconnection": reconnection_state,
-            "listeners": {
-                "active": active_listeners,
-                "max": self.config.max_listeners,
+            "listeners": listener_metrics,
+            "send_queue": send_metrics,
+            "codec": {
+                "name": self.codec.name if self.codec else None,
+                **self._codec_metrics,
             },
             "running": self._running,
         }
@@ -899,20 +1277,23 @@ class AsyncWebSocketClient:
             while self._running:
                 # 处理连接状态
                 if not self.connection.is_connected():
+                    self._connected.clear()
                     await self._handle_disconnected()
                     continue
+                self._connected.set()
 
                 # 并行处理发送和接收
                 send_task = asyncio.create_task(self._process_send_queue())
                 recv_task = asyncio.create_task(self._process_receive())
 
-                done, pending = await asyncio.wait(
-                    [send_task, recv_task], return_when = asyncio.FIRST_COMPLETED
-                )
-
-                # 取消未完成的任务
-                for task in pending:
-                    task.cancel()
+                try:
+                    done, _ = await asyncio.wait(
+                        [send_task, recv_task], return_when = asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    # 取消未完成的任务（主任务被取消时两者都未完成，发送任务会一直等待新消息）
+                    send_task.cancel()
+                    recv_task.cancel()
 
                 # 处理异常
                 for task in done:
@@ -924,6 +1305,7 @@ class AsyncWebSocketClient:
         except Exception as e:
             self.logger.error(f"Main loop error: {e}")
         finally:
+            self._connected.clear()
             await self.stop()
             self.logger.debug("Main loop ended")
 
@@ -954,34 +1336,70 @@ class AsyncWebSocketClient:
     async def _process_send_queue(self) -> None:
         """处理发送队列
 
-        持续从队列取出消息并发送，处理连接中断时的消息回退。
+        阻塞等待连接建立及队列中出现消息，随后按优先级一次性发出所有待发送消息，
+        处理连接中断时的消息回退。
         """
         while self._running:
-            if not self.connection.is_connected():
-                await asyncio.sleep(0.1)
-                continue
-            try:
-                message = await asyncio.wait_for(self._send_queue.get(), timeout = 0.1)
-            except asyncio.TimeoutError:
+            await self._connected.wait()
+            if not self._send_pending:
+                self._send_ready.clear()
+                await self._send_ready.wait()
                 continue
 
-            try:
-                await self.connection.send(message)
-            except asyncio.CancelledError:
-                # 将消息放回队列并重新抛出
-                await self._send_queue.put(message)
-                raise
-            except ConnectionError:
-                # 连接不可用，将消息重新入队并退出，触发重连
-                await self._send_queue.put(message)
-                break
-            except Exception as e:
-                self.logger.error(f"Send processing error: {e}")
-            finally:
+            # 一次性发出队列中的所有消息，每条都重新按优先级选取
+            while self._send_pending:
+                priority, message, enqueued_at = self._pop_send()
+                waited = time.monotonic() - enqueued_at
                 try:
-                    self._send_queue.task_done()
-                except Exception:
-                    pass
+                    await self.connection.send(message)
+                except asyncio.CancelledError:
+                    # 将消息放回队列并重新抛出
+                    self._requeue_send(priority, message, enqueued_at)
+                    raise
+                except ConnectionError:
+                    # 连接不可用，将消息重新入队并退出，触发重连
+                    self._requeue_send(priority, message, enqueued_at)
+                    self._connected.clear()
+                    return
+                except Exception as e:
+                    self.logger.error(f"Send processing error: {e}")
+                    continue
+
+                self._send_metrics["sent"] += 1
+                self._send_metrics["wait_total"] += waited
+                self._send_metrics["wait_last"] = waited
+                if waited > self._send_metrics["wait_max"]:
+                    self._send_metrics["wait_max"] = waited
+
+    def _decode_message(self, message: str) -> Tuple[Any, MessageType]:
+        """解码文本消息，失败时原样返回
+
+        Args:
+            message: 文本消息
+
+        Returns:
+            Tuple[Any, MessageType]: 解析结果和 Json 类型，失败时为原文本和 Text 类型
+        """
+        try:
+            decoded = self.codec.loads(message)
+        except ValueError as e:
+            self._codec_metrics["decode_errors"] += 1
+            self.logger.error(f"Decode error: {e}")
+            return message, MessageType.Text
+        self._codec_metrics["decoded"] += 1
+        return decoded, MessageType.Json
+
+    def _intercept(self, message: Any, msg_type: MessageType) -> bool:
+        """调用接收拦截器，拦截器出错时按未消费处理
+
+        Returns:
+            bool: 消息已被拦截器消费返回 True
+        """
+        try:
+            return bool(self._interceptor(message, msg_type))
+        except Exception as e:
+            self.logger.error(f"Interceptor error: {e}")
+            return False
 
     async def _process_receive(self) -> None:
         """处理接收消息
@@ -990,11 +1408,18 @@ class AsyncWebSocketClient:
         """
         while self._running:
             if not self.connection.is_connected():
-                await asyncio.sleep(0.1)
-                continue
+                # 连接已断开，退出以便主循环处理重连
+                self._connected.clear()
+                break
             try:
                 message, msg_type = await self.connection.receive()
 
+                if msg_type == MessageType.Text and self.codec is not None:
+                    message, msg_type = self._decode_message(message)
+
+                if self._interceptor is not None and self._intercept(message, msg_type):
+                    continue
+
                 # 广播消息到所有监听器
                 await self._broadcast_message(message, msg_type)
 
@@ -1006,6 +1431,7 @@ class AsyncWebSocketClient:
             except Exception as e:
                 self.logger.error(f"Receive processing error: {e}")
                 # 接收错误通常意味着连接问题，关闭连接触发重连
+                self._connected.clear()
                 try:
                     await self.connection.close()
                 except Exception: